@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+CURIE Expansion Micro-Benchmark
+
+Replays every CURIE expansion the graph loader performs for one video
+(node ids, types, property keys and values, statement parts) against:
+
+- before: the previous per-call algorithm, which re-inspects the raw
+  ``@context`` dict on every expansion
+- after:  ``jsonld_context.CompiledContext`` - the context compiled once,
+  expansions memoized
+
+By default the video with the largest ``json_ld`` document in the corpus is
+used (``$bsonSize``, MongoDB 4.4+); ``--file`` benchmarks a JSON-LD file
+instead.  Both variants must produce identical output.
+
+Requirements:
+- pymongo (unless --file is used)
+- python-dotenv (optional, for environment variables)
+
+Usage:
+    python benchmark_curie_expansion.py [--database parliamentary_graph] [--video-id ID | --file graph.jsonld] [--repeat 5]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from typing import Any, Dict, List, Tuple
+
+from jsonld_context import CompiledContext
+
+
+def legacy_expand_curie(curie: str, context: Dict[str, Any]) -> str:
+    """Previous MongoDBGraphLoader.expand_curie."""
+    if not curie or not isinstance(curie, str):
+        return curie
+    if curie.startswith(("http://", "https://")):
+        return curie
+    if curie.startswith("_:"):
+        return curie
+    if ":" in curie:
+        prefix, local_part = curie.split(":", 1)
+        if prefix in context:
+            base_iri = context[prefix]
+            if isinstance(base_iri, str):
+                return base_iri + local_part
+            elif isinstance(base_iri, dict):
+                if "@id" in base_iri:
+                    return base_iri["@id"] + local_part
+    return curie
+
+
+def legacy_expand_value(value: Any, context: Dict[str, Any]) -> Any:
+    """Previous MongoDBGraphLoader.expand_value_recursively."""
+    if isinstance(value, str):
+        return legacy_expand_curie(value, context)
+    elif isinstance(value, dict):
+        if "@id" in value:
+            result = dict(value)
+            result["@id"] = legacy_expand_curie(value["@id"], context)
+            return result
+        return {k: legacy_expand_value(v, context) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [legacy_expand_value(item, context) for item in value]
+    return value
+
+
+def expansion_workload(json_ld: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+    """CURIEs and property values the loader expands for this document, in loader order."""
+    curies, values = [], []
+    for item in json_ld.get("@graph", []):
+        if "@id" in item:
+            curies.append(item["@id"])
+        types = item.get("@type", [])
+        curies.extend(types if isinstance(types, list) else [types])
+        for key, value in item.items():
+            if not key.startswith("@"):
+                curies.append(key)
+                values.append(value)
+    return curies, values
+
+
+def run_legacy(context: Dict[str, Any], curies: List[str], values: List[Any]) -> List[Any]:
+    return [legacy_expand_curie(c, context) for c in curies] + [legacy_expand_value(v, context) for v in values]
+
+
+def run_compiled(context: Dict[str, Any], curies: List[str], values: List[Any]) -> List[Any]:
+    # Compilation is part of the measured time: the loader compiles once per video
+    compiled = CompiledContext(context)
+    return [compiled.expand(c) for c in curies] + [compiled.expand_value(v) for v in values]
+
+
+def load_largest_jsonld(database: str, video_id: str = None) -> Tuple[str, Dict[str, Any]]:
+    try:
+        from pymongo import MongoClient
+        from dotenv import load_dotenv
+    except ImportError as e:
+        print(f"Missing required package: {e}")
+        print("pip install pymongo python-dotenv")
+        sys.exit(1)
+
+    load_dotenv()
+    connection_string = os.getenv('MONGODB_CONNECTION_STRING')
+    if not connection_string:
+        print("Configuration error: MONGODB_CONNECTION_STRING environment variable not set")
+        sys.exit(1)
+
+    client = MongoClient(connection_string)
+    try:
+        videos = client[database].videos
+        if not video_id:
+            largest = list(videos.aggregate([
+                {"$match": {"json_ld": {"$exists": True}}},
+                {"$project": {"_id": 0, "video_id": 1, "size": {"$bsonSize": "$json_ld"}}},
+                {"$sort": {"size": -1}},
+                {"$limit": 1}
+            ]))
+            if not largest:
+                print("No videos with json_ld found")
+                sys.exit(1)
+            video_id = largest[0]["video_id"]
+            print(f"📦 Largest json_ld: {video_id} ({largest[0]['size'] / 1024:.1f} KiB)")
+        doc = videos.find_one({"video_id": video_id}, {"json_ld": 1})
+        if not doc or not doc.get("json_ld"):
+            print(f"No json_ld found for video {video_id}")
+            sys.exit(1)
+        return video_id, doc["json_ld"]
+    finally:
+        client.close()
+
+
+def main():
+    """Main function to run the script."""
+    parser = argparse.ArgumentParser(description="Benchmark CURIE expansion on a video's JSON-LD")
+    parser.add_argument("--database", default="parliamentary_graph", help="MongoDB database name")
+    parser.add_argument("--video-id", help="Benchmark this video instead of the largest one")
+    parser.add_argument("--file", help="Benchmark a JSON-LD file instead of reading from MongoDB")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant")
+
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            source, json_ld = args.file, json.load(f)
+    else:
+        source, json_ld = load_largest_jsonld(args.database, args.video_id)
+
+    context = json_ld.get("@context", {})
+    if not isinstance(context, dict):
+        context = {}
+    curies, values = expansion_workload(json_ld)
+    print(f"🔗 {source}: {len(json_ld.get('@graph', []))} graph items, "
+          f"{len(curies)} CURIEs + {len(values)} property values, {len(context)} context terms")
+
+    if run_legacy(context, curies, values) != run_compiled(context, curies, values):
+        print("❌ Compiled expansion differs from the previous implementation")
+        sys.exit(1)
+
+    results = {}
+    for name, variant in (("before", run_legacy), ("after", run_compiled)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            variant(context, curies, values)
+            timings.append(time.perf_counter() - start)
+        results[name] = statistics.median(timings)
+
+    expansions = len(curies) + len(values)
+    print(f"\n📊 CURIE expansion (median of {args.repeat} runs)")
+    for name, seconds in results.items():
+        print(f"  {name:<7} {seconds * 1000:8.1f} ms   {expansions / seconds:12,.0f} expansions/sec")
+    print(f"\n  ✅ Identical output, {results['before'] / results['after']:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
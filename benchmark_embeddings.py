@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Embedding Backend Parity and Throughput Check
+
+Re-encodes a random sample of nodes with the selected embedding backend and
+compares the result with the 384-d ``embedding`` already stored on each
+node (computed by the graph loader from ``searchable_text``).  The check
+fails if any pair's cosine similarity drops below ``--threshold``, so a
+deployment can switch to the ONNX or int8 backend without re-embedding the
+corpus.
+
+Also reports encode throughput and the process's peak RSS; run once per
+backend to compare them (each run loads a single backend).
+
+Requirements:
+- pymongo
+- python-dotenv (optional, for environment variables)
+- the selected backend's packages (see embedding_backend.py)
+
+Usage:
+    python benchmark_embeddings.py --backend onnx-int8 [--database parliamentary_graph] [--samples 500] [--threshold 0.97]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import resource
+
+try:
+    from pymongo import MongoClient
+    from pymongo.errors import ConnectionFailure
+    from dotenv import load_dotenv
+except ImportError as e:
+    print(f"Missing required package: {e}")
+    print("Please install required packages:")
+    print("pip install pymongo python-dotenv")
+    sys.exit(1)
+
+from embedding_backend import BACKENDS, EMBEDDING_BACKEND, EMBEDDING_MODEL, check_parity, load_embedding_backend
+
+# Load environment variables
+load_dotenv()
+
+
+def sample_nodes(db, samples: int):
+    """Random nodes with stored embeddings; texts are cleaned the way the loader cleans them."""
+    texts, vectors = [], []
+    for doc in db.nodes.aggregate([
+        {"$match": {"embedding": {"$exists": True}, "searchable_text": {"$exists": True}}},
+        {"$sample": {"size": samples}},
+        {"$project": {"_id": 0, "searchable_text": 1, "embedding": 1}}
+    ]):
+        text = re.sub(r'\s+', ' ', doc["searchable_text"]).strip()
+        if len(text) >= 3:
+            texts.append(text)
+            vectors.append(doc["embedding"])
+    return texts, vectors
+
+
+def main():
+    """Main function to run the script."""
+    parser = argparse.ArgumentParser(description="Check embedding backend parity with stored node vectors")
+    parser.add_argument("--database", default="parliamentary_graph", help="MongoDB database name")
+    parser.add_argument("--backend", default=EMBEDDING_BACKEND, choices=BACKENDS, help="Backend to check")
+    parser.add_argument("--model", default=EMBEDDING_MODEL, help="Model name or local directory")
+    parser.add_argument("--samples", type=int, default=500, help="Number of nodes to re-encode")
+    parser.add_argument("--threshold", type=float, default=0.97, help="Minimum cosine similarity per node")
+    parser.add_argument("--batch-size", type=int, default=32, help="Texts per encode call")
+
+    args = parser.parse_args()
+
+    connection_string = os.getenv('MONGODB_CONNECTION_STRING')
+    if not connection_string:
+        print("Configuration error: MONGODB_CONNECTION_STRING environment variable not set")
+        sys.exit(1)
+
+    try:
+        client = MongoClient(connection_string)
+        client.admin.command('ping')
+    except ConnectionFailure as e:
+        print(f"Error: Failed to connect to MongoDB: {e}")
+        sys.exit(1)
+
+    try:
+        texts, vectors = sample_nodes(client[args.database], args.samples)
+        if not texts:
+            print("No nodes with stored embeddings found")
+            sys.exit(1)
+        print(f"🎲 Sampled {len(texts)} nodes with stored embeddings")
+
+        start = time.perf_counter()
+        model = load_embedding_backend(args.backend, args.model)
+        load_seconds = time.perf_counter() - start
+        print(f"🔄 Loaded {model.describe()} in {load_seconds:.1f}s")
+
+        # Warm-up so one-time graph optimization isn't counted as throughput
+        model.encode(texts[:args.batch_size], batch_size=args.batch_size)
+
+        start = time.perf_counter()
+        report = check_parity(model, texts, vectors, threshold=args.threshold, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+
+        report["texts_per_second"] = round(len(texts) / elapsed, 1)
+        report["load_seconds"] = round(load_seconds, 2)
+        # ru_maxrss is KiB on Linux
+        report["peak_rss_mib"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+        print(f"\n📊 {args.backend} vs stored vectors")
+        print(json.dumps(report, indent=2))
+        if report["passed"]:
+            print(f"\n  ✅ Parity OK (min cosine {report['min_cosine']} >= {args.threshold})")
+        else:
+            print(f"\n  ❌ Parity check failed")
+            sys.exit(2)
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Subgraph Retrieval Benchmark
+
+Compares the MCP server's subgraph fetch before and after projection pruning:
+
+- before: node ``find`` with an exclusion projection, then a sequential
+  ``edges.find`` returning full edge documents
+- after:  ``EnhancedGraphQuerier.subgraph_queries`` - inclusion-projected node
+  ``find`` and a grouped edge aggregation, issued concurrently
+
+URI sets are built like the search tools do: random seed nodes expanded by
+``--hops`` with the server-side edge query traversal.  Bytes are the raw BSON size of
+every returned document (reply payload, excluding wire headers).
+
+Requirements:
+- pymongo
+- python-dotenv (optional, for environment variables)
+- the MCP server's dependencies (main.py is imported for the query builders)
+
+Usage:
+    python benchmark_subgraph.py --database parliamentary_graph [--samples 20] [--seeds 5] [--hops 1] [--repeat 5]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
+
+try:
+    from bson.codec_options import CodecOptions
+    from bson.raw_bson import RawBSONDocument
+    from pymongo import MongoClient
+    from pymongo.errors import ConnectionFailure
+    from dotenv import load_dotenv
+except ImportError as e:
+    print(f"Missing required package: {e}")
+    print("Please install required packages:")
+    print("pip install pymongo python-dotenv")
+    sys.exit(1)
+
+from graph_traversal import EdgeQueryTraversal, DEFAULT_HOP_FANOUT, DEFAULT_MAX_NODES
+from main import EnhancedGraphQuerier
+
+# Load environment variables
+load_dotenv()
+
+RAW = CodecOptions(document_class=RawBSONDocument)
+
+
+def legacy_subgraph(nodes, edges, uris: Set[str]) -> Tuple[int, int]:
+    """Previous get_subgraph queries; returns (documents, bytes)."""
+    if len(uris) > 500:
+        uris = set(list(uris)[:500])
+    node_docs = list(nodes.find(
+        {"uri": {"$in": list(uris)}},
+        {
+            "embedding": 0,
+            "pagerank_score": 0,
+            "pagerank_rank": 0,
+            "similarity_score": 0,
+            "hybrid_score": 0,
+            "source_video": 0,
+            "video_title": 0
+        }
+    ))
+    edge_docs = list(edges.find({
+        "subject": {"$in": list(uris)},
+        "object": {"$in": list(uris)},
+        "predicate": {"$ne": "http://schema.org/name"}
+    }))
+    docs = node_docs + edge_docs
+    return len(docs), sum(len(doc.raw) for doc in docs)
+
+
+def pruned_subgraph(nodes, edges, uris: Set[str], pool: ThreadPoolExecutor) -> Tuple[int, int]:
+    """Current get_subgraph queries; returns (documents, bytes)."""
+    node_query, edge_pipeline = EnhancedGraphQuerier.subgraph_queries(uris)
+    edges_future = pool.submit(lambda: list(edges.aggregate(edge_pipeline)))
+    node_docs = list(nodes.find(*node_query))
+    docs = node_docs + edges_future.result()
+    return len(docs), sum(len(doc.raw) for doc in docs)
+
+
+def sample_uri_sets(db, samples: int, seeds: int, hops: int) -> List[Set[str]]:
+    """Random seed sets expanded the way the search tools expand them."""
+    traversal = EdgeQueryTraversal(db.nodes, db.edges)
+    uri_sets = []
+    for _ in range(samples):
+        seed_uris = {doc["uri"] for doc in db.nodes.aggregate([
+            {"$sample": {"size": seeds}},
+            {"$project": {"_id": 0, "uri": 1}}
+        ])}
+        uri_sets.append(traversal.expand(seed_uris, hops, DEFAULT_HOP_FANOUT, DEFAULT_MAX_NODES))
+    return uri_sets
+
+
+def summarize(name: str, latencies: List[float], documents: int, transferred: int, runs: int):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"  {name:<7} median {statistics.median(latencies) * 1000:8.1f} ms   "
+          f"p95 {p95 * 1000:8.1f} ms   "
+          f"{documents / runs:8.1f} docs   {transferred / runs / 1024:9.1f} KiB per call")
+
+
+def main():
+    """Main function to run the script."""
+    parser = argparse.ArgumentParser(description="Benchmark subgraph retrieval bytes and latency")
+    parser.add_argument("--database", default="parliamentary_graph", help="MongoDB database name")
+    parser.add_argument("--samples", type=int, default=20, help="Number of random URI sets")
+    parser.add_argument("--seeds", type=int, default=5, help="Seed nodes per URI set")
+    parser.add_argument("--hops", type=int, default=1, help="Hops to expand each seed set")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per URI set and variant")
+
+    args = parser.parse_args()
+
+    connection_string = os.getenv('MONGODB_CONNECTION_STRING')
+    if not connection_string:
+        print("Configuration error: MONGODB_CONNECTION_STRING environment variable not set")
+        sys.exit(1)
+
+    try:
+        client = MongoClient(connection_string)
+        client.admin.command('ping')
+    except ConnectionFailure as e:
+        print(f"Error: Failed to connect to MongoDB: {e}")
+        sys.exit(1)
+
+    try:
+        db = client[args.database]
+        nodes = db.get_collection("nodes", codec_options=RAW)
+        edges = db.get_collection("edges", codec_options=RAW)
+
+        print(f"🎲 Sampling {args.samples} URI sets ({args.seeds} seeds, {args.hops} hop(s))...")
+        uri_sets = sample_uri_sets(db, args.samples, args.seeds, args.hops)
+        print(f"  📦 Average set size: {statistics.mean(len(u) for u in uri_sets):.1f} URIs")
+
+        results: Dict[str, Dict] = {
+            "before": {"latencies": [], "documents": 0, "bytes": 0},
+            "after": {"latencies": [], "documents": 0, "bytes": 0},
+        }
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            # Warm both paths once so connection setup isn't measured
+            legacy_subgraph(nodes, edges, uri_sets[0])
+            pruned_subgraph(nodes, edges, uri_sets[0], pool)
+
+            for _ in range(args.repeat):
+                for uris in uri_sets:
+                    for name in ("before", "after"):
+                        start = time.perf_counter()
+                        if name == "before":
+                            documents, transferred = legacy_subgraph(nodes, edges, uris)
+                        else:
+                            documents, transferred = pruned_subgraph(nodes, edges, uris, pool)
+                        results[name]["latencies"].append(time.perf_counter() - start)
+                        results[name]["documents"] += documents
+                        results[name]["bytes"] += transferred
+
+        runs = args.repeat * len(uri_sets)
+        print(f"\n📊 Subgraph retrieval ({runs} calls per variant)")
+        for name in ("before", "after"):
+            summarize(name, results[name]["latencies"], results[name]["documents"], results[name]["bytes"], runs)
+
+        if results["before"]["bytes"]:
+            saved = 1 - results["after"]["bytes"] / results["before"]["bytes"]
+            speedup = statistics.median(results["before"]["latencies"]) / statistics.median(results["after"]["latencies"])
+            print(f"\n  ✅ {saved:.1%} fewer bytes, {speedup:.2f}x median latency")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Batched Upsert Writer
+---------------------
+
+Accumulates ``UpdateOne(..., upsert=True)`` operations for one collection
+and flushes them as unordered ``bulk_write`` batches, replacing per-document
+``insert_one`` + ``DuplicateKeyError`` + ``update_one`` round trips.
+
+- Result counts (upserted / matched / modified) are summed over all batches
+  so callers can report added vs. updated documents as before.
+- Concurrent upserts of the same key from another loader can fail with a
+  duplicate key error (E11000); those operations are retried once, at which
+  point they match the document the other writer created.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class BulkUpsertWriter:
+    """Buffered unordered upserts into one collection."""
+
+    def __init__(self, collection, batch_size: int = 1000):
+        """
+        Initialize the writer.
+
+        Args:
+            collection: pymongo collection to write to
+            batch_size: Operations per ``bulk_write`` call
+        """
+        self.collection = collection
+        self.batch_size = max(1, batch_size)
+        self._operations: List[UpdateOne] = []
+        self.stats: Dict[str, int] = {
+            "upserted": 0, "matched": 0, "modified": 0, "batches": 0, "retried": 0, "errors": 0
+        }
+
+    def upsert(self, filter_doc: Dict[str, Any], update: Dict[str, Any]):
+        """Queue one upsert, flushing when the batch is full."""
+        self._operations.append(UpdateOne(filter_doc, update, upsert=True))
+        if len(self._operations) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all queued operations."""
+        operations, self._operations = self._operations, []
+        if operations:
+            self._write(operations, retry_duplicates=True)
+
+    def _write(self, operations: List[UpdateOne], retry_duplicates: bool):
+        self.stats["batches"] += 1
+        try:
+            result = self.collection.bulk_write(operations, ordered=False)
+            self._count(result.upserted_count, result.matched_count, result.modified_count)
+        except BulkWriteError as e:
+            details = e.details
+            self._count(details.get("nUpserted", 0), details.get("nMatched", 0), details.get("nModified", 0))
+
+            retry = []
+            for error in details.get("writeErrors", []):
+                if retry_duplicates and error.get("code") == DUPLICATE_KEY_ERROR:
+                    retry.append(operations[error["index"]])
+                else:
+                    self.stats["errors"] += 1
+                    logger.warning(f"⚠️  Bulk upsert failed on {self.collection.name}: {error.get('errmsg')}")
+            if retry:
+                self.stats["retried"] += len(retry)
+                self._write(retry, retry_duplicates=False)
+
+    def _count(self, upserted: int, matched: int, modified: int):
+        self.stats["upserted"] += upserted
+        self.stats["matched"] += matched
+        self.stats["modified"] += modified
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
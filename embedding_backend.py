@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Pluggable Sentence Embedding Backends
+-------------------------------------
+
+One interface for every component that embeds text (MCP server, graph
+loader, KG extractor, query CLI), so the runtime is picked by configuration
+instead of each script instantiating its own PyTorch ``SentenceTransformer``:
+
+- ``torch``     - sentence-transformers on PyTorch (the original vectors)
+- ``onnx``      - the same model exported to ONNX, run with ONNX Runtime
+                  (tokenization via ``tokenizers``, mean pooling and L2
+                  normalization in numpy - no torch import at all)
+- ``onnx-int8`` - the ONNX export with int8 dynamic quantization of the
+                  weights, created once next to the fp32 file
+
+All backends expose ``encode(str | List[str]) -> np.ndarray`` with the same
+shape conventions as ``SentenceTransformer.encode``, so existing call sites
+(``.encode(text).tolist()``, ``MicroBatchEncoder``) work unchanged.
+
+Configuration (environment):
+    EMBEDDING_BACKEND    torch | onnx | onnx-int8 (default torch)
+    EMBEDDING_MODEL      hub name or local directory (default all-MiniLM-L6-v2)
+    EMBEDDING_ONNX_FILE  ONNX file, absolute or relative to the model directory
+                         (default onnx/model.onnx)
+    EMBEDDING_THREADS    intra-op threads for ONNX Runtime (default: runtime's choice)
+
+Use ``benchmark_embeddings.py`` to check cosine parity against the vectors
+already stored in MongoDB before switching a deployment.
+"""
+
+import os
+import json
+import logging
+import importlib.util
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE")
+EMBEDDING_THREADS = int(os.getenv("EMBEDDING_THREADS", "0")) or None
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+DEFAULT_ONNX_FILE = os.path.join("onnx", "model.onnx")
+QUANTIZED_SUFFIX = "_int8_dynamic"
+
+# Packages each backend imports when it loads
+REQUIRED_PACKAGES = {
+    "torch": ("sentence_transformers",),
+    "onnx": ("onnxruntime", "tokenizers", "huggingface_hub"),
+    "onnx-int8": ("onnxruntime", "tokenizers", "huggingface_hub"),
+}
+INSTALL_HINTS = {
+    "torch": "pip install sentence-transformers",
+    "onnx": "pip install onnxruntime tokenizers huggingface-hub",
+    "onnx-int8": "pip install onnxruntime tokenizers huggingface-hub",
+}
+
+
+def missing_packages(backend: str = EMBEDDING_BACKEND) -> List[str]:
+    """Packages ``backend`` needs that are not installed (checked without importing them)."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown embedding backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+    return [name for name in REQUIRED_PACKAGES[backend] if importlib.util.find_spec(name) is None]
+
+
+def backend_available(backend: str = EMBEDDING_BACKEND) -> bool:
+    """True if ``backend`` is known and its packages are installed."""
+    try:
+        return not missing_packages(backend)
+    except ValueError:
+        return False
+
+
+def hub_model_id(model_name: str) -> str:
+    """Hub repository for a short model name, following sentence-transformers' convention."""
+    return model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+
+
+class EmbeddingBackend:
+    """Common interface: ``encode`` with SentenceTransformer-compatible output shapes."""
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.dimension: Optional[int] = None
+
+    def encode(self, sentences: Union[str, Sequence[str]], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """
+        Embed one text or a list of texts.
+
+        Args:
+            sentences: A single string or a list of strings
+            batch_size: Texts per forward pass
+            **kwargs: Accepted for SentenceTransformer compatibility and ignored
+
+        Returns:
+            float32 array of shape (dimension,) for a string, (n, dimension) for a list
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+
+        vectors = self._encode_batch(texts, batch_size)
+        return vectors[0] if single else vectors
+
+    def _encode_batch(self, texts: List[str], batch_size: int) -> np.ndarray:
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "model": self.model_name, "dimension": self.dimension}
+
+
+class TorchBackend(EmbeddingBackend):
+    """sentence-transformers on PyTorch."""
+
+    name = "torch"
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL, device: Optional[str] = None):
+        super().__init__(model_name)
+        from sentence_transformers import SentenceTransformer
+
+        kwargs = {}
+        if os.path.isdir(model_name):
+            # Pre-downloaded copy: never reach out to the model hub
+            kwargs["local_files_only"] = True
+        self.model = SentenceTransformer(model_name, device=device, **kwargs)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+    def _encode_batch(self, texts: List[str], batch_size: int) -> np.ndarray:
+        return self.model.encode(
+            texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False
+        ).astype(np.float32, copy=False)
+
+
+class OnnxBackend(EmbeddingBackend):
+    """ONNX Runtime inference with the model's own tokenizer, pooling and normalization settings."""
+
+    name = "onnx"
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL, onnx_file: Optional[str] = EMBEDDING_ONNX_FILE,
+                 quantize: bool = False, threads: Optional[int] = EMBEDDING_THREADS):
+        """
+        Load the ONNX export of a sentence-transformers model.
+
+        Args:
+            model_name: Hub name or local directory holding tokenizer.json and the ONNX export
+            onnx_file: ONNX file, absolute or relative to the model directory
+            quantize: Use (creating it if needed) an int8 dynamically quantized copy of the model
+            threads: ONNX Runtime intra-op threads, or None for the runtime default
+        """
+        super().__init__(model_name)
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        onnx_file = onnx_file or DEFAULT_ONNX_FILE
+        self.model_dir = self._resolve_model_dir(model_name, onnx_file)
+        onnx_path = onnx_file if os.path.isabs(onnx_file) else os.path.join(self.model_dir, onnx_file)
+        if quantize:
+            self.name = "onnx-int8"
+            onnx_path = quantized_model_path(onnx_path)
+        self.onnx_path = onnx_path
+
+        config = self._read_json("sentence_bert_config.json")
+        self.max_seq_length = int(config.get("max_seq_length", 256))
+        self.pooling = self._pooling_mode()
+        self.normalize = any(
+            module.get("type", "").endswith("Normalize") for module in self._read_json("modules.json", [])
+        )
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(self.model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.max_seq_length)
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        output_names = [o.name for o in self.session.get_outputs()]
+        self.output_name = "last_hidden_state" if "last_hidden_state" in output_names else output_names[0]
+        self.dimension = self.session.get_outputs()[output_names.index(self.output_name)].shape[-1]
+        if not isinstance(self.dimension, int):
+            self.dimension = int(self._encode_batch(["dimension probe"], 1).shape[1])
+
+    @staticmethod
+    def _resolve_model_dir(model_name: str, onnx_file: str) -> str:
+        if os.path.isdir(model_name):
+            return model_name
+        from huggingface_hub import snapshot_download
+
+        patterns = ["*.json", "*.txt"]
+        if not os.path.isabs(onnx_file):
+            patterns.append(onnx_file.replace(os.sep, "/"))
+        return snapshot_download(hub_model_id(model_name), allow_patterns=patterns)
+
+    def _read_json(self, relative_path: str, default=None):
+        path = os.path.join(self.model_dir, relative_path)
+        if not os.path.exists(path):
+            return {} if default is None else default
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _pooling_mode(self) -> str:
+        for module in self._read_json("modules.json", []):
+            if module.get("type", "").endswith("Pooling"):
+                pooling = self._read_json(os.path.join(module.get("path", "1_Pooling"), "config.json"))
+                if pooling.get("pooling_mode_cls_token"):
+                    return "cls"
+                if pooling.get("pooling_mode_max_tokens"):
+                    return "max"
+        return "mean"
+
+    def _pool(self, hidden: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        if self.pooling == "cls":
+            return hidden[:, 0]
+        weights = mask[:, :, None].astype(hidden.dtype)
+        if self.pooling == "max":
+            return np.where(weights > 0, hidden, -1e9).max(axis=1)
+        return (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+
+    def _encode_batch(self, texts: List[str], batch_size: int) -> np.ndarray:
+        # Length-sorted batches keep padding (and wasted compute) to a minimum
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            encodings = self.tokenizer.encode_batch([texts[i] for i in indices])
+            input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+            hidden = self.session.run([self.output_name], feeds)[0]
+            pooled = self._pool(hidden, attention_mask)
+            if self.normalize:
+                pooled = pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            for row, i in enumerate(indices):
+                vectors[i] = pooled[row]
+
+        return np.stack(vectors).astype(np.float32, copy=False)
+
+    def describe(self) -> Dict[str, Any]:
+        info = super().describe()
+        info.update({"onnx_file": self.onnx_path, "pooling": self.pooling, "normalize": self.normalize})
+        return info
+
+
+def quantized_model_path(onnx_path: str) -> str:
+    """Path of the int8 dynamically quantized copy of ``onnx_path``, creating it on first use."""
+    root, ext = os.path.splitext(onnx_path)
+    if root.endswith(QUANTIZED_SUFFIX):
+        return onnx_path
+    quantized = f"{root}{QUANTIZED_SUFFIX}{ext}"
+    if not os.path.exists(quantized):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logger.info(f"🔧 Quantizing {onnx_path} to int8 (one-time)")
+        quantize_dynamic(onnx_path, quantized, weight_type=QuantType.QInt8)
+    return quantized
+
+
+@lru_cache(maxsize=None)
+def load_embedding_backend(backend: str = EMBEDDING_BACKEND, model_name: str = EMBEDDING_MODEL,
+                           onnx_file: Optional[str] = EMBEDDING_ONNX_FILE) -> EmbeddingBackend:
+    """
+    Load an embedding backend (once per process and configuration).
+
+    Args:
+        backend: torch, onnx or onnx-int8
+        model_name: Hub name or local directory
+        onnx_file: ONNX file for the onnx backends (absolute or relative to the model directory)
+
+    Returns:
+        A shared EmbeddingBackend instance
+
+    Raises:
+        ValueError: Unknown backend
+        ImportError: The backend's packages are not installed
+    """
+    missing = missing_packages(backend)
+    if missing:
+        raise ImportError(f"Embedding backend '{backend}' needs {', '.join(missing)} ({INSTALL_HINTS[backend]})")
+
+    if backend == "torch":
+        model = TorchBackend(model_name)
+    else:
+        model = OnnxBackend(model_name, onnx_file=onnx_file, quantize=backend == "onnx-int8")
+    logger.info(f"✅ Embedding backend ready: {model.describe()}")
+    return model
+
+
+def cosine_agreement(candidate: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity between two (n, dimension) matrices."""
+    candidate = np.asarray(candidate, dtype=np.float32)
+    reference = np.asarray(reference, dtype=np.float32)
+    dots = np.einsum("ij,ij->i", candidate, reference)
+    norms = np.linalg.norm(candidate, axis=1) * np.linalg.norm(reference, axis=1)
+    return dots / np.clip(norms, 1e-12, None)
+
+
+def check_parity(model: EmbeddingBackend, texts: List[str], reference_vectors,
+                 threshold: float = 0.97, batch_size: int = 32) -> Dict[str, Any]:
+    """
+    Compare a backend's vectors for ``texts`` with reference vectors (e.g. the stored 384-d embeddings).
+
+    Args:
+        model: Backend under test
+        texts: Texts the reference vectors were computed from
+        reference_vectors: One reference vector per text
+        threshold: Minimum acceptable cosine similarity for every pair
+        batch_size: Texts per encode call
+
+    Returns:
+        Summary with min/mean/p5 cosine, the dimension check and ``passed``
+    """
+    reference = np.asarray(reference_vectors, dtype=np.float32)
+    vectors = model.encode(texts, batch_size=batch_size)
+    if vectors.shape != reference.shape:
+        return {"passed": False, "samples": len(texts),
+                "error": f"shape mismatch: {vectors.shape} vs reference {reference.shape}"}
+
+    cosines = cosine_agreement(vectors, reference)
+    return {
+        "passed": bool(cosines.min() >= threshold),
+        "samples": len(texts),
+        "dimension": int(vectors.shape[1]),
+        "threshold": threshold,
+        "min_cosine": round(float(cosines.min()), 6),
+        "p5_cosine": round(float(np.percentile(cosines, 5)), 6),
+        "mean_cosine": round(float(cosines.mean()), 6),
+        "below_threshold": int((cosines < threshold).sum()),
+    }
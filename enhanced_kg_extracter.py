@@ -5,18 +5,20 @@ Enhanced MongoDB Knowledge Graph Extractor with Entity Disambiguation
 Features:
 - Updated schema matching new prompt format
 - Multi-pass extraction with LLM feedback loop
-- Vector-based entity disambiguation
+- Vector-based entity disambiguation (in-memory entity resolution index)
 - Proper provenance tracking via segment IDs
+- Concurrent batch extraction (async Gemini client, rate limited, retried on 429/5xx)
+- Several videos in flight at once, sharing one LLM budget and one entity resolution worker
 
 Requirements:
 - google-genai
 - pymongo
 - python-dotenv
 - pydantic
-- sentence-transformers (for embeddings)
+- sentence-transformers, or onnxruntime + tokenizers (for embeddings, see embedding_backend.py)
 
 Usage:
-    python enhanced_kg_extractor.py --database parliamentary_graph2
+    python enhanced_kg_extractor.py --database parliamentary_graph2 [--video-concurrency 2] [--batch-concurrency 4] [--llm-concurrency 8] [--requests-per-minute 60]
 """
 
 import sys
@@ -28,23 +30,30 @@ from datetime import datetime, timezone
 from collections import defaultdict
 import hashlib
 import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from google import genai
     from google.genai import types
+    from google.genai import errors as genai_errors
     from pydantic import BaseModel, Field
     from pymongo import MongoClient
     from pymongo.errors import ConnectionFailure, BulkWriteError
     from dotenv import load_dotenv
-    from sentence_transformers import SentenceTransformer
     import numpy as np
     from json_repair import loads as json_repair_loads
 except ImportError as e:
     print(f"Missing required package: {e}")
     print("Please install required packages:")
-    print("pip install google-genai pymongo python-dotenv pydantic sentence-transformers json-repair")
+    print("pip install google-genai pymongo python-dotenv pydantic json-repair")
     sys.exit(1)
 
+from embedding_backend import load_embedding_backend
+from rate_limiter import TokenBucket, backoff_delay
+from entity_index import EntityResolutionIndex, normalize_entity_name
+
 # Load environment variables
 load_dotenv()
 
@@ -119,9 +128,23 @@ class ConnectivityValidator:
         return is_valid, list(orphaned_entities), stats
 
 class EnhancedKnowledgeGraphExtractor:
-    def __init__(self, connection_string: str = None, database_name: str = "youtube_data", api_key: str = None):
+    # Pipeline stages reported by print_stage_timings, in pipeline order
+    STAGES = ("segments", "extract", "resolve_wait", "dedup", "save")
+
+    def __init__(self, connection_string: str = None, database_name: str = "youtube_data", api_key: str = None,
+                 batch_concurrency: int = 4, requests_per_minute: float = 60, max_retries: int = 5,
+                 llm_concurrency: int = 8):
         """
         Initialize the knowledge graph extractor with MongoDB connection and cached Gemini model.
+        
+        Args:
+            connection_string: MongoDB connection string (default: MONGODB_CONNECTION_STRING)
+            database_name: MongoDB database name
+            api_key: Google API key (default: GOOGLE_API_KEY)
+            batch_concurrency: Segment batches of a video extracted at the same time
+            requests_per_minute: Gemini request budget shared by all calls of this extractor
+            max_retries: Retries per Gemini call on quota (429) and server (5xx) errors
+            llm_concurrency: Gemini calls in flight at once across all videos and batches
         """
         # Setup MongoDB connection
         if connection_string is None:
@@ -151,6 +174,7 @@ class EnhancedKnowledgeGraphExtractor:
         try:
             # Create compound indexes for faster exact matching
             self.entities.create_index([("entity_type", 1), ("entity_name", 1)])
+            self.entities.create_index([("entity_type", 1), ("normalized_name", 1)])
             self.entities.create_index([("entity_type", 1), ("name_description_embedding", 1)])
             
             # Original indexes
@@ -178,13 +202,35 @@ class EnhancedKnowledgeGraphExtractor:
         # Use the latest Gemini 2.5 Flash model
         self.model_name = "models/gemini-2.5-flash"
         
+        # Concurrency and quota for Gemini calls
+        self.batch_concurrency = max(1, batch_concurrency)
+        self.rate_limiter = TokenBucket(requests_per_minute, per=60.0)
+        self.max_retries = max_retries
+        self.llm_concurrency = max(1, llm_concurrency)
+        # One event loop for all async calls, so the async client's connections are reused across videos
+        self._loop = asyncio.new_event_loop()
+        self._llm_slots = asyncio.Semaphore(self.llm_concurrency)
+        self._prompt_cache_lock = asyncio.Lock()
+        
+        # Entity resolution (embedding, disambiguation, save) runs on a single worker: one thread uses the
+        # embedding model, and videos resolving at the same time can't both create the same canonical entity
+        self._resolver = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kg-resolve")
+        self._entity_lock = threading.Lock()
+        
+        # Existing entities for disambiguation, loaded once per run (see get_entity_index)
+        self.entity_index: Optional[EntityResolutionIndex] = None
+        
+        # Busy seconds per pipeline stage (see print_stage_timings)
+        self.stage_timings = defaultdict(float)
+        self._timings_lock = threading.Lock()
+        
         # Cache for the extraction prompt (will be created on first use)
         self.prompt_cache = None
         self.cache_ttl_hours = 24
         
         # Setup embedding model for entity disambiguation
         try:
-            self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.embedding_model = load_embedding_backend()
             self.atlas_vector_search_available = False  # Will be set in setup_vector_index
             print("✅ Embedding model loaded for entity disambiguation")
         except Exception as e:
@@ -323,6 +369,84 @@ Example: `UU2CifSWj5Q_240_0 Also commanded to lay the 2023-2030 National Policy.
             except Exception as e:
                 print(f"⚠️  Warning: Could not delete cache: {e}")
 
+    def close(self):
+        """Shut down the resolver worker, the async Gemini client and the event loop; the extractor is unusable afterwards."""
+        self._resolver.shutdown(wait=True)
+        if self._loop.is_closed():
+            return
+        try:
+            # Older google-genai releases have no aclose(); their connections go with the loop
+            aclose = getattr(self.genai_client.aio, "aclose", None)
+            if aclose is not None:
+                self._loop.run_until_complete(aclose())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        except Exception as e:
+            print(f"⚠️  Warning: Error while closing the event loop: {e}")
+        finally:
+            self._loop.close()
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Quota (429) and server-side (5xx) Gemini errors are worth retrying."""
+        code = getattr(error, "code", None)
+        return isinstance(error, genai_errors.APIError) and isinstance(code, int) and (code == 429 or code >= 500)
+
+    async def agenerate_content(self, contents: str, config: types.GenerateContentConfig):
+        """
+        Rate-limited ``generate_content`` on the async Gemini client, with jittered exponential backoff on 429/5xx.
+
+        Every Gemini call goes through here, so ``llm_concurrency`` bounds all of them.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async()
+            try:
+                async with self._llm_slots:
+                    return await self.genai_client.aio.models.generate_content(
+                        model=self.model_name, contents=contents, config=config
+                    )
+            except Exception as e:
+                if attempt == self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"      ⏳ Gemini error {e.code}, retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+
+    def run_async(self, coroutine):
+        """Run a coroutine on the extractor's event loop."""
+        return self._loop.run_until_complete(coroutine)
+
+    def call_async(self, coroutine):
+        """
+        Run a coroutine on the extractor's event loop from a worker thread (e.g. the resolver) and wait for it.
+
+        Must not be called from the loop's own thread while it is running.
+        """
+        if self._loop.is_running():
+            return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+        return self.run_async(coroutine)
+
+    async def aget_prompt_cache(self) -> str:
+        """create_or_get_prompt_cache off the event loop; concurrent videos share one cache."""
+        async with self._prompt_cache_lock:
+            return await asyncio.to_thread(self.create_or_get_prompt_cache)
+
+    def record_stage(self, stage: str, started: float):
+        """Add the time since ``started`` (time.perf_counter()) to a pipeline stage."""
+        elapsed = time.perf_counter() - started
+        with self._timings_lock:
+            self.stage_timings[stage] += elapsed
+
+    def print_stage_timings(self, wall_seconds: float, videos: int):
+        """Print busy time per pipeline stage; stages overlap across videos, so shares are of summed stage time."""
+        total = sum(self.stage_timings.values())
+        print(f"\n⏱️  Pipeline stage timings ({videos} videos, {wall_seconds:.1f}s wall clock)")
+        for stage in self.STAGES:
+            seconds = self.stage_timings.get(stage, 0.0)
+            share = (seconds / total) * 100 if total else 0
+            print(f"  {stage:<13} {seconds:9.1f}s  {share:5.1f}%")
+        if wall_seconds > 0 and videos:
+            print(f"  Throughput: {videos / wall_seconds * 3600:.1f} videos/hour")
+
     def _generate_statement_id(self, source_entity_id: str, target_entity_id: str, provenance_segment_id: str) -> str:
         """Generate a unique statement ID."""
         # Create a hash of the key components for uniqueness
@@ -354,6 +478,37 @@ Example: `UU2CifSWj5Q_240_0 Also commanded to lay the 2023-2030 National Policy.
             print(f"⚠️  Warning: Could not generate embedding: {e}")
             return None
 
+    def embed_entities(self, entities: List[Dict], batch_size: int = 64) -> int:
+        """
+        Batch-encode ``name: description`` for entities without an embedding and cache it on the entity.
+        
+        The cached ``name_description_embedding`` serves both the similarity search during
+        deduplication and the saved entity, so each entity is encoded once per video.
+        
+        Args:
+            entities: Entity dicts, updated in place
+            batch_size: Texts per encode call
+            
+        Returns:
+            Number of entities encoded
+        """
+        if not self.embedding_model:
+            return 0
+        
+        missing = [entity for entity in entities if not entity.get("name_description_embedding")]
+        if not missing:
+            return 0
+        
+        try:
+            texts = [f"{entity.get('entity_name', '')}: {entity.get('entity_description', '')}" for entity in missing]
+            embeddings = self.embedding_model.encode(texts, batch_size=batch_size)
+            for entity, embedding in zip(missing, embeddings):
+                entity["name_description_embedding"] = embedding.tolist()
+            return len(missing)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not generate embeddings: {e}")
+            return 0
+
     def setup_vector_index(self):
         """Create Atlas Vector Search index on entities collection."""
         try:
@@ -412,46 +567,8 @@ Example: `UU2CifSWj5Q_240_0 Also commanded to lay the 2023-2030 National Policy.
             raise
 
     def normalize_entity_name(self, name: str) -> str:
-        """Normalize entity name for comparison."""
-        # Convert to lowercase and strip whitespace
-        normalized = name.lower().strip()
-        
-        # Common variations mapping
-        variations = {
-            'st.': 'saint',
-            'mr.': 'mister',
-            'mrs.': 'missus', 
-            'dr.': 'doctor',
-            'prof.': 'professor',
-            'hon.': 'honourable',
-            'rt. hon.': 'right honourable',
-            'pm': 'prime minister',
-            'mp': 'member of parliament',
-            'govt': 'government',
-            'govt.': 'government',
-            'dep.': 'deputy',
-            'dept': 'department',
-            'dept.': 'department',
-            'min.': 'minister',
-            'sec.': 'secretary',
-            'rep.': 'representative',
-            'const.': 'constitution',
-            'parl.': 'parliament',
-            'comm.': 'committee',
-            'assoc.': 'association',
-            'org.': 'organization',
-            'intl': 'international',
-            'natl': 'national'
-        }
-        
-        # Apply variations
-        for abbrev, full in variations.items():
-            normalized = normalized.replace(abbrev, full)
-        
-        # Remove extra spaces
-        normalized = ' '.join(normalized.split())
-        
-        return normalized
+        """Normalize entity name for comparison (stored on entities as normalized_name)."""
+        return normalize_entity_name(name)
 
     def is_exact_match(self, entity1: Dict, entity2: Dict) -> bool:
         """Check if two entities are exact matches based on normalized names and types."""
@@ -463,42 +580,63 @@ Example: `UU2CifSWj5Q_240_0 Also commanded to lay the 2023-2030 National Policy.
         
         return name1 == name2
 
+    def get_entity_index(self) -> EntityResolutionIndex:
+        """The entity resolution index, loading it from the entities collection on first use."""
+        if self.entity_index is None:
+            self.entity_index = EntityResolutionIndex.load(self.entities)
+        return self.entity_index
+
+    def refresh_entity_index(self, entities: List[Dict], batch_size: int = 1000) -> int:
+        """
+        Add entities saved since the index was loaded (e.g. by another extractor) that share a name with ``entities``.
+        
+        One ``$in`` query per ``batch_size`` index misses on (entity_type, normalized_name),
+        instead of a round trip per missing entity.
+        
+        Returns:
+            Number of entities added to the index
+        """
+        index = self.get_entity_index()
+        misses = set()
+        for entity in entities:
+            key = (entity.get("entity_type", ""), self.normalize_entity_name(entity.get("entity_name", "")))
+            if index.find_exact(*key) is None:
+                misses.add(key)
+        
+        added = 0
+        misses = sorted(misses)
+        for start in range(0, len(misses), batch_size):
+            chunk = misses[start:start + batch_size]
+            cursor = self.entities.find(
+                {
+                    "entity_type": {"$in": sorted({entity_type for entity_type, _ in chunk})},
+                    "normalized_name": {"$in": [normalized_name for _, normalized_name in chunk]}
+                },
+                {"_id": 0, "entity_id": 1, "entity_name": 1, "entity_type": 1, "normalized_name": 1,
+                 "name_description_embedding": 1}
+            )
+            wanted = set(chunk)
+            for match in cursor:
+                key = (match.get("entity_type"), match.get("normalized_name"))
+                if key in wanted and index.find_exact(*key) is None:
+                    index.add(match)
+                    added += 1
+        return added
+
     def find_exact_match_entities(self, entity: Dict) -> List[Dict]:
-        """Find existing entities that are exact matches - optimized with indexing."""
+        """Find existing entities that are exact matches (same type and normalized_name) in the entity index."""
         try:
             entity_type = entity.get("entity_type", "")
-            entity_name = entity.get("entity_name", "")
-            
-            # Use MongoDB query with proper indexing instead of fetching all entities
-            # First, try direct name match (fastest)
-            direct_matches = list(self.entities.find({
-                "entity_type": entity_type,
-                "entity_name": entity_name
-            }).limit(5))
-            
-            if direct_matches:
-                return direct_matches
-            
-            # If no direct match, try case-insensitive regex (slower but still indexed)
-            normalized_name = self.normalize_entity_name(entity_name)
-            
-            # Create a regex pattern for the normalized name
-            escaped_name = normalized_name.replace(".", r"\.").replace("(", r"\(").replace(")", r"\)")
-            regex_pattern = f"^{escaped_name}$"
-            
-            regex_matches = list(self.entities.find({
-                "entity_type": entity_type,
-                "entity_name": {"$regex": regex_pattern, "$options": "i"}
-            }).limit(5))
-            
-            return regex_matches
+            normalized_name = self.normalize_entity_name(entity.get("entity_name", ""))
+            match = self.get_entity_index().find_exact(entity_type, normalized_name)
+            return [match] if match else []
             
         except Exception as e:
             print(f"⚠️  Warning: Error in exact match search: {e}")
             return []
 
     def find_similar_entities(self, entity: Dict, similarity_threshold: float = 0.85) -> List[Dict]:
-        """Find existing entities similar to the new one using Atlas Vector Search."""
+        """Find existing entities similar to the new one using the in-memory entity index."""
         if not self.embedding_model:
             return []
         
@@ -507,60 +645,18 @@ Example: `UU2CifSWj5Q_240_0 Also commanded to lay the 2023-2030 National Policy.
             entity_description = entity.get("entity_description", "")
             entity_type = entity.get("entity_type", "")
             
-            # Generate embedding for the new entity
-            new_embedding = self.generate_entity_embedding(entity_name, entity_description)
+            # Embedding cached by embed_entities, or generated for the new entity
+            new_embedding = entity.get("name_description_embedding") or \
+                self.generate_entity_embedding(entity_name, entity_description)
             if not new_embedding:
                 return []
             
-            # Use Atlas Vector Search
-            return self._atlas_vector_search(entity_type, new_embedding, similarity_threshold)
+            return self.get_entity_index().find_similar(entity_type, new_embedding, similarity_threshold)
                 
         except Exception as e:
             print(f"⚠️  Warning: Error in similarity search: {e}")
             return []
 
-    def _atlas_vector_search(self, entity_type: str, new_embedding: List[float], similarity_threshold: float) -> List[Dict]:
-        """Fast Atlas Vector Search implementation."""
-        try:
-            # Atlas Vector Search aggregation pipeline
-            pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": "entity_vector_index",
-                        "path": "name_description_embedding",
-                        "queryVector": new_embedding,
-                        "numCandidates": 100,
-                        "limit": 10,
-                        "filter": {
-                            "entity_type": {"$eq": entity_type}
-                        }
-                    }
-                },
-                {
-                    "$addFields": {
-                        "similarity_score": {"$meta": "vectorSearchScore"}
-                    }
-                },
-                {
-                    "$match": {
-                        "similarity_score": {"$gte": similarity_threshold}
-                    }
-                }
-            ]
-            
-            # Execute the vector search
-            results = list(self.entities.aggregate(pipeline))
-            
-            # Sort by similarity score descending (already sorted by Atlas but ensure)
-            results.sort(key=lambda x: x.get("similarity_score", 0), reverse=True)
-            
-            return results[:5]  # Return top 5
-            
-        except Exception as e:
-            print(f"⚠️  Warning: Atlas Vector Search failed: {e}")
-            return []
-
-
     def fetch_entity_subgraph(self, entity_id: str) -> Dict:
         """Fetch entity and its immediate relationships + 1-hop entities - optimized."""
         try:
@@ -609,7 +705,7 @@ Example: `UU2CifSWj5Q_240_0 Also commanded to lay the 2023-2030 National Policy.
                 print(f"      ⚠️  Invalid existing subgraph for comparison")
                 return False
             
-            cache_name = self.create_or_get_prompt_cache()
+            cache_name = self.call_async(self.aget_prompt_cache())
             
             # Create comparison prompt
             prompt = f"""**ENTITY DISAMBIGUATION TASK**
@@ -649,14 +745,14 @@ I need you to determine if these two entities represent the same real-world enti
 
 **OUTPUT**: Respond with only "YES" or "NO" (no explanation needed)."""
 
-            response = self.genai_client.models.generate_content(
-                model=self.model_name,
+            # On the extractor loop, so the call shares the rate limiter and the llm_concurrency slots
+            response = self.call_async(self.agenerate_content(
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     cached_content=cache_name,
                     thinking_config=types.ThinkingConfig(thinking_budget=0)
                 )
-            )
+            ))
             
             result = response.text.strip().upper()
             return result == "YES"
@@ -684,11 +780,27 @@ I need you to determine if these two entities represent the same real-world enti
         if intra_batch_reduction > 0:
             print(f"      📊 Intra-batch deduplication: removed {intra_batch_reduction} duplicate entity_ids")
         
+        # Pick up entities other extractors saved since the index was loaded, in one query for all misses
+        try:
+            refresh_start = time.time()
+            refreshed = self.refresh_entity_index(unique_entities)
+            if refreshed:
+                print(f"      📇 Added {refreshed} recently saved entities to the index ({time.time() - refresh_start:.3f}s)")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not refresh entity index: {e}")
+        
+        # One batched embedding pass for the whole video (reused by bulk_save_knowledge_graph)
+        if self.embedding_model:
+            embed_start = time.time()
+            encoded = self.embed_entities(unique_entities)
+            print(f"      🧮 Embedded {encoded} entities in one batched pass ({time.time() - embed_start:.3f}s)")
+        
         # Step 2: Now do inter-batch entity disambiguation 
         # (same entity across batches but with different entity_ids)
         print(f"      🔍 Inter-batch disambiguation of {len(unique_entities)} unique entities...")
         
         final_entities = []
+        final_entities_by_name = {}  # (entity_type, normalized_name) -> first new entity of this video
         entity_mappings = {}  # old_entity_id -> canonical_entity_id
         
         # Statistics for optimization tracking
@@ -765,22 +877,19 @@ I need you to determine if these two entities represent the same real-world enti
                     print(f"⚠️  Warning: Error in similarity search: {e}")
             
             # Step 2c: If no match with DB, check against other entities in this video's final list
+            name_key = (entity.get("entity_type"), self.normalize_entity_name(entity.get("entity_name", "")))
             if not merged:
-                for existing_final_entity in final_entities:
-                    try:
-                        if self.is_exact_match(entity, existing_final_entity):
-                            print(f"        🎯 Exact match within video: '{entity['entity_name']}' → '{existing_final_entity['entity_name']}'")
-                            entity_mappings[original_entity_id] = existing_final_entity["entity_id"]
-                            exact_matches += 1
-                            merged = True
-                            break
-                    except Exception as e:
-                        print(f"⚠️  Warning: Error in intra-video comparison: {e}")
-                        continue
+                existing_final_entity = final_entities_by_name.get(name_key)
+                if existing_final_entity is not None:
+                    print(f"        🎯 Exact match within video: '{entity['entity_name']}' → '{existing_final_entity['entity_name']}'")
+                    entity_mappings[original_entity_id] = existing_final_entity["entity_id"]
+                    exact_matches += 1
+                    merged = True
             
             if not merged:
                 # No matches found, keep as new entity
                 final_entities.append(entity)
+                final_entities_by_name[name_key] = entity
             
             entity_time = time.time() - entity_start
             if entity_time > 2.0:  # Log slow entities
@@ -994,10 +1103,9 @@ I need you to determine if these two entities represent the same real-world enti
             # Return original data if disambiguation fails completely
             return batch_entities, batch_statements
 
-    def _extract_initial_kg(self, transcript_text: str, video_id: str, video_title: str, video_url: str) -> Dict[str, Any]:
+    async def _extract_initial_kg(self, transcript_text: str, video_id: str, video_title: str, video_url: str,
+                                  cache_name: str) -> Dict[str, Any]:
         """Initial knowledge graph extraction."""
-        cache_name = self.create_or_get_prompt_cache()
-        
         user_prompt = f"""**Video Context:**
 - Video ID: {video_id}
 - Video Title: {video_title}
@@ -1010,8 +1118,7 @@ Please extract entities and statements from the processing segments only. You ma
 
 Remember: Every entity must be connected through at least one statement!"""
 
-        response = self.genai_client.models.generate_content(
-            model=self.model_name,
+        response = await self.agenerate_content(
             contents=user_prompt,
             config=types.GenerateContentConfig(
                 cached_content=cache_name,
@@ -1028,10 +1135,9 @@ Remember: Every entity must be connected through at least one statement!"""
         
         return result
 
-    def _extract_additional_kg(self, transcript_text: str, current_result: Dict[str, Any], video_id: str) -> Dict[str, Any]:
+    async def _extract_additional_kg(self, transcript_text: str, current_result: Dict[str, Any], video_id: str,
+                                     cache_name: str) -> Dict[str, Any]:
         """Extract additional entities/relationships in refinement pass."""
-        cache_name = self.create_or_get_prompt_cache()
-        
         current_entities = [f"{e['entity_name']} ({e['entity_type']})" for e in current_result.get("entities", [])]
         current_statements_count = len(current_result.get("statements", []))
         
@@ -1052,8 +1158,7 @@ Remember: Every entity must be connected through at least one statement!"""
 
 **OUTPUT**: Same JSON format as before, but include ONLY the additional entities and statements you want to add."""
 
-        response = self.genai_client.models.generate_content(
-            model=self.model_name,
+        response = await self.agenerate_content(
             contents=refinement_prompt,
             config=types.GenerateContentConfig(
                 cached_content=cache_name,
@@ -1070,10 +1175,9 @@ Remember: Every entity must be connected through at least one statement!"""
         
         return result
 
-    def _check_extraction_completeness(self, transcript_text: str, current_result: Dict[str, Any]) -> bool:
+    async def _check_extraction_completeness(self, transcript_text: str, current_result: Dict[str, Any],
+                                             cache_name: str) -> bool:
         """Ask LLM if extraction is complete."""
-        cache_name = self.create_or_get_prompt_cache()
-        
         completeness_prompt = f"""**COMPLETENESS CHECK**
 
 **CURRENT EXTRACTION SUMMARY:**
@@ -1092,8 +1196,7 @@ Consider:
 
 **RESPONSE**: Answer only "Y" (if complete) or "N" (if more extraction needed). No explanation."""
 
-        response = self.genai_client.models.generate_content(
-            model=self.model_name,
+        response = await self.agenerate_content(
             contents=completeness_prompt,
             config=types.GenerateContentConfig(
                 cached_content=cache_name,
@@ -1135,33 +1238,44 @@ Consider:
             "statements": final_statements
         }
 
-    def extract_knowledge_graph(self, transcript_text: str, video_id: str, video_title: str, video_url: str) -> Dict[str, Any]:
-        """Extract knowledge graph with multi-pass refinement loop (disambiguation moved to end)."""
-        print(f"    🔄 Starting multi-pass extraction...")
+    async def extract_knowledge_graph(self, transcript_text: str, video_id: str, video_title: str, video_url: str,
+                                      cache_name: str, label: str = "") -> Dict[str, Any]:
+        """
+        Extract knowledge graph with multi-pass refinement loop (disambiguation moved to end).
+        
+        Args:
+            transcript_text: Batch transcript (see create_batch_transcript)
+            video_id: Video ID
+            video_title: Video title
+            video_url: Video URL
+            cache_name: Prompt cache holding the extraction system instruction
+            label: Prefix for progress output (batches of a video run concurrently)
+        """
+        print(f"    {label}🔄 Starting multi-pass extraction...")
         
         # Initial extraction
-        result = self._extract_initial_kg(transcript_text, video_id, video_title, video_url)
-        print(f"    📊 Initial pass: {len(result.get('entities', []))} entities, {len(result.get('statements', []))} statements")
+        result = await self._extract_initial_kg(transcript_text, video_id, video_title, video_url, cache_name)
+        print(f"    {label}📊 Initial pass: {len(result.get('entities', []))} entities, {len(result.get('statements', []))} statements")
         
         # Multi-pass refinement loop (max 3 total attempts)
         for attempt in range(2):  # attempts 2 and 3
-            print(f"    🔄 Refinement pass {attempt + 1}/2...")
+            print(f"    {label}🔄 Refinement pass {attempt + 1}/2...")
             
             # Send "try again" message
-            additional_result = self._extract_additional_kg(transcript_text, result, video_id)
+            additional_result = await self._extract_additional_kg(transcript_text, result, video_id, cache_name)
             
             # Merge results
             result = self._merge_kg_results(result, additional_result)
-            print(f"    📊 After refinement {attempt + 1}: {len(result.get('entities', []))} entities, {len(result.get('statements', []))} statements")
+            print(f"    {label}📊 After refinement {attempt + 1}: {len(result.get('entities', []))} entities, {len(result.get('statements', []))} statements")
             
             # Ask if complete
-            is_complete = self._check_extraction_completeness(transcript_text, result)
+            is_complete = await self._check_extraction_completeness(transcript_text, result, cache_name)
             
             if is_complete:
-                print(f"    ✅ LLM satisfied with extraction after {attempt + 1} refinement passes")
+                print(f"    {label}✅ LLM satisfied with extraction after {attempt + 1} refinement passes")
                 break
             else:
-                print(f"    🔄 LLM wants to continue refining...")
+                print(f"    {label}🔄 LLM wants to continue refining...")
         
         # Validate connectivity (no disambiguation at batch level - done at video level)
         validator = ConnectivityValidator(video_id)
@@ -1169,10 +1283,10 @@ Consider:
             result.get("entities", []), result.get("statements", [])
         )
         
-        print(f"    📊 Batch connectivity: {stats['connected_entities']}/{stats['total_entities']} entities connected")
+        print(f"    {label}📊 Batch connectivity: {stats['connected_entities']}/{stats['total_entities']} entities connected")
         
         if orphaned_entities:
-            print(f"    ⚠️  Found {len(orphaned_entities)} orphaned entities in batch")
+            print(f"    {label}⚠️  Found {len(orphaned_entities)} orphaned entities in batch")
         
         return result
 
@@ -1186,17 +1300,12 @@ Consider:
             if entities:
                 print(f"        💾 Bulk saving {len(entities)} entities...")
                 
-                # Add embeddings to entities that don't have them
+                # Add embeddings to entities that don't have them (normally already cached during deduplication)
+                self.embed_entities(entities)
                 entities_with_embeddings = []
                 for entity in entities:
-                    if not entity.get("name_description_embedding"):
-                        embedding = self.generate_entity_embedding(
-                            entity.get("entity_name", ""),
-                            entity.get("entity_description", "")
-                        )
-                        if embedding:
-                            entity["name_description_embedding"] = embedding
-                    
+                    # Canonical name for indexed exact matching
+                    entity["normalized_name"] = self.normalize_entity_name(entity.get("entity_name", ""))
                     entities_with_embeddings.append(entity)
                 
                 # Use individual upserts instead of bulk_write to avoid the error
@@ -1209,6 +1318,9 @@ Consider:
                             upsert=True
                         )
                         successful_entities += 1
+                        # Later videos in this run resolve against it without reloading
+                        if self.entity_index is not None:
+                            self.entity_index.add(entity)
                     except Exception as e:
                         print(f"        ⚠️  Failed to save entity {entity.get('entity_name', 'unknown')}: {e}")
                 
@@ -1324,26 +1436,32 @@ Consider:
         
         return min(best_batch_size, max_batch_size)
 
-    def get_videos_for_processing(self) -> List[Dict[str, Any]]:
-        """Get all videos that have provenance segments but no entities extracted yet."""
+    def get_videos_for_processing(self, skip_existing: bool = True) -> List[Dict[str, Any]]:
+        """Get all videos that have provenance segments but no entities extracted yet (all of them with skip_existing=False)."""
         video_ids_with_segments = self.provenance_segments.distinct("video_id")
         print(f"Found {len(video_ids_with_segments)} videos with segments")
         
-        videos_with_entities = set(self.entities.distinct("video_id"))
-        print(f"Found {len(videos_with_entities)} videos with existing entities")
+        videos_with_entities = set()
+        if skip_existing:
+            videos_with_entities = set(self.entities.distinct("video_id"))
+            print(f"Found {len(videos_with_entities)} videos with existing entities")
         
-        videos_to_process = []
-        skipped_count = 0
+        candidate_ids = [video_id for video_id in video_ids_with_segments if video_id not in videos_with_entities]
+        skipped_count = len(video_ids_with_segments) - len(candidate_ids)
         
-        for video_id in video_ids_with_segments:
-            if video_id in videos_with_entities:
-                skipped_count += 1
-                print(f"  ⏭️  Skipping {video_id} - already has entities")
-                continue
-                
-            video_info = self.videos.find_one({"video_id": video_id})
-            if video_info:
-                videos_to_process.append(video_info)
+        # One query for all candidates instead of a find_one per video
+        videos_by_id = {
+            video["video_id"]: video
+            for video in self.videos.find(
+                {"video_id": {"$in": candidate_ids}},
+                {"video_id": 1, "title": 1, "video_url": 1}
+            )
+        }
+        
+        videos_to_process = []
+        for video_id in candidate_ids:
+            if video_id in videos_by_id:
+                videos_to_process.append(videos_by_id[video_id])
             else:
                 print(f"  ⚠️  Video {video_id} not found in videos collection")
         
@@ -1382,7 +1500,105 @@ Consider:
         
         return "\n".join(transcript_parts)
 
-    def process_video_in_batches(self, video_info: Dict[str, Any], batch_size: int = 200, overlap: int = 20, max_batch_size: int = 1000) -> bool:
+    async def extract_batches(self, batches: List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]], video_id: str,
+                              video_title: str, video_url: str, cache_name: str) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Extract knowledge graphs from a video's batches concurrently (at most batch_concurrency at a time).
+        
+        Args:
+            batches: (context_segments, process_segments) per batch, in transcript order
+            video_id: Video ID
+            video_title: Video title
+            video_url: Video URL
+            cache_name: Prompt cache holding the extraction system instruction
+            
+        Returns:
+            Tuple of (all_entities, all_statements), assembled in batch order
+        """
+        slots = asyncio.Semaphore(self.batch_concurrency)
+        num_batches = len(batches)
+        
+        async def extract_batch(batch_num: int, context_segments: List[Dict[str, Any]],
+                                process_segments: List[Dict[str, Any]]) -> Dict[str, Any]:
+            async with slots:
+                label = f"[{batch_num}/{num_batches}] "
+                print(f"      📦 Batch {batch_num}/{num_batches}: {len(process_segments)} segments")
+                transcript_text = self.create_batch_transcript(context_segments, process_segments)
+                kg_data = await self.extract_knowledge_graph(
+                    transcript_text, video_id, video_title, video_url, cache_name, label=label
+                )
+            
+            # Add batch metadata to entities and statements
+            batch_id = f"{video_id}_batch_{batch_num}"
+            for entity in kg_data.get("entities", []):
+                entity["batch_id"] = batch_id
+                entity["video_id"] = video_id
+                entity["extracted_at"] = datetime.now(timezone.utc)
+                entity["extractor_version"] = "enhanced_kg_extractor_v1.0"
+            
+            for statement in kg_data.get("statements", []):
+                statement["batch_id"] = batch_id
+                statement["extracted_at"] = datetime.now(timezone.utc)
+                statement["extractor_version"] = "enhanced_kg_extractor_v1.0"
+            
+            return kg_data
+        
+        tasks = [
+            asyncio.ensure_future(extract_batch(batch_num, context_segments, process_segments))
+            for batch_num, (context_segments, process_segments) in enumerate(batches, 1)
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # One failed batch fails the video; don't leave the others spending quota
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        # Aggregate to master lists in batch order
+        all_entities, all_statements = [], []
+        for kg_data in results:
+            all_entities.extend(kg_data.get("entities", []))
+            all_statements.extend(kg_data.get("statements", []))
+        return all_entities, all_statements
+
+    def resolve_and_save(self, all_entities: List[Dict], all_statements: List[Dict], video_id: str,
+                         queued_at: float) -> Tuple[bool, List[Dict], List[Dict]]:
+        """
+        Deduplicate a video's extracted entities against the graph and save them (runs on the resolver worker).
+        
+        Args:
+            all_entities: Entities from all batches, in batch order
+            all_statements: Statements from all batches, in batch order
+            video_id: Video ID
+            queued_at: time.perf_counter() when the video was handed to the resolver
+            
+        Returns:
+            Tuple of (saved, final_entities, final_statements)
+        """
+        self.record_stage("resolve_wait", queued_at)
+        
+        # Held from lookup to save, so no other video can create the same canonical entity in between
+        with self._entity_lock:
+            # Now deduplicate across ALL batches
+            print(f"    🔍 Starting cross-batch deduplication...")
+            started = time.perf_counter()
+            final_entities, final_statements = self.deduplicate_all_entities(all_entities, all_statements, video_id)
+            self.record_stage("dedup", started)
+            
+            print(f"    📊 After deduplication: {len(final_entities)} unique entities, {len(final_statements)} statements")
+            
+            # Bulk save to MongoDB
+            print(f"    💾 Bulk saving to MongoDB...")
+            started = time.perf_counter()
+            success = self.bulk_save_knowledge_graph(final_entities, final_statements, video_id)
+            self.record_stage("save", started)
+        
+        return success, final_entities, final_statements
+
+    async def process_video_async(self, video_info: Dict[str, Any], batch_size: int = 200, overlap: int = 20,
+                                  max_batch_size: int = 1000) -> bool:
         """Process a single video's segments in batches, aggregate all data, then deduplicate and save."""
         video_id = video_info.get("video_id", "")
         video_title = video_info.get("title", "Unknown Title")
@@ -1393,7 +1609,9 @@ Consider:
             return False
         
         try:
-            segments = self.get_segments_for_video(video_id)
+            started = time.perf_counter()
+            segments = await asyncio.to_thread(self.get_segments_for_video, video_id)
+            self.record_stage("segments", started)
             
             if not segments:
                 print("    ⚠️  No segments found for video")
@@ -1406,70 +1624,30 @@ Consider:
             
             print(f"    🎯 Optimal batch size: {optimal_batch_size} ({num_batches} batches)")
             
-            # Aggregate all entities and statements from all batches
-            all_entities = []
-            all_statements = []
-            
-            batch_num = 1
+            # Slice the segments into batches (each with its overlap context)
+            batches = []
             start_idx = 0
-            
-            print(f"    🔄 Extracting knowledge graphs from all batches...")
-            
             while start_idx < len(segments):
                 end_idx = min(start_idx + optimal_batch_size, len(segments))
-                
-                if batch_num == 1:
-                    context_segments = []
-                    process_segments = segments[start_idx:end_idx]
-                else:
-                    context_start = max(0, start_idx - overlap)
-                    context_segments = segments[context_start:start_idx]
-                    process_segments = segments[start_idx:end_idx]
-                
-                print(f"      📦 Batch {batch_num}/{num_batches}: {len(process_segments)} segments")
-                
-                transcript_text = self.create_batch_transcript(context_segments, process_segments)
-                
-                batch_id = f"{video_id}_batch_{batch_num}"
-                kg_data = self.extract_knowledge_graph(transcript_text, video_id, video_title, video_url)
-                
-                # Add batch metadata to entities and statements
-                for entity in kg_data.get("entities", []):
-                    entity["batch_id"] = batch_id
-                    entity["video_id"] = video_id
-                    entity["extracted_at"] = datetime.now(timezone.utc)
-                    entity["extractor_version"] = "enhanced_kg_extractor_v1.0"
-                
-                for statement in kg_data.get("statements", []):
-                    statement["batch_id"] = batch_id
-                    statement["extracted_at"] = datetime.now(timezone.utc)
-                    statement["extractor_version"] = "enhanced_kg_extractor_v1.0"
-                
-                # Aggregate to master lists
-                all_entities.extend(kg_data.get("entities", []))
-                all_statements.extend(kg_data.get("statements", []))
-                
+                context_start = max(0, start_idx - overlap) if batches else start_idx
+                batches.append((segments[context_start:start_idx], segments[start_idx:end_idx]))
                 start_idx = end_idx
-                batch_num += 1
-                
-                if start_idx >= len(segments):
-                    break
             
-            print(f"    📊 Extraction complete: {len(all_entities)} entities, {len(all_statements)} statements across {num_batches} batches")
+            print(f"    🔄 Extracting knowledge graphs from all batches ({min(self.batch_concurrency, num_batches)} at a time)...")
+            cache_name = await self.aget_prompt_cache()
+            started = time.perf_counter()
+            all_entities, all_statements = await self.extract_batches(batches, video_id, video_title, video_url, cache_name)
+            self.record_stage("extract", started)
             
-            # Now deduplicate across ALL batches
-            print(f"    🔍 Starting cross-batch deduplication...")
-            final_entities, final_statements = self.deduplicate_all_entities(all_entities, all_statements, video_id)
-            
-            print(f"    📊 After deduplication: {len(final_entities)} unique entities, {len(final_statements)} statements")
+            print(f"    📊 Extraction complete: {len(all_entities)} entities, {len(all_statements)} statements across {num_batches} batches")
             
-            # Bulk save to MongoDB
-            print(f"    💾 Bulk saving to MongoDB...")
-            success = self.bulk_save_knowledge_graph(final_entities, final_statements, video_id)
+            success, final_entities, final_statements = await asyncio.get_running_loop().run_in_executor(
+                self._resolver, self.resolve_and_save, all_entities, all_statements, video_id, time.perf_counter()
+            )
             
             if success:
                 dedup_reduction = ((len(all_entities) - len(final_entities)) / len(all_entities)) * 100 if all_entities else 0
-                print(f"    ✅ Video processing complete!")
+                print(f"    ✅ Video processing complete: {video_title[:60]}")
                 print(f"      📊 Final: {len(final_entities)} entities, {len(final_statements)} statements")
                 print(f"      🎯 Deduplication: {dedup_reduction:.1f}% reduction in entities")
                 return True
@@ -1478,19 +1656,34 @@ Consider:
                 return False
             
         except Exception as e:
-            print(f"    ❌ Error processing video: {e}")
+            print(f"    ❌ Error processing video {video_id}: {e}")
             return False
 
+    def process_video_in_batches(self, video_info: Dict[str, Any], batch_size: int = 200, overlap: int = 20, max_batch_size: int = 1000) -> bool:
+        """Process a single video's segments in batches, aggregate all data, then deduplicate and save."""
+        return self.run_async(self.process_video_async(video_info, batch_size, overlap, max_batch_size))
+
     def process_all_videos(self, skip_existing: bool = True, limit: Optional[int] = None, 
-                          batch_size: int = 200, overlap: int = 20, max_batch_size: int = 1000):
-        """Process all videos with segments to extract knowledge graphs using enhanced extraction."""
+                          batch_size: int = 200, overlap: int = 20, max_batch_size: int = 1000,
+                          video_concurrency: int = 1):
+        """
+        Process all videos with segments to extract knowledge graphs using enhanced extraction.
+        
+        Args:
+            skip_existing: Skip videos that already have entities
+            limit: Maximum number of videos to process
+            batch_size: Minimum segment batch size (optimized per video)
+            overlap: Context segments carried over from the previous batch
+            max_batch_size: Maximum segment batch size
+            video_concurrency: Videos in flight at once; they share the LLM budget and the resolver worker
+        """
         print("Starting enhanced knowledge graph extraction with multi-pass refinement and entity disambiguation...")
         
         # Setup vector index for disambiguation
         self.setup_vector_index()
         
         try:
-            videos_to_process = self.get_videos_for_processing()
+            videos_to_process = self.get_videos_for_processing(skip_existing=skip_existing)
             
             if not videos_to_process:
                 print("No videos to process")
@@ -1500,6 +1693,9 @@ Consider:
                 videos_to_process = videos_to_process[:limit]
                 print(f"Processing limited to first {limit} videos")
             
+            # Existing entities are loaded once; entities saved during the run are added as they go
+            self.entity_index = EntityResolutionIndex.load(self.entities)
+            
             stats = {
                 "total": len(videos_to_process),
                 "processed": 0,
@@ -1507,21 +1703,33 @@ Consider:
                 "errors": 0
             }
             
-            for i, video in enumerate(videos_to_process, 1):
-                video_id = video.get("video_id", "")
-                video_title = video.get("title", "Unknown Title")
-                
-                print(f"\n[{i}/{stats['total']}] Processing: {video_title[:80]}...")
-                print(f"  🆔 Video ID: {video_id}")
-                print(f"  📋 Min batch size: {batch_size}, Max: {max_batch_size}, Overlap: {overlap}")
-                print(f"  🔄 Multi-pass extraction: ENABLED")
-                print(f"  🔍 Entity disambiguation: ENABLED")
-                print(f"  📦 Prompt caching: ENABLED")
-                
-                if self.process_video_in_batches(video, batch_size, overlap, max_batch_size):
+            print(f"  📋 Min batch size: {batch_size}, Max: {max_batch_size}, Overlap: {overlap}")
+            print(f"  🔄 Multi-pass extraction: ENABLED")
+            print(f"  🔍 Entity disambiguation: ENABLED")
+            print(f"  📦 Prompt caching: ENABLED")
+            print(f"  🚦 Concurrency: {video_concurrency} videos, {self.batch_concurrency} batches/video, "
+                  f"{self.llm_concurrency} LLM calls")
+            
+            video_slots = asyncio.Semaphore(max(1, video_concurrency))
+            
+            async def process(i: int, video: Dict[str, Any]) -> bool:
+                async with video_slots:
+                    video_id = video.get("video_id", "")
+                    video_title = video.get("title", "Unknown Title")
+                    print(f"\n[{i}/{stats['total']}] Processing: {video_title[:80]}...")
+                    print(f"  🆔 Video ID: {video_id}")
+                    return await self.process_video_async(video, batch_size, overlap, max_batch_size)
+            
+            async def process_all():
+                return await asyncio.gather(*(process(i, video) for i, video in enumerate(videos_to_process, 1)))
+            
+            started = time.perf_counter()
+            for success in self.run_async(process_all()):
+                if success:
                     stats["processed"] += 1
                 else:
                     stats["errors"] += 1
+            wall_seconds = time.perf_counter() - started
             
             print(f"\n📊 Enhanced Knowledge Graph Extraction Complete!")
             print(f"  Total videos: {stats['total']}")
@@ -1531,9 +1739,11 @@ Consider:
             print(f"  🔄 Multi-pass extraction with LLM feedback")
             print(f"  🔍 Entity disambiguation with vector similarity")
             print(f"  📦 Prompt caching reduced token costs significantly")
+            self.print_stage_timings(wall_seconds, stats["total"])
             
         finally:
             self.cleanup_cache()
+            self.close()
 
     def get_extraction_stats(self) -> Dict[str, int]:
         """Get statistics about knowledge graph extraction."""
@@ -1563,11 +1773,27 @@ def main():
     parser.add_argument("--stats", action="store_true", help="Show extraction statistics only")
     parser.add_argument("--cache-ttl", type=int, default=24, help="Cache TTL in hours (default: 24)")
     parser.add_argument("--similarity-threshold", type=float, default=0.85, help="Similarity threshold for entity disambiguation")
+    parser.add_argument("--video-concurrency", type=int, default=2,
+                        help="Videos processed at once, sharing the LLM budget and entity resolution (default: 2)")
+    parser.add_argument("--llm-concurrency", type=int, default=8,
+                        help="Gemini calls in flight at once across all videos (default: 8)")
+    parser.add_argument("--batch-concurrency", type=int, default=4,
+                        help="Segment batches of a video extracted concurrently (default: 4)")
+    parser.add_argument("--requests-per-minute", type=float, default=60,
+                        help="Gemini request budget per minute across all concurrent calls (default: 60)")
+    parser.add_argument("--max-retries", type=int, default=5,
+                        help="Retries per Gemini call on 429/5xx errors, with jittered backoff (default: 5)")
     
     args = parser.parse_args()
     
     try:
-        extractor = EnhancedKnowledgeGraphExtractor(database_name=args.database)
+        extractor = EnhancedKnowledgeGraphExtractor(
+            database_name=args.database,
+            batch_concurrency=args.batch_concurrency,
+            requests_per_minute=args.requests_per_minute,
+            max_retries=args.max_retries,
+            llm_concurrency=args.llm_concurrency
+        )
         extractor.cache_ttl_hours = args.cache_ttl
         
         if args.stats:
@@ -1585,7 +1811,8 @@ def main():
             limit=args.limit,
             batch_size=args.batch_size,
             overlap=args.overlap,
-            max_batch_size=args.max_batch_size
+            max_batch_size=args.max_batch_size,
+            video_concurrency=args.video_concurrency
         )
         
     except ValueError as e:
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+In-Memory Entity Resolution Index
+---------------------------------
+
+Answers the two lookups entity disambiguation makes for every extracted
+entity without a database round trip:
+
+- exact:   ``(entity_type, normalized_name) -> entity``
+- similar: nearest existing entities of the same type by cosine similarity
+  of ``name_description_embedding``, computed as one matrix-vector product
+  over a per-type float32 matrix of unit rows
+
+The index is loaded from the ``entities`` collection once per run and kept
+current by adding entities as they are saved.  Exact keys use the
+``normalized_name`` persisted on each entity (see ``normalize_entity_name``;
+``migrate_entity_normalized_names.py`` backfills older entities).
+
+Similarity scores use the Atlas ``vectorSearchScore`` scale for cosine,
+``(1 + cosine) / 2``, so the extractor's merge thresholds mean the same as
+with ``$vectorSearch``.
+"""
+
+import re
+import time
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Fields kept per indexed entity (enough to merge into it and fetch its subgraph)
+ENTITY_FIELDS = ("entity_id", "entity_name", "entity_type")
+
+# Abbreviations expanded by normalize_entity_name; only whole tokens are rewritten
+NAME_ABBREVIATIONS = {
+    'st.': 'saint',
+    'mr.': 'mister',
+    'mrs.': 'missus',
+    'dr.': 'doctor',
+    'prof.': 'professor',
+    'hon.': 'honourable',
+    'rt. hon.': 'right honourable',
+    'pm': 'prime minister',
+    'mp': 'member of parliament',
+    'govt': 'government',
+    'govt.': 'government',
+    'dep.': 'deputy',
+    'dept': 'department',
+    'dept.': 'department',
+    'min.': 'minister',
+    'sec.': 'secretary',
+    'rep.': 'representative',
+    'const.': 'constitution',
+    'parl.': 'parliament',
+    'comm.': 'committee',
+    'assoc.': 'association',
+    'org.': 'organization',
+    'intl': 'international',
+    'natl': 'national'
+}
+
+# Longest first, so "rt. hon." wins over "hon." and "govt." over "govt"; the lookarounds keep
+# "mp" from matching inside "campaign" and "st." inside "just."
+_ABBREVIATION_PATTERN = re.compile(
+    r"(?<!\w)(?:" + "|".join(
+        re.escape(abbreviation) for abbreviation in sorted(NAME_ABBREVIATIONS, key=len, reverse=True)
+    ) + r")(?!\w)"
+)
+
+
+def normalize_entity_name(name: str) -> str:
+    """Canonical form of an entity name: casefolded, abbreviation tokens expanded, whitespace collapsed."""
+    normalized = " ".join((name or "").casefold().split())
+    return _ABBREVIATION_PATTERN.sub(lambda match: NAME_ABBREVIATIONS[match.group(0)], normalized)
+
+
+class _TypeVectors:
+    """Unit embedding rows of one entity type; appended rows are stacked on the next search."""
+
+    def __init__(self):
+        self.matrix: Optional[np.ndarray] = None
+        self.entities: List[Dict[str, Any]] = []
+        self._pending: List[np.ndarray] = []
+
+    def add(self, entity: Dict[str, Any], vector: np.ndarray):
+        self._pending.append(vector)
+        self.entities.append(entity)
+
+    def rows(self) -> Optional[np.ndarray]:
+        if self._pending:
+            stacked = np.vstack(self._pending)
+            self.matrix = stacked if self.matrix is None else np.vstack([self.matrix, stacked])
+            self._pending = []
+        return self.matrix
+
+
+def _unit(vector: Any) -> Optional[np.ndarray]:
+    array = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(array))
+    if not array.size or norm == 0.0:
+        return None
+    return array / norm
+
+
+class EntityResolutionIndex:
+    """Exact and nearest-neighbour entity lookups held in memory."""
+
+    def __init__(self):
+        self._exact: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._vectors: Dict[str, _TypeVectors] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    @classmethod
+    def load(cls, collection) -> "EntityResolutionIndex":
+        """Build the index from every entity in ``collection``."""
+        started = time.time()
+        index = cls()
+        cursor = collection.find(
+            {}, {"_id": 0, "normalized_name": 1, "name_description_embedding": 1, **{field: 1 for field in ENTITY_FIELDS}}
+        ).batch_size(5000)
+        for entity in cursor:
+            index.add(entity)
+
+        with_vectors = sum(len(vectors.entities) for vectors in index._vectors.values())
+        print(f"📇 Entity index loaded ({time.time() - started:.1f}s): {len(index)} names, "
+              f"{with_vectors} embeddings across {len(index._vectors)} types")
+        return index
+
+    def add(self, entity: Dict[str, Any]):
+        """Index an entity (e.g. right after saving it); the first entity per exact key wins."""
+        entity_type = entity.get("entity_type", "")
+        summary = {field: entity.get(field) for field in ENTITY_FIELDS}
+        normalized_name = entity.get("normalized_name") or normalize_entity_name(entity.get("entity_name", ""))
+        key = (entity_type, normalized_name)
+        vector = entity.get("name_description_embedding")
+        vector = _unit(vector) if vector is not None else None
+
+        with self._lock:
+            self._exact.setdefault(key, summary)
+            if vector is not None:
+                self._vectors.setdefault(entity_type, _TypeVectors()).add(summary, vector)
+
+    def find_exact(self, entity_type: str, normalized_name: str) -> Optional[Dict[str, Any]]:
+        """The indexed entity with this type and normalized name (see normalize_entity_name), if any."""
+        return self._exact.get((entity_type, normalized_name))
+
+    def find_similar(self, entity_type: str, embedding: Any, similarity_threshold: float = 0.85,
+                     limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Most similar indexed entities of a type, best first.
+
+        Args:
+            entity_type: Only entities of this type are compared
+            embedding: Query vector (name + description embedding)
+            similarity_threshold: Minimum score, on the Atlas (1 + cosine) / 2 scale
+            limit: Maximum number of results
+
+        Returns:
+            Entity summaries with a ``similarity_score`` field
+        """
+        query = _unit(embedding)
+        if query is None:
+            return []
+
+        with self._lock:
+            vectors = self._vectors.get(entity_type)
+            if vectors is None:
+                return []
+            matrix = vectors.rows()
+            entities = vectors.entities
+            if matrix is None or matrix.shape[1] != query.shape[0]:
+                return []
+            scores = (1.0 + matrix @ query) / 2.0
+
+        candidates = np.flatnonzero(scores >= similarity_threshold)
+        if candidates.size > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [dict(entities[i], similarity_score=float(scores[i])) for i in candidates]
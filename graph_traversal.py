@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Graph Traversal Engine
+----------------------
+
+Hop expansion for ``EnhancedGraphQuerier.get_connected_nodes`` with two
+backends:
+
+- ``EdgeQueryTraversal`` issues one indexed ``edges.find`` per hop (edges
+  touching the frontier in either direction, projected to subject/object)
+  plus a PageRank lookup when a hop overflows.  ``expand_async`` issues the
+  same queries through async driver collections.
+- ``CSRTraversal`` keeps a compact in-process adjacency (integer node ids,
+  NumPy offset/neighbour arrays) built from the ``edges`` collection.
+
+Only edges whose object is a URI are followed; literal objects are never
+treated as nodes.  Edge direction is ignored.  Both backends cap the number
+of new nodes per hop and keep the highest-PageRank neighbours when a hop
+overflows, pruning each hop before the next one is expanded.
+"""
+
+import time
+import inspect
+import logging
+import threading
+from typing import Dict, Generator, Iterable, List, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOP_FANOUT = 200
+DEFAULT_MAX_NODES = 500
+
+
+async def to_list_async(cursor) -> List[Dict]:
+    """Drain an async driver cursor (pymongo's async API returns it from a coroutine, Motor directly)."""
+    if inspect.isawaitable(cursor):
+        cursor = await cursor
+    return await cursor.to_list(length=None)
+
+
+def _select_by_pagerank(candidates: List[str], pagerank: Dict[str, float], budget: int) -> List[str]:
+    """Keep the ``budget`` highest-PageRank candidates (URI breaks ties deterministically)."""
+    if len(candidates) <= budget:
+        return candidates
+    return sorted(candidates, key=lambda uri: (-pagerank.get(uri, 0.0), uri))[:budget]
+
+
+class EdgeQueryTraversal:
+    """Server-side traversal: one indexed ``edges.find`` per hop."""
+
+    def __init__(self, nodes_collection, edges_collection):
+        self.nodes = nodes_collection
+        self.edges = edges_collection
+
+    def _edge_query(self, frontier: List[str]) -> tuple:
+        return (
+            {"object_type": "uri", "$or": [{"subject": {"$in": frontier}}, {"object": {"$in": frontier}}]},
+            {"_id": 0, "subject": 1, "object": 1},
+        )
+
+    def _pagerank_query(self, candidates: Iterable[str]) -> tuple:
+        return {"uri": {"$in": list(candidates)}}, {"_id": 0, "uri": 1, "pagerank_score": 1}
+
+    def _walk(self, seed_uris: Iterable[str], hops: int, fanout: int,
+              max_nodes: int) -> Generator[tuple, List[Dict], Set[str]]:
+        """
+        The hop-by-hop expansion, independent of the driver.
+
+        Yields ``(collection name, find arguments)`` and expects the matching
+        documents to be sent back; returns the expanded URI set.
+        """
+        seen = set(seed_uris)
+        frontier = list(seen)
+        for _ in range(max(0, hops)):
+            budget = min(fanout, max_nodes - len(seen))
+            if not frontier or budget <= 0:
+                break
+
+            # Direction is ignored: neighbours are reached through outgoing and incoming edges alike
+            candidates = set()
+            for edge in (yield "edges", self._edge_query(frontier)):
+                candidates.add(edge.get("subject"))
+                candidates.add(edge.get("object"))
+            candidates.discard(None)
+            candidates -= seen
+            if not candidates:
+                break
+
+            # Prune this hop before expanding it further, as CSRTraversal does
+            selected = sorted(candidates)
+            if len(selected) > budget:
+                pagerank = {
+                    doc["uri"]: doc.get("pagerank_score") or 0.0
+                    for doc in (yield "nodes", self._pagerank_query(selected))
+                }
+                selected = _select_by_pagerank(selected, pagerank, budget)
+
+            seen.update(selected)
+            frontier = selected
+        return seen
+
+    def expand(self, seed_uris: Iterable[str], hops: int = 1, fanout: int = DEFAULT_HOP_FANOUT,
+               max_nodes: int = DEFAULT_MAX_NODES) -> Set[str]:
+        """Expand seed URIs hop by hop, keeping the top-PageRank neighbours per hop."""
+        collections = {"edges": self.edges, "nodes": self.nodes}
+        walk = self._walk(seed_uris, hops, fanout, max_nodes)
+        try:
+            name, query = next(walk)
+            while True:
+                name, query = walk.send(list(collections[name].find(*query)))
+        except StopIteration as done:
+            return done.value
+
+    async def expand_async(self, nodes, edges, seed_uris: Iterable[str], hops: int = 1,
+                           fanout: int = DEFAULT_HOP_FANOUT, max_nodes: int = DEFAULT_MAX_NODES) -> Set[str]:
+        """
+        Same as ``expand`` but issued through async driver collections.
+
+        Args:
+            nodes: Async (pymongo AsyncMongoClient or Motor) handle on the nodes collection
+            edges: Async handle on the edges collection
+        """
+        collections = {"edges": edges, "nodes": nodes}
+        walk = self._walk(seed_uris, hops, fanout, max_nodes)
+        try:
+            name, query = next(walk)
+            while True:
+                name, query = walk.send(await to_list_async(collections[name].find(*query)))
+        except StopIteration as done:
+            return done.value
+
+
+class CSRTraversal:
+    """In-process traversal over a CSR adjacency built from the ``edges`` collection."""
+
+    def __init__(self, nodes_collection, edges_collection, staleness_check_interval: float = 300.0):
+        """
+        Initialize the CSR traversal backend.
+
+        Args:
+            nodes_collection: pymongo collection of graph nodes (for PageRank scores)
+            edges_collection: pymongo collection of graph edges
+            staleness_check_interval: Seconds between edge-count probes against MongoDB
+        """
+        self.nodes = nodes_collection
+        self.edges = edges_collection
+        self.staleness_check_interval = staleness_check_interval
+
+        self.uris: List[str] = []
+        self.uri_to_id: Dict[str, int] = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.neighbours = np.zeros(0, dtype=np.int32)
+        self.pagerank = np.zeros(0, dtype=np.float64)
+        self.edge_count = None
+
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._last_check = 0.0
+
+    def build(self, batch_size: int = 10000) -> int:
+        """
+        Stream URI-object edges into an undirected CSR adjacency.
+
+        Returns:
+            Number of nodes in the adjacency
+        """
+        start = time.time()
+        edge_count = self.edges.estimated_document_count()
+
+        uri_to_id: Dict[str, int] = {}
+        src, dst = [], []
+        cursor = self.edges.find(
+            {"object_type": "uri"}, {"_id": 0, "subject": 1, "object": 1}
+        ).batch_size(batch_size)
+        for edge in cursor:
+            s = uri_to_id.setdefault(edge["subject"], len(uri_to_id))
+            o = uri_to_id.setdefault(edge["object"], len(uri_to_id))
+            if s != o:
+                src.append(s)
+                dst.append(o)
+
+        num_nodes = len(uri_to_id)
+        src_arr = np.asarray(src, dtype=np.int32)
+        dst_arr = np.asarray(dst, dtype=np.int32)
+
+        # Traversal ignores direction, so store both (s, o) and (o, s) and drop duplicates
+        rows = np.concatenate([src_arr, dst_arr])
+        cols = np.concatenate([dst_arr, src_arr])
+        order = np.lexsort((cols, rows))
+        rows, cols = rows[order], cols[order]
+        if rows.size:
+            keep = np.ones(rows.size, dtype=bool)
+            keep[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            rows, cols = rows[keep], cols[keep]
+
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_nodes), out=offsets[1:])
+
+        uris = [None] * num_nodes
+        for uri, i in uri_to_id.items():
+            uris[i] = uri
+
+        pagerank = np.zeros(num_nodes, dtype=np.float64)
+        for doc in self.nodes.find(
+            {"pagerank_score": {"$exists": True}}, {"_id": 0, "uri": 1, "pagerank_score": 1}
+        ).batch_size(batch_size):
+            i = uri_to_id.get(doc.get("uri"))
+            if i is not None:
+                pagerank[i] = doc.get("pagerank_score") or 0.0
+
+        with self._lock:
+            self.uris = uris
+            self.uri_to_id = uri_to_id
+            self.offsets = offsets
+            self.neighbours = cols.astype(np.int32)
+            self.pagerank = pagerank
+            self.edge_count = edge_count
+            self._last_check = time.time()
+
+        logger.info(f"🕸️  CSR adjacency built: {num_nodes} nodes, {cols.size} arcs in {time.time() - start:.2f}s")
+        return num_nodes
+
+    def is_stale(self) -> bool:
+        """Check (at most every ``staleness_check_interval`` seconds) whether edges changed."""
+        if self.edge_count is None:
+            return True
+        now = time.time()
+        if now - self._last_check < self.staleness_check_interval:
+            return False
+        self._last_check = now
+        try:
+            return self.edges.estimated_document_count() != self.edge_count
+        except Exception as e:
+            logger.warning(f"⚠️  CSR staleness check failed: {e}")
+            return False
+
+    def refresh_in_background(self):
+        """Rebuild the adjacency on a daemon thread (no-op if already running)."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def _run():
+            try:
+                self.build()
+            except Exception as e:
+                logger.error(f"❌ CSR adjacency refresh failed: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=_run, name="csr-refresh", daemon=True).start()
+
+    def _neighbours_of(self, offsets: np.ndarray, neighbours: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+        """Concatenate the adjacency slices of every frontier node without a Python loop."""
+        starts = offsets[frontier]
+        lengths = offsets[frontier + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int32)
+        # Position k of the output maps to starts[i] + (k - first output slot of i)
+        slot_starts = np.cumsum(lengths) - lengths
+        index = np.repeat(starts - slot_starts, lengths) + np.arange(total)
+        return neighbours[index]
+
+    def expand(self, seed_uris: Iterable[str], hops: int = 1, fanout: int = DEFAULT_HOP_FANOUT,
+               max_nodes: int = DEFAULT_MAX_NODES) -> Set[str]:
+        """Expand seed URIs hop by hop, keeping the top-PageRank neighbours per hop."""
+        seen = set(seed_uris)
+        if hops <= 0 or not seen:
+            return seen
+
+        if self.is_stale():
+            self.refresh_in_background()
+
+        with self._lock:
+            uris, uri_to_id = self.uris, self.uri_to_id
+            offsets, neighbours, pagerank = self.offsets, self.neighbours, self.pagerank
+
+        visited = np.zeros(len(uris), dtype=bool)
+        frontier = np.asarray([uri_to_id[uri] for uri in seen if uri in uri_to_id], dtype=np.int64)
+        visited[frontier] = True
+
+        for _ in range(hops):
+            budget = min(fanout, max_nodes - len(seen))
+            if frontier.size == 0 or budget <= 0:
+                break
+
+            candidates = np.unique(self._neighbours_of(offsets, neighbours, frontier))
+            candidates = candidates[~visited[candidates]]
+            if candidates.size > budget:
+                # Highest PageRank first; node id breaks ties deterministically
+                order = np.lexsort((candidates, -pagerank[candidates]))
+                candidates = candidates[order[:budget]]
+
+            visited[candidates] = True
+            seen.update(uris[i] for i in candidates)
+            frontier = candidates.astype(np.int64)
+
+        return seen
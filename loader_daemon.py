@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Continuous Graph Loader
+-----------------------
+
+Keeps the graph collections in step with ``videos`` without manual runs of
+``mongodb_graph_loader.py``: whenever ``mongodb_ttl_generator.py`` writes
+``json_ld`` onto a video, the video is (re)loaded within seconds.
+
+- A watcher thread follows a change stream on ``videos`` filtered to inserts
+  carrying ``json_ld`` and updates that set it.  Where change streams are not
+  available (a standalone mongod for local testing) it polls for videos whose
+  ``rdf_generated_at`` reached a watermark instead, skipping the ones already
+  seen at exactly the watermark.
+- Events go through a bounded queue: when loading falls behind, the watcher
+  blocks and the server keeps the backlog (oplog) instead of this process.
+- Repeated updates of the same video are debounced: a video is loaded once it
+  has been quiet for ``debounce`` seconds.
+- A video that fails to load stays pending and is retried with exponential
+  backoff.
+- The change stream resume token (or polling watermark) is persisted in
+  ``graph_meta`` only once every event up to it has been loaded, so a restart
+  neither rescans the collection nor skips work (at-least-once).
+
+On start, videos the batch loader would pick up (never loaded / outdated
+loader version) are loaded first.
+"""
+
+import time
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from rate_limiter import backoff_delay
+from result_cache import GRAPH_META_COLLECTION
+
+WATCH_STATE_ID = "graph_loader_watch"
+
+# Server error codes: change streams need a replica set / history is gone
+CHANGE_STREAMS_UNSUPPORTED = (40573, 40415)
+CHANGE_STREAM_HISTORY_LOST = 286
+
+# Upper bound on the wait before retrying a video that failed to load
+MAX_RETRY_DELAY = 300.0
+
+# Only the key and resume token are needed; the loader fetches json_ld itself
+CHANGE_STREAM_PIPELINE = [
+    {"$match": {"$or": [
+        {"operationType": {"$in": ["insert", "replace"]}, "fullDocument.json_ld": {"$exists": True}},
+        {"operationType": "update", "updateDescription.updatedFields.json_ld": {"$exists": True}}
+    ]}},
+    {"$project": {"documentKey": 1, "operationType": 1}}
+]
+
+
+class GraphLoaderDaemon:
+    """Loads videos into the graph as their JSON-LD changes."""
+
+    def __init__(self, loader, mode: str = "auto", debounce: float = 5.0, queue_size: int = 100,
+                 poll_interval: float = 10.0):
+        """
+        Initialize the daemon.
+
+        Args:
+            loader: MongoDBGraphLoader used to load each video
+            mode: "change-stream", "poll", or "auto" (change stream, falling back to polling)
+            debounce: Seconds a video must go without further updates before it is loaded
+            queue_size: Maximum events buffered between the watcher and the loader
+            poll_interval: Seconds between polls in polling mode
+        """
+        if mode not in ("auto", "change-stream", "poll"):
+            raise ValueError(f"Unknown watch mode: {mode}")
+        self.loader = loader
+        self.videos = loader.videos_source
+        self.state = loader.db[GRAPH_META_COLLECTION]
+        self.mode = mode
+        self.debounce = debounce
+        self.queue_size = max(1, queue_size)
+        self.poll_interval = poll_interval
+
+        self._events: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_error: Optional[BaseException] = None
+
+        # Debounce state: video _id -> (due time, sequence number of its latest event)
+        self._pending: Dict[Any, tuple] = {}
+        # Checkpoints (resume token / watermark) by event sequence number, oldest first
+        self._checkpoints: Dict[int, Dict[str, Any]] = {}
+        self._sequence = 0
+        # Consecutive failed loads by video _id (drives the retry backoff)
+        self._failures: Dict[Any, int] = {}
+
+        self.stats = {"events": 0, "loaded": 0, "errors": 0, "retries": 0, "debounced": 0}
+
+    # ------------------------------------------------------------------ #
+    #                              STATE                                 #
+    # ------------------------------------------------------------------ #
+    def load_state(self) -> Dict[str, Any]:
+        return self.state.find_one({"_id": WATCH_STATE_ID}) or {}
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Persist a resume token ({"resume_token": ...}) or polling watermark ({"poll_watermark": ...})."""
+        self.state.update_one(
+            {"_id": WATCH_STATE_ID},
+            {"$set": dict(checkpoint, updated_at=datetime.now(timezone.utc))},
+            upsert=True
+        )
+
+    def reset_resume_token(self):
+        self.state.update_one({"_id": WATCH_STATE_ID}, {"$unset": {"resume_token": ""}})
+
+    # ------------------------------------------------------------------ #
+    #                             WATCHERS                               #
+    # ------------------------------------------------------------------ #
+    def _enqueue(self, video_key: Any, checkpoint: Dict[str, Any]) -> bool:
+        """Hand an event to the loader thread, blocking while the queue is full (backpressure)."""
+        while not self._stop.is_set():
+            try:
+                self._events.put((video_key, checkpoint), timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _watch_change_stream(self, resume_token: Optional[Dict[str, Any]]):
+        options = {"max_await_time_ms": 1000}
+        if resume_token:
+            options["resume_after"] = resume_token
+        with self.videos.watch(CHANGE_STREAM_PIPELINE, **options) as stream:
+            print("👀 Watching videos for JSON-LD changes (change stream)")
+            while not self._stop.is_set():
+                change = stream.try_next()
+                if change is None:
+                    continue
+                if not self._enqueue(change["documentKey"]["_id"], {"resume_token": change["_id"]}):
+                    return
+
+    def _watch_polling(self, watermark: Optional[datetime]):
+        print(f"👀 Watching videos for JSON-LD changes (polling every {self.poll_interval:g}s)")
+        # Videos already enqueued at exactly the watermark: $gte re-reads them, and a video written
+        # later with the same timestamp is still found (after a restart they are loaded once more)
+        at_watermark = set()
+        if watermark is None:
+            # Nothing persisted yet: start from the newest existing JSON-LD (the startup catch-up covers the rest)
+            latest = self.videos.find_one(
+                {"json_ld": {"$exists": True}, "rdf_generated_at": {"$exists": True}},
+                {"rdf_generated_at": 1}, sort=[("rdf_generated_at", -1)]
+            )
+            watermark = latest["rdf_generated_at"] if latest else datetime.fromtimestamp(0, timezone.utc)
+            at_watermark = {doc["_id"] for doc in self.videos.find(
+                {"json_ld": {"$exists": True}, "rdf_generated_at": watermark}, {"_id": 1}
+            )}
+
+        while not self._stop.is_set():
+            cursor = self.videos.find(
+                {"json_ld": {"$exists": True}, "rdf_generated_at": {"$gte": watermark}},
+                {"_id": 1, "rdf_generated_at": 1}
+            ).sort([("rdf_generated_at", 1), ("_id", 1)])
+            for doc in cursor:
+                if doc["rdf_generated_at"] == watermark:
+                    if doc["_id"] in at_watermark:
+                        continue
+                else:
+                    watermark = doc["rdf_generated_at"]
+                    at_watermark = set()
+                at_watermark.add(doc["_id"])
+                if not self._enqueue(doc["_id"], {"poll_watermark": watermark}):
+                    return
+            self._stop.wait(self.poll_interval)
+
+    def _run_watcher(self, state: Dict[str, Any]):
+        try:
+            if self.mode != "poll":
+                try:
+                    self._watch_change_stream(state.get("resume_token"))
+                    return
+                except OperationFailure as e:
+                    if e.code == CHANGE_STREAM_HISTORY_LOST:
+                        # Resume point fell off the oplog: start from now, the catch-up already ran
+                        print("⚠️  Resume token is no longer in the oplog, watching from now")
+                        self.reset_resume_token()
+                        self._watch_change_stream(None)
+                        return
+                    if e.code not in CHANGE_STREAMS_UNSUPPORTED or self.mode == "change-stream":
+                        raise
+                    print(f"⚠️  Change streams unavailable ({e.details.get('errmsg', e) if e.details else e}), falling back to polling")
+            self._watch_polling(state.get("poll_watermark"))
+        except BaseException as e:
+            self._watcher_error = e
+            self._stop.set()
+
+    # ------------------------------------------------------------------ #
+    #                              LOADING                               #
+    # ------------------------------------------------------------------ #
+    def _drain_events(self, timeout: float):
+        """Move queued events into the debounce table (bounded by queue_size distinct videos)."""
+        while len(self._pending) < self.queue_size:
+            try:
+                video_key, checkpoint = self._events.get(timeout=timeout)
+            except queue.Empty:
+                return
+            timeout = 0
+            self._sequence += 1
+            self.stats["events"] += 1
+            if video_key in self._pending:
+                self.stats["debounced"] += 1
+            self._pending[video_key] = (time.monotonic() + self.debounce, self._sequence)
+            self._checkpoints[self._sequence] = checkpoint
+
+    def _commit_checkpoints(self):
+        """Persist the newest checkpoint whose events have all been loaded."""
+        oldest_pending = min((seq for _, seq in self._pending.values()), default=self._sequence + 1)
+        done = [seq for seq in self._checkpoints if seq < oldest_pending]
+        if not done:
+            return
+        checkpoint = self._checkpoints[max(done)]
+        for seq in done:
+            del self._checkpoints[seq]
+        try:
+            self.save_checkpoint(checkpoint)
+        except PyMongoError as e:
+            print(f"⚠️  Failed to persist watch checkpoint: {e}")
+
+    def load_video(self, video_key: Any) -> bool:
+        """Load one video by _id; videos already in the graph are reprocessed (diffed or reloaded)."""
+        video = self.videos.find_one({"_id": video_key}, {
+            "video_id": 1, "Video_title": 1, "VideoURL": 1, "json_ld": 1, "rdf_triple_count": 1,
+            "graph_processed": 1, "graph_processing_version": 1
+        })
+        if not video or not video.get("json_ld"):
+            return True
+
+        print(f"\n🔔 JSON-LD changed: {video.get('Video_title', 'Unknown Title')[:80]}")
+        print(f"  🆔 Video ID: {video['video_id']}")
+        return self.loader.process_video(video, reprocess=bool(video.get("graph_processed")))
+
+    def _load_pending(self, video_key: Any, seq: int):
+        """Load a due video; on failure keep it pending (holding back the checkpoint) and retry later."""
+        try:
+            loaded = self.load_video(video_key)
+        except Exception as e:
+            print(f"❌ Failed to load video {video_key}: {e}")
+            loaded = False
+
+        if self._pending.get(video_key, (None, None))[1] != seq:
+            # A newer event for this video arrived while it was loading: it is due again anyway
+            if loaded:
+                self._failures.pop(video_key, None)
+            return
+
+        if loaded:
+            self.stats["loaded"] += 1
+            self._failures.pop(video_key, None)
+            del self._pending[video_key]
+            return
+
+        self.stats["errors"] += 1
+        attempt = self._failures.get(video_key, 0)
+        self._failures[video_key] = attempt + 1
+        delay = backoff_delay(attempt, base=max(self.debounce, 1.0), cap=MAX_RETRY_DELAY)
+        self._pending[video_key] = (time.monotonic() + delay, seq)
+        self.stats["retries"] += 1
+        print(f"🔁 Retrying video {video_key} in {delay:.0f}s (attempt {attempt + 2})")
+
+    def catch_up(self):
+        """Load everything the batch loader would pick up (never loaded / outdated version)."""
+        videos = self.loader.get_videos_with_jsonld()
+        for video in self.loader.stream_videos_with_jsonld(videos):
+            if self._stop.is_set():
+                return
+            print(f"\n⏩ Catch-up: {video.get('Video_title', 'Unknown Title')[:80]}")
+            if self.loader.process_video(video):
+                self.stats["loaded"] += 1
+            else:
+                self.stats["errors"] += 1
+
+    def run(self):
+        """Run until interrupted (Ctrl+C / SIGTERM)."""
+        state = self.load_state()
+        self._watcher = threading.Thread(target=self._run_watcher, args=(state,), name="videos-watcher", daemon=True)
+        # Start watching before the catch-up so changes made meanwhile are not missed
+        self._watcher.start()
+
+        try:
+            self.catch_up()
+            print(f"\n🟢 Loader daemon running (debounce {self.debounce:g}s, queue {self.queue_size})")
+            while not self._stop.is_set():
+                # Sleep until the next video is due, but keep accepting events
+                now = time.monotonic()
+                next_due = min((due for due, _ in self._pending.values()), default=now + 1.0)
+                self._drain_events(timeout=max(0.05, min(next_due - now, 1.0)))
+
+                now = time.monotonic()
+                for video_key, (due, seq) in sorted(self._pending.items(), key=lambda item: item[1][1]):
+                    if self._stop.is_set() or due > now:
+                        continue
+                    self._load_pending(video_key, seq)
+                self._commit_checkpoints()
+        except KeyboardInterrupt:
+            print("\n👋 Stopping loader daemon")
+        finally:
+            self._stop.set()
+            if self._watcher is not None:
+                self._watcher.join(timeout=5)
+            print(f"📊 Loader daemon: {self.stats['events']} events ({self.stats['debounced']} debounced), "
+                  f"{self.stats['loaded']} videos loaded, {self.stats['errors']} errors "
+                  f"({self.stats['retries']} retries scheduled)")
+
+        if self._watcher_error is not None:
+            raise self._watcher_error
@@ -7,47 +7,77 @@ Enhanced version with cleaned up output:
 - De-duplicated labels and names
 - Removed ranking information for concise results
 - Provenance returned in Turtle format with minimal fields
+- Async MongoDB data path (pymongo async API or Motor) so concurrent tool calls share one event loop
 """
 
 import os
 import sys
+import time
+
+# Reference point for the cold-start timing breakdown
+_PROCESS_START = time.perf_counter()
+
 import re
 import json
 import logging
 import asyncio
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Dict, List, Set, Any, Optional
-import time
-import numpy as np
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Set, Any, Optional
 
 from bson import ObjectId
 
 # --- third-party -------------------------------------------------------------
 try:
     from pymongo import MongoClient, ASCENDING
-    from pymongo.errors import ConnectionFailure
+    from pymongo.errors import ConnectionFailure, OperationFailure
     from dotenv import load_dotenv
-    from rdflib import Graph, URIRef, Literal, BNode, Namespace
-    from rdflib.namespace import RDF, RDFS, OWL, FOAF, XSD
     from fastmcp import FastMCP
-    from fastapi import HTTPException
-    from fastapi.responses import JSONResponse
-    from fastapi import Request
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
 except ImportError as e:
     print(f"Missing package: {e}")
-    print("pip install fastmcp pymongo python-dotenv rdflib")
+    print("pip install fastmcp pymongo python-dotenv")
     sys.exit(1)
 
-# mandatory sentence-transformers
+# optional async driver: pymongo's native async API (4.10+), else Motor
 try:
-    from sentence_transformers import SentenceTransformer
-except ImportError as e:
-    print(f"❌ Missing required package: {e}")
+    from pymongo import AsyncMongoClient
+    ASYNC_DRIVER = "pymongo"
+except ImportError:
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient as AsyncMongoClient
+        ASYNC_DRIVER = "motor"
+    except ImportError:
+        AsyncMongoClient = None
+        ASYNC_DRIVER = None
+
+# mandatory embedding backend (imported when the model loads: torch alone takes seconds)
+from embedding_backend import (
+    EMBEDDING_BACKEND, EMBEDDING_MODEL, INSTALL_HINTS, load_embedding_backend, missing_packages
+)
+try:
+    _missing_embedding_packages = missing_packages(EMBEDDING_BACKEND)
+except ValueError as e:
+    print(f"❌ {e}")
+    sys.exit(1)
+if _missing_embedding_packages:
+    print(f"❌ Missing required package(s): {', '.join(_missing_embedding_packages)}")
     print("Vector search is mandatory. Please install:")
-    print("pip install sentence-transformers")
+    print(INSTALL_HINTS[EMBEDDING_BACKEND])
     sys.exit(1)
 
+from query_embeddings import MicroBatchEncoder, QueryEmbeddingCache, normalize_query_text
+from graph_traversal import EdgeQueryTraversal, CSRTraversal, DEFAULT_HOP_FANOUT, DEFAULT_MAX_NODES, to_list_async
+from result_cache import ResultCache, read_graph_version
+from turtle_writer import (
+    TurtleWriter, Literal as TurtleLiteral, integer_literal,
+    SUBGRAPH_PREFIXES, PROVENANCE_PREFIXES, RDF_TYPE, RDFS_LABEL, PROV_NS, SCHEMA_NS
+)
+
 # --------------------------------------------------------------------------- #
 #                               CONFIG / LOGGING                              #
 # --------------------------------------------------------------------------- #
@@ -59,6 +89,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Lazy startup: /health answers immediately, the querier and model initialize in the background
+LAZY_STARTUP = os.getenv("MCP_LAZY_STARTUP", "false").lower() in ("1", "true", "yes")
+MODEL_READY_TIMEOUT = float(os.getenv("MODEL_READY_TIMEOUT", "120"))
+
+# Cold-start phase timings in ms, reported by the health endpoints
+COLD_START_TIMINGS: Dict[str, float] = {"imports": round((time.perf_counter() - _PROCESS_START) * 1000, 1)}
+
+@contextmanager
+def cold_start_phase(name: str):
+    """Record the wall time of a startup phase in COLD_START_TIMINGS."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        COLD_START_TIMINGS[name] = round((time.perf_counter() - start) * 1000, 1)
+
+# Backend errors a query path recovered from while computing the current tool result
+_BACKEND_FAILURES: ContextVar[Optional[List[str]]] = ContextVar("backend_failures", default=None)
+
+def record_backend_failure(error: Exception):
+    """Note a swallowed backend error so cached_tool_result does not cache the degraded result."""
+    failures = _BACKEND_FAILURES.get()
+    if failures is not None:
+        failures.append(str(error))
+
+# Connection pool shared by concurrent tool calls
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "1"))
+# Serve MCP tools through the async driver when one is installed
+MONGODB_ASYNC = os.getenv("MONGODB_ASYNC", "true").lower() in ("1", "true", "yes")
+
+# "atlas" runs $vectorSearch per query; "local" serves queries from an in-process index
+VECTOR_SEARCH_BACKEND = os.getenv("VECTOR_SEARCH_BACKEND", "atlas").lower()
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR")  # defaults to vector_index.DEFAULT_INDEX_DIR
+
+# Query embedding cache / micro-batching
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+QUERY_EMBEDDING_CACHE_TTL = float(os.getenv("QUERY_EMBEDDING_CACHE_TTL", "3600"))
+EMBEDDING_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "5"))
+
+# "edges" expands hops with one indexed edges query per hop; "csr" uses an in-process adjacency
+GRAPH_TRAVERSAL_BACKENDS = ("edges", "csr")
+GRAPH_TRAVERSAL_BACKEND = os.getenv("GRAPH_TRAVERSAL_BACKEND", "edges").lower()
+GRAPH_HOP_FANOUT = int(os.getenv("GRAPH_HOP_FANOUT", str(DEFAULT_HOP_FANOUT)))
+
+
+def _is_unindexed_filter_error(error: Exception) -> bool:
+    """True if $vectorSearch rejected a pre-filter on a path that is not a filter field of the index."""
+    return "needs to be indexed as filter" in str(error)
+
+# Tool result cache, invalidated by the graph version the loader bumps
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "512"))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "0")) or None  # 0 = graph version only
+RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH")  # SQLite file for the optional disk tier
+GRAPH_VERSION_CHECK_INTERVAL = float(os.getenv("GRAPH_VERSION_CHECK_INTERVAL", "5"))
+
+# Statements shown per node in provenance output
+PROVENANCE_STATEMENTS_PER_NODE = 5
+
 # --------------------------------------------------------------------------- #
 #                      ENHANCED GRAPH QUERIER WITH CLEAN OUTPUT              #
 # --------------------------------------------------------------------------- #
@@ -67,31 +156,41 @@ class EnhancedGraphQuerier:
 
     def __init__(self):
         self.client = None
+        self.connection_string = None
         self.db = None
         self.nodes = None
         self.edges = None
         self.statements = None
         self.embedding_model = None
-        self._initialize_database()
+        self.query_encoder = None
+        self.query_embeddings = None
+        self.vector_index = None
+        self.traversal = None
+        self.result_cache = None
+        self._rank_prefilter_supported = True
+        # Resolves once the embedding model is loaded (immediately unless LAZY_STARTUP)
+        self.model_ready: Future = Future()
+        # Small pool for overlapping independent queries on the sync driver
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="graph-io")
+        with cold_start_phase("mongodb_connect"):
+            self._initialize_database()
+        with cold_start_phase("result_cache"):
+            self._initialize_result_cache()
         self._initialize_embeddings()
+        with cold_start_phase("vector_index"):
+            self._initialize_vector_index()
+        with cold_start_phase("traversal"):
+            self._initialize_traversal()
 
     def _initialize_database(self):
         """Initialize database connection with proper error handling."""
         connection_string = os.getenv("MONGODB_CONNECTION_STRING")
         if not connection_string:
             raise ValueError("MONGODB_CONNECTION_STRING environment variable not set")
+        self.connection_string = connection_string
         
         try:
-            self.client = MongoClient(
-                connection_string,
-                serverSelectionTimeoutMS=5000,
-                connectTimeoutMS=5000,
-                socketTimeoutMS=10000,
-                maxPoolSize=3,
-                minPoolSize=1,
-                retryWrites=True,
-                w='majority'
-            )
+            self.client = MongoClient(connection_string, **self._client_options())
             
             # Test connection
             self.client.admin.command("ping", maxTimeMS=3000)
@@ -117,15 +216,164 @@ class EnhancedGraphQuerier:
                 self.client.close()
             raise ConnectionError(f"Failed to connect to MongoDB: {e}")
 
+    def _client_options(self) -> Dict[str, Any]:
+        """MongoClient options shared by the sync and async clients."""
+        return {
+            "serverSelectionTimeoutMS": 5000,
+            "connectTimeoutMS": 5000,
+            "socketTimeoutMS": 10000,
+            "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": MONGODB_MIN_POOL_SIZE,
+            "retryWrites": True,
+            "w": 'majority'
+        }
+
+    def _initialize_result_cache(self):
+        """Set up the tool result cache keyed on the graph version counter."""
+        self.result_cache = ResultCache(
+            lambda: read_graph_version(self.db),
+            maxsize=RESULT_CACHE_SIZE,
+            ttl=RESULT_CACHE_TTL,
+            disk_path=RESULT_CACHE_PATH,
+            version_check_interval=GRAPH_VERSION_CHECK_INTERVAL
+        )
+
     def _initialize_embeddings(self):
-        """Initialize embedding model - mandatory for operation."""
+        """Initialize embedding model - mandatory for operation (loaded in the background with lazy startup)."""
+        if LAZY_STARTUP:
+            threading.Thread(target=self._load_embeddings, name="model-loader", daemon=True).start()
+            return
+        
+        self._load_embeddings()
+        self.model_ready.result()  # Re-raise a load failure
+
+    def _load_embeddings(self):
+        """Load the embedding model and query encoder, then resolve ``model_ready``."""
         try:
-            logger.info("🔄  Loading embedding model...")
-            self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+            logger.info(f"🔄  Loading embedding model {EMBEDDING_MODEL} ({EMBEDDING_BACKEND})...")
+            # Backend selection, local model directories and ONNX files are configured in embedding_backend
+            with cold_start_phase("model_load"):
+                self.embedding_model = load_embedding_backend()
+            
+            self.query_encoder = MicroBatchEncoder(self.embedding_model, max_wait_ms=EMBEDDING_BATCH_WAIT_MS)
+            self.query_embeddings = QueryEmbeddingCache(
+                self.query_encoder.encode,
+                maxsize=QUERY_EMBEDDING_CACHE_SIZE,
+                ttl=QUERY_EMBEDDING_CACHE_TTL
+            )
+            COLD_START_TIMINGS["model_ready_since_start"] = round((time.perf_counter() - _PROCESS_START) * 1000, 1)
+            self.model_ready.set_result(True)
             logger.info("✅  Vector search enabled")
         except Exception as e:
             logger.error(f"❌ Failed to load embedding model: {e}")
-            raise RuntimeError(f"Vector search is mandatory but failed to initialize: {e}")
+            self.model_ready.set_exception(RuntimeError(f"Vector search is mandatory but failed to initialize: {e}"))
+
+    def is_model_ready(self) -> bool:
+        return self.model_ready.done() and self.model_ready.exception() is None
+
+    def embed_query(self, query: str) -> List[float]:
+        """Query embedding shared by all search paths (cached, micro-batched)."""
+        if not self.model_ready.done():
+            logger.info("⏳ Waiting for the embedding model to finish loading...")
+        self.model_ready.result(timeout=MODEL_READY_TIMEOUT)
+        return self.query_embeddings.get(query)
+
+    def _initialize_vector_index(self):
+        """Load (or build) the in-process vector index when the local backend is selected."""
+        if VECTOR_SEARCH_BACKEND != "local":
+            return
+        
+        try:
+            from vector_index import LocalVectorIndex, DEFAULT_INDEX_DIR
+            index_dir = VECTOR_INDEX_DIR or DEFAULT_INDEX_DIR
+            logger.info(f"🔄  Loading local vector index from {index_dir}...")
+            self.vector_index = LocalVectorIndex(self.nodes, index_dir=index_dir)
+            count = self.vector_index.load_or_build()
+            logger.info(f"✅  Local vector index ready ({count} vectors)")
+        except Exception as e:
+            # Atlas $vectorSearch remains available as the fallback path
+            logger.error(f"❌ Failed to initialize local vector index: {e}")
+            self.vector_index = None
+
+    def _initialize_traversal(self):
+        """Select the hop-expansion backend used by get_connected_nodes."""
+        self.traversal = EdgeQueryTraversal(self.nodes, self.edges)
+        if GRAPH_TRAVERSAL_BACKEND not in GRAPH_TRAVERSAL_BACKENDS:
+            logger.warning(f"⚠️  Unknown GRAPH_TRAVERSAL_BACKEND '{GRAPH_TRAVERSAL_BACKEND}' "
+                           f"(expected one of {', '.join(GRAPH_TRAVERSAL_BACKENDS)}), using edges")
+        if GRAPH_TRAVERSAL_BACKEND != "csr":
+            return
+        
+        try:
+            logger.info("🔄  Building in-memory adjacency...")
+            csr = CSRTraversal(self.nodes, self.edges)
+            csr.build()
+            self.traversal = csr
+            logger.info("✅  In-memory graph traversal enabled")
+        except Exception as e:
+            logger.error(f"❌ Failed to build adjacency, using per-hop edge queries: {e}")
+
+    def _local_index_available(self, allow_stale: bool = False) -> bool:
+        """Whether queries can be answered from the local vector index."""
+        if self.vector_index is None or len(self.vector_index) == 0:
+            return False
+        if allow_stale:
+            return True
+        if self.vector_index.is_stale():
+            logger.info("🔄 Local vector index is stale, refreshing in background")
+            self.vector_index.refresh_in_background()
+            return False
+        return True
+
+    def _fetch_nodes_in_order(self, uris: List[str]) -> List[Dict]:
+        """Fetch result nodes for the given URIs, preserving the order of ``uris``."""
+        if not uris:
+            return []
+        
+        docs = self.nodes.find(
+            {"uri": {"$in": uris}},
+            {"uri": 1, "label": 1, "name": 1, "type": 1, "searchable_text": 1}
+        )
+        by_uri = {doc["uri"]: doc for doc in docs}
+        return [by_uri[uri] for uri in uris if uri in by_uri]
+
+    def _local_vector_search_nodes(self, query_embedding: List[float], limit: int) -> List[Dict]:
+        """Vector search served from the local index."""
+        hits = self.vector_index.search(query_embedding, limit)
+        return self._fetch_nodes_in_order([uri for uri, _ in hits])
+
+    def _local_hybrid_ranking(self, query_embedding: List[float], limit: int, pagerank_weight: float,
+                              min_pagerank_score: float, max_rank: Optional[int] = None) -> List[tuple]:
+        """Hybrid ranking from the local index as (uri, hybrid_score, similarity_score) tuples."""
+        # Candidate generation is cheap locally, so look much deeper than Atlas numCandidates
+        hits = self.vector_index.search(query_embedding, max(limit * 20, 100))
+        
+        scored = []
+        for uri, similarity_score in hits:
+            pagerank_score = self.vector_index.pagerank_score(uri) or 0.0
+            if pagerank_score < min_pagerank_score:
+                continue
+            if max_rank is not None:
+                rank = self.vector_index.pagerank_rank(uri)
+                if rank is None or rank > max_rank:
+                    continue
+            # Same normalization as the Atlas pipeline (max PageRank around 0.01)
+            normalized_pagerank = pagerank_score / 0.01
+            hybrid_score = pagerank_weight * normalized_pagerank + (1 - pagerank_weight) * similarity_score
+            scored.append((uri, hybrid_score, similarity_score))
+        
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored[:limit]
+
+    def _local_hybrid_search(self, query_embedding: List[float], limit: int, pagerank_weight: float,
+                             min_pagerank_score: float) -> List[Dict]:
+        """Hybrid PageRank/similarity ranking served from the local index."""
+        scored = self._local_hybrid_ranking(query_embedding, limit, pagerank_weight, min_pagerank_score)
+        results = self._fetch_nodes_in_order([uri for uri, _, _ in scored])
+        similarity = {uri: similarity_score for uri, _, similarity_score in scored}
+        for result in results:
+            result["similarity_score"] = similarity[result["uri"]]
+        return results
 
     def _deduplicate_labels(self, labels: List[str]) -> str:
         """De-duplicate and clean labels, returning the best one."""
@@ -173,6 +421,7 @@ class EnhancedGraphQuerier:
             return cleaned_results
             
         except Exception as e:
+            record_backend_failure(e)
             logger.error(f"Vector search failed: {e}")
             return []
 
@@ -223,278 +472,357 @@ class EnhancedGraphQuerier:
                      min_pagerank_score: float = 0.00001) -> List[Dict]:
         """Hybrid search with clean output."""
         try:
-            logger.info(f"🎯 Hybrid search for: '{query}' (PageRank weight: {pagerank_weight:.1%})")
-            
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode(query).tolist()
-            
-            # MongoDB vector search pipeline with PageRank integration
-            pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": "vector_index",
-                        "path": "embedding",
-                        "queryVector": query_embedding,
-                        "numCandidates": limit * 5,  # Get more candidates
-                        "limit": limit * 3
-                    }
-                },
-                {
-                    "$match": {
-                        "pagerank_score": {"$gte": min_pagerank_score}
-                    }
-                },
-                {
-                    "$addFields": {
-                        "similarity_score": {"$meta": "vectorSearchScore"},
-                        # Normalize PageRank score (assuming max around 0.01 for typical graphs)
-                        "normalized_pagerank": {
-                            "$divide": [
-                                {"$ifNull": ["$pagerank_score", 0.00001]},
-                                0.01  # Approximate max PageRank score
-                            ]
-                        }
-                    }
-                },
-                {
-                    "$addFields": {
-                        "hybrid_score": {
-                            "$add": [
-                                {"$multiply": [pagerank_weight, "$normalized_pagerank"]},
-                                {"$multiply": [(1 - pagerank_weight), "$similarity_score"]}
-                            ]
-                        }
-                    }
-                },
-                {
-                    "$sort": {"hybrid_score": -1}
-                },
-                {
-                    "$limit": limit
-                },
-                {
-                    "$project": {
-                        "uri": 1,
-                        "label": 1,
-                        "name": 1,
-                        "type": 1,
-                        "searchable_text": 1
-                        # Removed video fields - only in provenance
-                    }
-                }
-            ]
-            
-            results = list(self.nodes.aggregate(pipeline))
-            
-            # Clean and simplify results
-            cleaned_results = []
-            for result in results:
-                cleaned = self._clean_node_result(result)
-                if cleaned:
-                    cleaned_results.append(cleaned)
-            
-            logger.info(f"🎯 Hybrid search found {len(cleaned_results)} results")
-            return cleaned_results
+            scored = self._scored_hybrid_search(query, limit, pagerank_weight, min_pagerank_score)
+            return [node for node, _ in scored]
             
         except Exception as e:
+            record_backend_failure(e)
             logger.error(f"❌ Hybrid search failed: {e}")
             # Fall back to regular vector search
             return self.search_nodes(query, limit)
 
+    def _scored_hybrid_search(self, query: str, limit: int, pagerank_weight: float,
+                              min_pagerank_score: float) -> List[tuple]:
+        """Hybrid search returning (clean node, similarity score) tuples in hybrid order."""
+        logger.info(f"🎯 Hybrid search for: '{query}' (PageRank weight: {pagerank_weight:.1%})")
+        
+        # Generate query embedding
+        query_embedding = self.embed_query(query)
+        
+        if self._local_index_available():
+            results = self._local_hybrid_search(query_embedding, limit, pagerank_weight, min_pagerank_score)
+            source = "local index"
+        else:
+            # MongoDB vector search pipeline with PageRank integration
+            pipeline = self._scored_hybrid_pipeline(query_embedding, limit, pagerank_weight, min_pagerank_score)
+            try:
+                results = list(self.nodes.aggregate(pipeline))
+                source = "Atlas"
+            except OperationFailure as e:
+                record_backend_failure(e)
+                # No $vectorSearch (plain mongod, Atlas outage): serve from a stale local index if we have one
+                if not self._local_index_available(allow_stale=True):
+                    raise
+                logger.warning(f"⚠️  Atlas vector search unavailable ({e}), using local index")
+                results = self._local_hybrid_search(query_embedding, limit, pagerank_weight, min_pagerank_score)
+                source = "stale local index"
+        
+        scored_results = self._scored_results(results)
+        logger.info(f"🎯 Hybrid search found {len(scored_results)} results ({source})")
+        return scored_results
+
+    def _scored_hybrid_pipeline(self, query_embedding: List[float], limit: int, pagerank_weight: float,
+                                min_pagerank_score: float) -> List[Dict]:
+        """Hybrid pipeline cut to ``limit`` and projected to clean-output fields."""
+        return self._hybrid_pipeline(query_embedding, limit, pagerank_weight, min_pagerank_score) + [
+            {
+                "$limit": limit
+            },
+            {
+                "$project": {
+                    "uri": 1,
+                    "label": 1,
+                    "name": 1,
+                    "type": 1,
+                    "searchable_text": 1,
+                    "similarity_score": 1
+                    # Removed video fields - only in provenance
+                }
+            }
+        ]
+
+    def _scored_results(self, results: List[Dict]) -> List[tuple]:
+        """Clean and simplify raw hybrid results into (clean node, similarity score) tuples."""
+        scored_results = []
+        for result in results:
+            cleaned = self._clean_node_result(result)
+            if cleaned:
+                scored_results.append((cleaned, result.get("similarity_score", 0.0)))
+        return scored_results
+
+    def _hybrid_pipeline(self, query_embedding: List[float], limit: int, pagerank_weight: float,
+                         min_pagerank_score: float, max_rank: Optional[int] = None,
+                         rank_prefilter: bool = True) -> List[Dict]:
+        """
+        Build the $vectorSearch + hybrid scoring stages, sorted by hybrid_score.
+        
+        With max_rank set, the rank constraint is pushed into the $vectorSearch
+        pre-filter (requires pagerank_rank as a filter field in vector_index) or,
+        with rank_prefilter=False, applied as a $match right after it.
+        """
+        vector_search = {
+            "index": "vector_index",
+            "path": "embedding",
+            "queryVector": query_embedding,
+            "numCandidates": limit * 5,  # Get more candidates
+            "limit": limit * 3
+        }
+        match = {"pagerank_score": {"$gte": min_pagerank_score}}
+        
+        if max_rank is not None:
+            if rank_prefilter:
+                vector_search["filter"] = {"pagerank_rank": {"$lte": max_rank}}
+            else:
+                match["pagerank_rank"] = {"$lte": max_rank}
+        
+        return [
+            {
+                "$vectorSearch": vector_search
+            },
+            {
+                "$match": match
+            },
+            {
+                "$addFields": {
+                    "similarity_score": {"$meta": "vectorSearchScore"},
+                    # Normalize PageRank score (assuming max around 0.01 for typical graphs)
+                    "normalized_pagerank": {
+                        "$divide": [
+                            {"$ifNull": ["$pagerank_score", 0.00001]},
+                            0.01  # Approximate max PageRank score
+                        ]
+                    }
+                }
+            },
+            {
+                "$addFields": {
+                    "hybrid_score": {
+                        "$add": [
+                            {"$multiply": [pagerank_weight, "$normalized_pagerank"]},
+                            {"$multiply": [(1 - pagerank_weight), "$similarity_score"]}
+                        ]
+                    }
+                }
+            },
+            {
+                "$sort": {"hybrid_score": -1}
+            }
+        ]
+
     def authority_search(self, query: str, limit: int = 8, min_pagerank_rank: int = 1000) -> List[Dict]:
-        """Search for authoritative nodes with clean output."""
+        """Search for authoritative nodes with clean output (one round trip)."""
         try:
             logger.info(f"👑 Authority search for: '{query}' (max rank: {min_pagerank_rank})")
             
-            # First get semantically relevant nodes with good PageRank
-            candidates = self.hybrid_search(
-                query, 
-                limit=limit * 2, 
-                pagerank_weight=0.7,  # Heavily favor PageRank
-                min_pagerank_score=0.00001
-            )
+            query_embedding = self.embed_query(query)
             
-            # For authority search, we need to check PageRank rank in database
-            # since we removed it from hybrid_search output
-            enhanced_candidates = []
-            for node in candidates:
-                # Get PageRank rank from database
-                db_node = self.nodes.find_one({"uri": node["uri"]}, {"pagerank_rank": 1})
-                if db_node and db_node.get("pagerank_rank", float('inf')) <= min_pagerank_rank:
-                    enhanced_candidates.append((node, db_node.get("pagerank_rank", float('inf'))))
+            # Semantically relevant nodes with good PageRank, heavily favouring PageRank
+            if self._local_index_available():
+                results = self._fetch_nodes_in_order(
+                    self._local_authority_uris(query_embedding, limit, min_pagerank_rank)
+                )
+            else:
+                try:
+                    results = self._authority_aggregate(query_embedding, limit, min_pagerank_rank)
+                except OperationFailure as e:
+                    record_backend_failure(e)
+                    # No $vectorSearch (plain mongod, Atlas outage): serve from a stale local index if we have one
+                    if not self._local_index_available(allow_stale=True):
+                        raise
+                    logger.warning(f"⚠️  Atlas vector search unavailable ({e}), using local index")
+                    results = self._fetch_nodes_in_order(
+                        self._local_authority_uris(query_embedding, limit, min_pagerank_rank)
+                    )
             
-            # Sort by PageRank rank (lower is better) and return just the nodes
-            enhanced_candidates.sort(key=lambda x: x[1])
-            authority_results = [node for node, rank in enhanced_candidates[:limit]]
+            authority_results = [c for c in (self._clean_node_result(r) for r in results) if c]
             
             logger.info(f"👑 Found {len(authority_results)} authoritative nodes")
             return authority_results
             
         except Exception as e:
+            record_backend_failure(e)
             logger.error(f"❌ Authority search failed: {e}")
             return []
 
+    def _local_authority_uris(self, query_embedding: List[float], limit: int, max_rank: int) -> List[str]:
+        """Authority candidates from the local index, sorted by PageRank rank (lower is better)."""
+        candidates = self._local_hybrid_ranking(query_embedding, limit * 2, 0.7, 0.00001, max_rank=max_rank)
+        candidates.sort(key=lambda x: self.vector_index.pagerank_rank(x[0]))
+        return [uri for uri, _, _ in candidates[:limit]]
+
+    def _authority_pipeline(self, query_embedding: List[float], limit: int, max_rank: int,
+                            rank_prefilter: bool) -> List[Dict]:
+        """Hybrid candidates filtered on pagerank_rank and re-sorted by rank."""
+        pipeline = self._hybrid_pipeline(
+            query_embedding, limit * 2, 0.7, 0.00001,
+            max_rank=max_rank, rank_prefilter=rank_prefilter
+        )
+        return pipeline + [
+            {"$limit": limit * 2},
+            {"$sort": {"pagerank_rank": 1}},
+            {"$limit": limit},
+            {"$project": {"uri": 1, "label": 1, "name": 1, "type": 1, "searchable_text": 1}}
+        ]
+
+    def _authority_aggregate(self, query_embedding: List[float], limit: int, max_rank: int) -> List[Dict]:
+        """Run the authority pipeline in a single aggregation."""
+        if self._rank_prefilter_supported:
+            try:
+                return list(self.nodes.aggregate(self._authority_pipeline(query_embedding, limit, max_rank, True)))
+            except OperationFailure as e:
+                if not _is_unindexed_filter_error(e):
+                    raise
+                # vector_index has no pagerank_rank filter field; post-filter from now on
+                logger.warning(f"⚠️  $vectorSearch rank pre-filter unavailable, using $match: {e}")
+                self._rank_prefilter_supported = False
+        
+        return list(self.nodes.aggregate(self._authority_pipeline(query_embedding, limit, max_rank, False)))
+
     def topic_specific_search(self, query: str, limit: int = 8, topic_expansion: int = 50) -> List[Dict]:
         """Find nodes important within the specific topic domain of the query."""
         try:
             logger.info(f"🎯 Topic-specific search for: '{query}'")
             
             # Find semantically relevant nodes to define the topic
-            topic_nodes = self.hybrid_search(
+            scored_topic_nodes = self._scored_hybrid_search(
                 query, 
                 limit=topic_expansion,
                 pagerank_weight=0.1,  # Favor similarity for topic definition
                 min_pagerank_score=0.00001
             )
             
-            if not topic_nodes:
+            if not scored_topic_nodes:
                 logger.warning("No topic nodes found")
                 return []
             
-            # Extract URIs of topic-relevant nodes
-            topic_uris = {node['uri'] for node in topic_nodes}
-            
-            # Calculate mini-PageRank within this topic subgraph
-            topic_pagerank_scores = self._calculate_topic_pagerank(topic_uris)
+            similarity_scores = {node['uri']: score for node, score in scored_topic_nodes}
             
-            # Combine topic PageRank with original relevance and return top results
-            enhanced_results = []
-            for node in topic_nodes:
-                uri = node['uri']
-                # Calculate hybrid score but don't include it in output
-                if uri in topic_pagerank_scores:
-                    topic_hybrid_score = (
-                        0.6 * topic_pagerank_scores[uri] + 
-                        0.4 * 0.5  # Assume reasonable similarity since these came from search
-                    )
-                else:
-                    topic_hybrid_score = 0.2  # Low score for nodes without topic PageRank
-                
-                enhanced_results.append((node, topic_hybrid_score))
+            # Extract URIs of topic-relevant nodes
+            topic_uris = set(similarity_scores)
             
-            # Sort by topic-specific hybrid score and return just the nodes
-            enhanced_results.sort(key=lambda x: x[1], reverse=True)
-            final_results = [node for node, score in enhanced_results[:limit]]
+            # Calculate mini-PageRank within this topic subgraph, biased towards the query
+            topic_pagerank_scores = self._calculate_topic_pagerank(topic_uris, personalization=similarity_scores)
             
+            final_results = self._rank_topic_nodes(scored_topic_nodes, topic_pagerank_scores, limit)
             logger.info(f"🎯 Topic-specific search found {len(final_results)} results")
             return final_results
             
         except Exception as e:
+            record_backend_failure(e)
             logger.error(f"❌ Topic-specific search failed: {e}")
             return self.hybrid_search(query, limit)
 
+    def _rank_topic_nodes(self, scored_topic_nodes: List[tuple], topic_pagerank_scores: Dict[str, float],
+                          limit: int) -> List[Dict]:
+        """Combine topic PageRank with original relevance and return the top nodes."""
+        topic_nodes = [node for node, _ in scored_topic_nodes]
+        enhanced_results = []
+        for node in topic_nodes:
+            uri = node['uri']
+            # Calculate hybrid score but don't include it in output
+            if uri in topic_pagerank_scores:
+                topic_hybrid_score = (
+                    0.6 * topic_pagerank_scores[uri] + 
+                    0.4 * 0.5  # Assume reasonable similarity since these came from search
+                )
+            else:
+                topic_hybrid_score = 0.2  # Low score for nodes without topic PageRank
+            
+            enhanced_results.append((node, topic_hybrid_score))
+        
+        # Sort by topic-specific hybrid score and return just the nodes
+        enhanced_results.sort(key=lambda x: x[1], reverse=True)
+        return [node for node, score in enhanced_results[:limit]]
+
+    def _topic_edge_query(self, topic_uris: Set[str]) -> tuple:
+        """(filter, projection) for the URI edges between topic nodes."""
+        return {
+            "subject": {"$in": list(topic_uris)},
+            "object": {"$in": list(topic_uris)},
+            "object_type": "uri"
+        }, {"_id": 0, "subject": 1, "object": 1}
+
     def _calculate_topic_pagerank(self, topic_uris: Set[str], damping: float = 0.85, 
-                                 max_iterations: int = 50) -> Dict[str, float]:
-        """Calculate PageRank within a topic-specific subgraph."""
+                                 max_iterations: int = 50,
+                                 personalization: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Calculate (personalized) PageRank within a topic-specific subgraph."""
         try:
+            if not topic_uris:
+                return {}
+            
             # Get edges between topic nodes
-            edges_cursor = self.edges.find({
-                "subject": {"$in": list(topic_uris)},
-                "object": {"$in": list(topic_uris)},
-                "object_type": "uri"
-            }, {"subject": 1, "object": 1})
+            edges_cursor = self.edges.find(*self._topic_edge_query(topic_uris))
+            return self._topic_pagerank_from_edges(topic_uris, edges_cursor, damping, max_iterations, personalization)
             
-            # Build adjacency structure
-            uri_to_index = {uri: i for i, uri in enumerate(topic_uris)}
-            index_to_uri = {i: uri for uri, i in uri_to_index.items()}
+        except Exception as e:
+            record_backend_failure(e)
+            logger.error(f"❌ Topic PageRank calculation failed: {e}")
+            return {}
+
+    def _topic_pagerank_from_edges(self, topic_uris: Set[str], edges: Iterable[Dict], damping: float,
+                                   max_iterations: int, personalization: Optional[Dict[str, float]]) -> Dict[str, float]:
+        """Personalized PageRank over already-fetched topic edges."""
+        try:
             num_nodes = len(topic_uris)
-            
             if num_nodes == 0:
                 return {}
             
+            # Build adjacency structure
+            index_to_uri = list(topic_uris)
+            uri_to_index = {uri: i for i, uri in enumerate(index_to_uri)}
+            
             # Build edge list
-            edges_list = []
-            for edge in edges_cursor:
-                subject_uri = edge["subject"]
-                object_uri = edge["object"]
-                if subject_uri in uri_to_index and object_uri in uri_to_index:
-                    edges_list.append((uri_to_index[subject_uri], uri_to_index[object_uri]))
+            sources, targets = [], []
+            for edge in edges:
+                subject_index = uri_to_index.get(edge["subject"])
+                object_index = uri_to_index.get(edge["object"])
+                if subject_index is not None and object_index is not None:
+                    sources.append(subject_index)
+                    targets.append(object_index)
             
-            if not edges_list:
+            if not sources:
                 # No connections, return uniform scores
                 uniform_score = 1.0 / num_nodes
                 return {uri: uniform_score for uri in topic_uris}
             
-            # Calculate PageRank using simplified algorithm
-            pagerank_scores = self._simple_pagerank(edges_list, num_nodes, damping, max_iterations)
+            # scipy is only needed here, so it stays off the startup path
+            from pagerank_engine import compute_pagerank
+            
+            teleport = None
+            if personalization:
+                teleport = [personalization.get(uri, 0.0) for uri in index_to_uri]
+            
+            result = compute_pagerank(
+                sources, targets, num_nodes,
+                damping=damping,
+                personalization=teleport,
+                max_iterations=max_iterations
+            )
+            logger.info(f"🧮 Topic PageRank: {num_nodes} nodes, {len(sources)} edges, "
+                        f"{result.iterations} iterations (converged: {result.converged})")
             
             # Map back to URIs
-            return {index_to_uri[i]: float(score) for i, score in enumerate(pagerank_scores)}
+            return {index_to_uri[i]: float(score) for i, score in enumerate(result.scores)}
             
         except Exception as e:
+            record_backend_failure(e)
             logger.error(f"❌ Topic PageRank calculation failed: {e}")
             return {}
 
-    def _simple_pagerank(self, edges_list: List[tuple], num_nodes: int, 
-                        damping: float = 0.85, max_iterations: int = 50) -> np.ndarray:
-        """Simplified PageRank calculation for topic subgraphs."""
-        if num_nodes == 0:
-            return np.array([])
-        
-        # Build adjacency information
-        from collections import defaultdict
-        out_links = defaultdict(list)
-        out_degree = defaultdict(int)
-        
-        for from_node, to_node in edges_list:
-            out_links[from_node].append(to_node)
-            out_degree[from_node] += 1
-        
-        # Initialize PageRank scores
-        pagerank = np.ones(num_nodes) / num_nodes
-        
-        # Power iteration
-        for _ in range(max_iterations):
-            new_pagerank = np.full(num_nodes, (1 - damping) / num_nodes)
-            
-            for node in range(num_nodes):
-                if out_degree[node] > 0:
-                    contribution = damping * pagerank[node] / out_degree[node]
-                    for target in out_links[node]:
-                        new_pagerank[target] += contribution
-                else:
-                    # Dangling node: distribute to all nodes
-                    contribution = damping * pagerank[node] / num_nodes
-                    new_pagerank += contribution
-            
-            # Check convergence
-            if np.sum(np.abs(new_pagerank - pagerank)) < 1e-6:
-                break
-            
-            pagerank = new_pagerank
-        
-        return pagerank
-
     def _vector_search_nodes(self, query: str, limit: int = 8) -> List[Dict]:
         """Vector search using sentence transformers."""
         try:
             # Generate query embedding
-            query_embedding = self.embedding_model.encode(query).tolist()
+            query_embedding = self.embed_query(query)
+            
+            if self._local_index_available():
+                results = self._local_vector_search_nodes(query_embedding, limit)
+                logger.info(f"Local vector index returned {len(results)} results")
+                return results
             
             # MongoDB vector search pipeline - simplified for clean output
-            pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": "vector_index",
-                        "path": "embedding",
-                        "queryVector": query_embedding,
-                        "numCandidates": limit * 3,
-                        "limit": limit,
-                    }
-                },
-                {
-                    "$project": {
-                        "uri": 1,
-                        "label": 1,
-                        "name": 1,
-                        "type": 1,
-                        "searchable_text": 1
-                        # Removed video fields - only in provenance
-                    }
-                }
-            ]
+            pipeline = self._vector_pipeline(query_embedding, limit)
 
-            results = list(self.nodes.aggregate(pipeline))
+            try:
+                results = list(self.nodes.aggregate(pipeline))
+            except Exception as e:
+                record_backend_failure(e)
+                # No $vectorSearch (plain mongod, Atlas outage): serve from a stale local index if we have one
+                if not self._local_index_available(allow_stale=True):
+                    raise
+                logger.warning(f"⚠️  Atlas vector search unavailable ({e}), using local index")
+                results = self._local_vector_search_nodes(query_embedding, limit)
+            
             logger.info(f"Vector search pipeline returned {len(results)} results")
             return results
             
@@ -502,243 +830,635 @@ class EnhancedGraphQuerier:
             logger.error(f"Vector search failed: {e}")
             raise RuntimeError(f"Vector search is mandatory but failed: {e}")
 
+    def _vector_pipeline(self, query_embedding: List[float], limit: int) -> List[Dict]:
+        """Plain $vectorSearch pipeline projected to clean-output fields."""
+        return [
+            {
+                "$vectorSearch": {
+                    "index": "vector_index",
+                    "path": "embedding",
+                    "queryVector": query_embedding,
+                    "numCandidates": limit * 3,
+                    "limit": limit,
+                }
+            },
+            {
+                "$project": {
+                    "uri": 1,
+                    "label": 1,
+                    "name": 1,
+                    "type": 1,
+                    "searchable_text": 1
+                    # Removed video fields - only in provenance
+                }
+            }
+        ]
+
     def get_connected_nodes(self, uris: Set[str], hops: int = 1) -> Set[str]:
-        """Get nodes connected to the given URIs."""
+        """Get nodes connected to the given URIs, keeping the top-PageRank neighbours per hop."""
         try:
-            current, seen = set(uris), set(uris)
-            for hop in range(max(0, hops)):
-                if not current or len(seen) > 500:
-                    break
-                    
-                edges = self.edges.find({
-                    "$or": [
-                        {"subject": {"$in": list(current)}},
-                        {"object": {"$in": list(current)}},
-                    ]
-                })
-                
-                nxt = set()
-                for edge in edges:
-                    nxt.add(edge["subject"])
-                    nxt.add(edge["object"])
-                
-                current = nxt - seen
-                seen.update(nxt)
-                    
-            return seen
+            return self.traversal.expand(
+                uris,
+                hops=max(0, hops),
+                fanout=GRAPH_HOP_FANOUT,
+                max_nodes=DEFAULT_MAX_NODES
+            )
             
         except Exception as e:
+            record_backend_failure(e)
             logger.error(f"Graph traversal failed: {e}")
             return uris
 
     def get_subgraph(self, uris: Set[str]) -> Dict[str, Any]:
         """Get subgraph for the given URIs with clean, deduplicated nodes."""
         try:
-            if len(uris) > 500:
-                uris = set(list(uris)[:500])
-            
-            # Get raw nodes without embedding, ranking info, and video info (keep name for deduplication)
-            raw_nodes = list(self.nodes.find(
-                {"uri": {"$in": list(uris)}}, 
-                {
-                    "embedding": 0, 
-                    "pagerank_score": 0, 
-                    "pagerank_rank": 0,
-                    "similarity_score": 0,
-                    "hybrid_score": 0,
-                    "source_video": 0,
-                    "video_title": 0
-                    # Keep name and label for deduplication in _clean_node_result
-                }
-            ))
-            
-            # Clean and deduplicate each node
-            cleaned_nodes = []
-            for node in raw_nodes:
-                cleaned = self._clean_node_result(node)
-                if cleaned:
-                    cleaned_nodes.append(cleaned)
-            
-            edges = list(self.edges.find({
-                "subject": {"$in": list(uris)}, 
-                "object": {"$in": list(uris)},
-                "predicate": {"$ne": "http://schema.org/name"}  # Filter out schema:name edges
-            }))
-            
-            # Clean MongoDB objects in edges
-            for edge in edges:
-                if "_id" in edge:
-                    edge["_id"] = str(edge["_id"])
-            
-            return {"nodes": cleaned_nodes, "edges": edges}
+            node_query, edge_pipeline = self.subgraph_queries(uris)
+            # Independent queries: run the edge aggregation while the node find is in flight
+            edges_future = self._io_pool.submit(lambda: list(self.edges.aggregate(edge_pipeline)))
+            raw_nodes = list(self.nodes.find(*node_query))
+            return self._assemble_subgraph(raw_nodes, edges_future.result())
             
         except Exception as e:
+            record_backend_failure(e)
             logger.error(f"Subgraph retrieval failed: {e}")
             return {"nodes": [], "edges": []}
 
+    @staticmethod
+    def subgraph_queries(uris: Set[str]) -> tuple:
+        """
+        Node query and edge pipeline for the subgraph induced by ``uris``.
+        
+        Both fetch only what to_turtle consumes: uri/label/name/type for nodes
+        (name is kept for label deduplication) and subject/predicate/object for
+        edges, grouped server-side so each triple comes back once.
+        
+        Returns:
+            Tuple of ((node filter, inclusion projection), edge aggregation pipeline)
+        """
+        if len(uris) > 500:
+            uris = set(list(uris)[:500])
+        uri_list = list(uris)
+        
+        node_query = (
+            {"uri": {"$in": uri_list}}, 
+            {"_id": 0, "uri": 1, "label": 1, "name": 1, "type": 1}
+        )
+        edge_pipeline = [
+            {
+                "$match": {
+                    "subject": {"$in": uri_list}, 
+                    "object": {"$in": uri_list},
+                    "predicate": {"$ne": "http://schema.org/name"}  # Filter out schema:name edges
+                }
+            },
+            {
+                "$group": {
+                    "_id": {"subject": "$subject", "predicate": "$predicate", "object": "$object"}
+                }
+            },
+            {
+                "$replaceRoot": {"newRoot": "$_id"}
+            }
+        ]
+        return node_query, edge_pipeline
+
+    def _assemble_subgraph(self, raw_nodes: List[Dict], edges: List[Dict]) -> Dict[str, Any]:
+        """Clean and deduplicate fetched nodes and edges into a subgraph dict."""
+        cleaned_nodes = []
+        for node in raw_nodes:
+            cleaned = self._clean_node_result(node)
+            if cleaned:
+                cleaned_nodes.append(cleaned)
+        
+        return {"nodes": cleaned_nodes, "edges": edges}
+
+    def _subgraph_writer(self, subgraph: Dict[str, Any]) -> TurtleWriter:
+        """Collect subgraph nodes and edges into a TurtleWriter."""
+        writer = TurtleWriter(SUBGRAPH_PREFIXES)
+        # Don't bind schema namespace to avoid automatic schema:name inference
+
+        # Add nodes - clean and deduplicated
+        for node in subgraph["nodes"]:
+            try:
+                uri = node["uri"]
+
+                # Debug: Check what fields are actually in the cleaned node
+                logger.debug(f"Node fields: {list(node.keys())} for {uri}")
+                if "name" in node:
+                    logger.warning(f"Found 'name' field in cleaned node: {node['name']}")
+
+                # Add single deduplicated label only (no schema:name duplication)
+                if "label" in node and node["label"]:
+                    writer.add(uri, RDFS_LABEL, TurtleLiteral(str(node["label"])))
+
+                # Add types
+                for t in node.get("type", []):
+                    writer.add(uri, RDF_TYPE, t)
+
+                # Explicitly do NOT add any name or schema:name properties
+
+            except Exception as e:
+                logger.warning(f"Skipping node: {e}")
+
+        # Add edges
+        for edge in subgraph["edges"]:
+            try:
+                obj = edge["object"]
+                writer.add(
+                    edge["subject"],
+                    edge["predicate"],
+                    obj if obj.startswith("http") else TurtleLiteral(obj)
+                )
+            except Exception as e:
+                logger.warning(f"Skipping edge: {e}")
+
+        return writer
+
+    def iter_turtle(self, subgraph: Dict[str, Any]) -> Iterator[str]:
+        """Stream a subgraph as Turtle: header, prefixes, then one chunk per subject."""
+        writer = self._subgraph_writer(subgraph)
+
+        header = f"# Generated {datetime.now(timezone.utc).isoformat()}Z\n"
+        header += f"# Nodes: {len(subgraph['nodes'])}, Edges: {len(subgraph['edges'])}\n"
+        header += f"# Clean output without ranking or video information\n\n"
+
+        yield header
+        yield from writer.iter_chunks()
+
     def to_turtle(self, subgraph: Dict[str, Any]) -> str:
         """Convert subgraph to clean Turtle format without ranking information."""
         try:
-            g = Graph()
-            
-            # Add prefixes
-            g.bind("bbp", "http://example.com/Indian-parliament-ontology#")
-            g.bind("lok", "http://example.com/Indian-parliament-ontology#")
-            g.bind("sess", "http://example.com/Indian-parliament-session/")
-            g.bind("rdfs", RDFS)
-            g.bind("rdf", RDF)
-            # Don't bind schema namespace to avoid automatic schema:name inference
+            return "".join(self.iter_turtle(subgraph))
+
+        except Exception as e:
+            logger.error(f"Turtle serialization failed: {e}")
+            return f"# Error: {str(e)}\n"
+
+    def iter_provenance_turtle(self, node_uris: List[str], include_transcript: bool = True) -> Iterator[str]:
+        """Stream provenance for the given nodes as Turtle chunks."""
+        logger.info(f"📚 Getting provenance for {len(node_uris)} nodes as Turtle")
+
+        uris = node_uris[:10]  # Limit to prevent explosion
+        docs = list(self.statements.aggregate(self._provenance_pipeline(uris, include_transcript))) if uris else []
+
+        writer = TurtleWriter(PROVENANCE_PREFIXES)
+        statements_by_uri = self._group_provenance(uris, docs)
+        for uri in uris:
+            self._add_provenance(writer, uri, statements_by_uri[uri], include_transcript)
+
+        yield from self._provenance_chunks(writer, node_uris, include_transcript)
+
+    def _provenance_pipeline(self, uris: List[str], include_transcript: bool,
+                             per_uri_limit: int = PROVENANCE_STATEMENTS_PER_NODE) -> List[Dict]:
+        """
+        One aggregation fetching up to ``per_uri_limit`` statements per URI and field.
+        
+        Each (URI, subject/predicate/object) pair is its own index-backed
+        branch with a server-side $limit, chained with $unionWith, so a popular
+        node with thousands of statements still returns at most 3 * limit
+        documents.  Transcripts are cut to 1000 code points in the database.
+        """
+        # Get related statements with minimal fields
+        projection = {
+            "subject": 1,
+            "predicate": 1, 
+            "object": 1,
+            "source_video": 1,
+            "video_title": 1,
+            "start_offset": 1,
+            "end_offset": 1
+        }
+
+        if include_transcript:
+            transcript = {"$ifNull": ["$transcript_text", ""]}
+            projection["transcript_text"] = {"$substrCP": [transcript, 0, 1000]}
+            projection["transcript_truncated"] = {"$gt": [{"$strLenCP": transcript}, 1000]}
+
+        branches = []
+        for uri in uris:
+            for field in ("subject", "predicate", "object"):
+                branches.append([
+                    {"$match": {field: uri}},
+                    {"$limit": per_uri_limit},
+                    {"$project": dict(projection, provenance_uri={"$literal": uri})}
+                ])
+
+        pipeline = list(branches[0])
+        for branch in branches[1:]:
+            pipeline.append({"$unionWith": {"coll": self.statements.name, "pipeline": branch}})
+        return pipeline
+
+    def _group_provenance(self, uris: List[str], docs: List[Dict],
+                          per_uri_limit: int = PROVENANCE_STATEMENTS_PER_NODE) -> Dict[str, List[Dict]]:
+        """Merge per-field branches into at most ``per_uri_limit`` distinct statements per URI."""
+        candidates: Dict[str, Dict[Any, Dict]] = {uri: {} for uri in uris}
+        for doc in docs:
+            # A statement can match on several fields; keep it once
+            candidates.setdefault(doc["provenance_uri"], {}).setdefault(doc["_id"], doc)
+        return {
+            uri: sorted(by_id.values(), key=lambda d: d["_id"])[:per_uri_limit]
+            for uri, by_id in candidates.items()
+        }
+
+    def _add_provenance(self, writer: TurtleWriter, uri: str, statements: List[Dict], include_transcript: bool):
+        """Add provenance triples for one node's statements to ``writer``."""
+        for i, stmt in enumerate(statements[:PROVENANCE_STATEMENTS_PER_NODE]):  # Limit statements per node
+            stmt_uri = f"{uri}/statement/{i}"
+
+            # Basic provenance
+            writer.add(stmt_uri, RDF_TYPE, PROV_NS + "Entity")
+            writer.add(stmt_uri, PROV_NS + "wasDerivedFrom", uri)
+            writer.add(stmt_uri, SCHEMA_NS + "about", uri)
+
+            # Video information directly in statement
+            video_id = stmt.get("source_video")
+            video_title = stmt.get("video_title")
+            start_time = stmt.get("start_offset")
+            end_time = stmt.get("end_offset")
+
+            if video_id:
+                # Create timestamped YouTube URL
+                if start_time is not None:
+                    timestamped_url = f"https://www.youtube.com/watch?v={video_id}&t={int(start_time)}s"
+                else:
+                    timestamped_url = f"https://www.youtube.com/watch?v={video_id}"
+
+                writer.add(stmt_uri, SCHEMA_NS + "url", TurtleLiteral(timestamped_url))
+
+                # Video title directly on statement
+                if video_title:
+                    writer.add(stmt_uri, SCHEMA_NS + "videoTitle", TurtleLiteral(str(video_title)))
+
+            # Timestamps as plain integers
+            if start_time is not None:
+                writer.add(stmt_uri, SCHEMA_NS + "startTime", integer_literal(start_time))
+
+            if end_time is not None:
+                writer.add(stmt_uri, SCHEMA_NS + "endTime", integer_literal(end_time))
+
+            # Transcript text if requested
+            if include_transcript and "transcript_text" in stmt:
+                transcript = stmt["transcript_text"]
+                if transcript and len(transcript.strip()) > 0:
+                    # Truncate very long transcripts (already cut server-side by the pipeline)
+                    if stmt.get("transcript_truncated") or len(transcript) > 1000:
+                        transcript = transcript[:1000] + "..."
+                    writer.add(stmt_uri, SCHEMA_NS + "text", TurtleLiteral(transcript))
+
+    def _provenance_chunks(self, writer: TurtleWriter, node_uris: List[str], include_transcript: bool) -> Iterator[str]:
+        """Provenance header followed by the writer's Turtle chunks."""
+        header = f"# Provenance information generated {datetime.now(timezone.utc).isoformat()}Z\n"
+        header += f"# Nodes: {len(node_uris)}, Include transcript: {include_transcript}\n"
+        if include_transcript:
+            header += f"# Transcript text included (truncated at 1000 chars)\n"
+        header += "\n"
+
+        yield header
+        yield from writer.iter_chunks()
+
+    def provenance_to_turtle(self, node_uris: List[str], include_transcript: bool = True) -> str:
+        """Get provenance information and return as clean Turtle format."""
+        try:
+            return "".join(self.iter_provenance_turtle(node_uris, include_transcript))
+
+        except Exception as e:
+            logger.error(f"❌ Provenance turtle generation failed: {e}")
+            return f"# Error: {str(e)}\n"
+
+    def search_turtle(self, search: str, query: str, hops: int, no_results: str, **search_args) -> str:
+        """
+        Seed search, hop expansion, subgraph fetch and Turtle serialization.
+        
+        Args:
+            search: Seed search method name ("hybrid_search", "authority_search", "topic_specific_search")
+            query: Free-text search string
+            hops: Number of relationship hops
+            no_results: Text returned when the seed search finds nothing
+            **search_args: Extra arguments for the seed search
+        """
+        seeds = getattr(self, search)(query, **search_args)
+        if not seeds:
+            return no_results
+        
+        seed_uris = {node["uri"] for node in seeds if "uri" in node}
+        all_uris = self.get_connected_nodes(seed_uris, hops)
+        subgraph = self.get_subgraph(all_uris)
+        return self.to_turtle(subgraph)
+
+    def database_stats(self) -> Dict[str, Any]:
+        """Ping latency and collection sizes for the health endpoints."""
+        start_time = time.time()
+        self.client.admin.command("ping", maxTimeMS=3000)
+        response_time = (time.time() - start_time) * 1000  # Convert to ms
+        return {
+            "response_time_ms": round(response_time, 2),
+            "node_count": self.nodes.estimated_document_count(),
+            "edge_count": self.edges.estimated_document_count(),
+        }
+
+    def close(self):
+        """Close database connection."""
+        if self.result_cache is not None:
+            self.result_cache.close()
+        self._io_pool.shutdown(wait=False)
+        if hasattr(self, 'client') and self.client:
+            self.client.close()
+
+# --------------------------------------------------------------------------- #
+#                        ASYNC QUERIER FOR CONCURRENT AGENTS                  #
+# --------------------------------------------------------------------------- #
+class AsyncGraphQuerier(EnhancedGraphQuerier):
+    """
+    Querier whose MCP-facing paths are coroutines on an async MongoDB driver.
+    
+    The synchronous client is kept for index builds, background refreshes and
+    the result cache version probe.  Tool calls use the async client, so
+    concurrent agents share the event loop instead of blocking it, and
+    independent lookups run concurrently with asyncio.gather.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.async_client = None
+        self._adb = None
+
+    @property
+    def adb(self):
+        """Async database handle, created lazily so the client binds to the server's event loop."""
+        if self._adb is None:
+            self.async_client = AsyncMongoClient(self.connection_string, **self._client_options())
+            self._adb = self.async_client[self.db.name]
+            logger.info(f"⚡ Async MongoDB client ready ({ASYNC_DRIVER}, pool {MONGODB_MAX_POOL_SIZE})")
+        return self._adb
+
+    async def _afind(self, collection: str, *args) -> List[Dict]:
+        return await to_list_async(self.adb[collection].find(*args))
+
+    async def _aaggregate(self, collection: str, pipeline: List[Dict]) -> List[Dict]:
+        return await to_list_async(self.adb[collection].aggregate(pipeline))
+
+    async def aembed_query(self, query: str) -> List[float]:
+        """Query embedding off the event loop (cache hits return almost immediately)."""
+        return await asyncio.to_thread(self.embed_query, query)
+
+    async def _alocal_index_available(self) -> bool:
+        # The staleness probe may hit MongoDB, so keep it off the event loop
+        return await asyncio.to_thread(self._local_index_available)
+
+    async def _afetch_nodes_in_order(self, uris: List[str]) -> List[Dict]:
+        if not uris:
+            return []
+        docs = await self._afind(
+            "nodes",
+            {"uri": {"$in": uris}},
+            {"uri": 1, "label": 1, "name": 1, "type": 1, "searchable_text": 1}
+        )
+        by_uri = {doc["uri"]: doc for doc in docs}
+        return [by_uri[uri] for uri in uris if uri in by_uri]
+
+    async def asearch_nodes(self, query: str, limit: int = 8) -> List[Dict]:
+        """Async counterpart of search_nodes."""
+        try:
+            logger.info(f"🔍 Vector search for: {query}")
+            query_embedding = await self.aembed_query(query)
             
-            # Add nodes - clean and deduplicated
-            for node in subgraph["nodes"]:
+            if await self._alocal_index_available():
+                vector_results = await asyncio.to_thread(self._local_vector_search_nodes, query_embedding, limit)
+            else:
                 try:
-                    uri = URIRef(node["uri"])
-                    
-                    # Debug: Check what fields are actually in the cleaned node
-                    logger.debug(f"Node fields: {list(node.keys())} for {uri}")
-                    if "name" in node:
-                        logger.warning(f"Found 'name' field in cleaned node: {node['name']}")
-                    
-                    # Add single deduplicated label only (no schema:name duplication)
-                    if "label" in node and node["label"]:
-                        g.add((uri, RDFS.label, Literal(str(node["label"]))))
-                    
-                    # Add types
-                    for t in node.get("type", []):
-                        g.add((uri, RDF.type, URIRef(t)))
-                    
-                    # Explicitly do NOT add any name or schema:name properties
-                    
+                    vector_results = await self._aaggregate("nodes", self._vector_pipeline(query_embedding, limit))
                 except Exception as e:
-                    logger.warning(f"Skipping node: {e}")
+                    record_backend_failure(e)
+                    if not self._local_index_available(allow_stale=True):
+                        raise
+                    logger.warning(f"⚠️  Atlas vector search unavailable ({e}), using local index")
+                    vector_results = await asyncio.to_thread(self._local_vector_search_nodes, query_embedding, limit)
             
-            # Add edges
-            for edge in subgraph["edges"]:
-                try:
-                    g.add((
-                        URIRef(edge["subject"]),
-                        URIRef(edge["predicate"]),
-                        URIRef(edge["object"]) if edge["object"].startswith("http") else Literal(edge["object"])
-                    ))
-                except Exception as e:
-                    logger.warning(f"Skipping edge: {e}")
+            cleaned_results = [c for c in (self._clean_node_result(r) for r in vector_results) if c]
+            logger.info(f"Vector search found {len(cleaned_results)} results")
+            return cleaned_results
+            
+        except Exception as e:
+            record_backend_failure(e)
+            logger.error(f"Vector search failed: {e}")
+            return []
+
+    async def _ascored_hybrid_search(self, query: str, limit: int, pagerank_weight: float,
+                                     min_pagerank_score: float) -> List[tuple]:
+        logger.info(f"🎯 Hybrid search for: '{query}' (PageRank weight: {pagerank_weight:.1%})")
+        query_embedding = await self.aembed_query(query)
+        
+        if await self._alocal_index_available():
+            results = await asyncio.to_thread(
+                self._local_hybrid_search, query_embedding, limit, pagerank_weight, min_pagerank_score
+            )
+            source = "local index"
+        else:
+            pipeline = self._scored_hybrid_pipeline(query_embedding, limit, pagerank_weight, min_pagerank_score)
+            try:
+                results = await self._aaggregate("nodes", pipeline)
+                source = "Atlas"
+            except OperationFailure as e:
+                record_backend_failure(e)
+                if not self._local_index_available(allow_stale=True):
+                    raise
+                logger.warning(f"⚠️  Atlas vector search unavailable ({e}), using local index")
+                results = await asyncio.to_thread(
+                    self._local_hybrid_search, query_embedding, limit, pagerank_weight, min_pagerank_score
+                )
+                source = "stale local index"
+        
+        scored_results = self._scored_results(results)
+        logger.info(f"🎯 Hybrid search found {len(scored_results)} results ({source})")
+        return scored_results
+
+    async def ahybrid_search(self, query: str, limit: int = 8, pagerank_weight: float = 0.3,
+                             min_pagerank_score: float = 0.00001) -> List[Dict]:
+        """Async counterpart of hybrid_search."""
+        try:
+            scored = await self._ascored_hybrid_search(query, limit, pagerank_weight, min_pagerank_score)
+            return [node for node, _ in scored]
             
-            header = f"# Generated {datetime.now(timezone.utc).isoformat()}Z\n"
-            header += f"# Nodes: {len(subgraph['nodes'])}, Edges: {len(subgraph['edges'])}\n"
-            header += f"# Clean output without ranking or video information\n\n"
+        except Exception as e:
+            record_backend_failure(e)
+            logger.error(f"❌ Hybrid search failed: {e}")
+            return await self.asearch_nodes(query, limit)
+
+    async def aauthority_search(self, query: str, limit: int = 8, min_pagerank_rank: int = 1000) -> List[Dict]:
+        """Async counterpart of authority_search."""
+        try:
+            logger.info(f"👑 Authority search for: '{query}' (max rank: {min_pagerank_rank})")
+            query_embedding = await self.aembed_query(query)
             
-            return header + g.serialize(format="turtle")
+            if await self._alocal_index_available():
+                uris = self._local_authority_uris(query_embedding, limit, min_pagerank_rank)
+                results = await self._afetch_nodes_in_order(uris)
+            else:
+                try:
+                    results = await self._aauthority_aggregate(query_embedding, limit, min_pagerank_rank)
+                except OperationFailure as e:
+                    record_backend_failure(e)
+                    if not self._local_index_available(allow_stale=True):
+                        raise
+                    logger.warning(f"⚠️  Atlas vector search unavailable ({e}), using local index")
+                    uris = self._local_authority_uris(query_embedding, limit, min_pagerank_rank)
+                    results = await self._afetch_nodes_in_order(uris)
+            
+            authority_results = [c for c in (self._clean_node_result(r) for r in results) if c]
+            logger.info(f"👑 Found {len(authority_results)} authoritative nodes")
+            return authority_results
             
         except Exception as e:
-            logger.error(f"Turtle serialization failed: {e}")
-            return f"# Error: {str(e)}\n"
+            record_backend_failure(e)
+            logger.error(f"❌ Authority search failed: {e}")
+            return []
 
-    def provenance_to_turtle(self, node_uris: List[str], include_transcript: bool = True) -> str:
-        """Get provenance information and return as clean Turtle format."""
+    async def _aauthority_aggregate(self, query_embedding: List[float], limit: int, max_rank: int) -> List[Dict]:
+        if self._rank_prefilter_supported:
+            try:
+                return await self._aaggregate(
+                    "nodes", self._authority_pipeline(query_embedding, limit, max_rank, True)
+                )
+            except OperationFailure as e:
+                if not _is_unindexed_filter_error(e):
+                    raise
+                logger.warning(f"⚠️  $vectorSearch rank pre-filter unavailable, using $match: {e}")
+                self._rank_prefilter_supported = False
+        
+        return await self._aaggregate("nodes", self._authority_pipeline(query_embedding, limit, max_rank, False))
+
+    async def atopic_specific_search(self, query: str, limit: int = 8, topic_expansion: int = 50) -> List[Dict]:
+        """Async counterpart of topic_specific_search."""
         try:
-            logger.info(f"📚 Getting provenance for {len(node_uris)} nodes as Turtle")
+            logger.info(f"🎯 Topic-specific search for: '{query}'")
+            scored_topic_nodes = await self._ascored_hybrid_search(
+                query, limit=topic_expansion, pagerank_weight=0.1, min_pagerank_score=0.00001
+            )
             
-            g = Graph()
+            if not scored_topic_nodes:
+                logger.warning("No topic nodes found")
+                return []
             
-            # Add prefixes
-            g.bind("bbp", "http://example.com/Indian-parliament-ontology#")
-            g.bind("prov", "http://www.w3.org/ns/prov#")
-            g.bind("schema", "http://schema.org/")
-            g.bind("xsd", "http://www.w3.org/2001/XMLSchema#")
-            g.bind("rdfs", RDFS)
-            g.bind("lok", "http://example.com/Indian-parliament-ontology#")
-            PROV = Namespace("http://www.w3.org/ns/prov#")
-            SCHEMA = Namespace("http://schema.org/")
+            similarity_scores = {node['uri']: score for node, score in scored_topic_nodes}
+            topic_uris = set(similarity_scores)
             
-            for uri in node_uris[:10]:  # Limit to prevent explosion
-                try:
-                    node_uri = URIRef(uri)
-                    
-                    # Get related statements with minimal fields
-                    projection = {
-                        "subject": 1,
-                        "predicate": 1, 
-                        "object": 1,
-                        "source_video": 1,
-                        "video_title": 1,
-                        "start_offset": 1,
-                        "end_offset": 1
-                    }
-                    
-                    if include_transcript:
-                        projection["transcript_text"] = 1
-                    
-                    statements = list(self.statements.find({
-                        "$or": [
-                            {"subject": uri},
-                            {"predicate": uri}, 
-                            {"object": uri}
-                        ]
-                    }, projection))
-                    
-                    # Process statements
-                    for i, stmt in enumerate(statements[:5]):  # Limit statements per node
-                        stmt_uri = URIRef(f"{uri}/statement/{i}")
-                        
-                        # Basic provenance
-                        g.add((stmt_uri, RDF.type, PROV.Entity))
-                        g.add((stmt_uri, PROV.wasDerivedFrom, node_uri))
-                        g.add((stmt_uri, SCHEMA.about, node_uri))
-                        
-                        # Video information directly in statement
-                        video_id = stmt.get("source_video")
-                        video_title = stmt.get("video_title")
-                        start_time = stmt.get("start_offset")
-                        end_time = stmt.get("end_offset")
-                        
-                        if video_id:
-                            # Create timestamped YouTube URL
-                            if start_time is not None:
-                                timestamped_url = f"https://www.youtube.com/watch?v={video_id}&t={int(start_time)}s"
-                            else:
-                                timestamped_url = f"https://www.youtube.com/watch?v={video_id}"
-                            
-                            g.add((stmt_uri, SCHEMA.url, Literal(timestamped_url)))
-                            
-                            # Video title directly on statement
-                            if video_title:
-                                g.add((stmt_uri, SCHEMA.videoTitle, Literal(video_title)))
-                        
-                        # Timestamps as plain integers
-                        if start_time is not None:
-                            g.add((stmt_uri, SCHEMA.startTime, Literal(int(start_time))))
-                        
-                        if end_time is not None:
-                            g.add((stmt_uri, SCHEMA.endTime, Literal(int(end_time))))
-                        
-                        # Transcript text if requested
-                        if include_transcript and "transcript_text" in stmt:
-                            transcript = stmt["transcript_text"]
-                            if transcript and len(transcript.strip()) > 0:
-                                # Truncate very long transcripts
-                                if len(transcript) > 1000:
-                                    transcript = transcript[:1000] + "..."
-                                g.add((stmt_uri, SCHEMA.text, Literal(transcript)))
-                        
-                except Exception as e:
-                    logger.warning(f"Skipping provenance for {uri}: {e}")
+            try:
+                edges = await self._afind("edges", *self._topic_edge_query(topic_uris))
+            except Exception as e:
+                record_backend_failure(e)
+                logger.error(f"❌ Topic PageRank calculation failed: {e}")
+                edges = None
+            topic_pagerank_scores = self._topic_pagerank_from_edges(
+                topic_uris, edges, 0.85, 50, similarity_scores
+            ) if edges is not None else {}
+            
+            final_results = self._rank_topic_nodes(scored_topic_nodes, topic_pagerank_scores, limit)
+            logger.info(f"🎯 Topic-specific search found {len(final_results)} results")
+            return final_results
+            
+        except Exception as e:
+            record_backend_failure(e)
+            logger.error(f"❌ Topic-specific search failed: {e}")
+            return await self.ahybrid_search(query, limit)
+
+    async def aget_connected_nodes(self, uris: Set[str], hops: int = 1) -> Set[str]:
+        """Async counterpart of get_connected_nodes (edge queries on the async client, CSR in a thread)."""
+        try:
+            if isinstance(self.traversal, EdgeQueryTraversal):
+                return await self.traversal.expand_async(
+                    self.adb.nodes, self.adb.edges, uris, hops=max(0, hops), fanout=GRAPH_HOP_FANOUT, max_nodes=DEFAULT_MAX_NODES
+                )
+            return await asyncio.to_thread(
+                self.traversal.expand, uris, max(0, hops), GRAPH_HOP_FANOUT, DEFAULT_MAX_NODES
+            )
+            
+        except Exception as e:
+            record_backend_failure(e)
+            logger.error(f"Graph traversal failed: {e}")
+            return uris
+
+    async def aget_subgraph(self, uris: Set[str]) -> Dict[str, Any]:
+        """Async counterpart of get_subgraph; node and edge fetches run concurrently."""
+        try:
+            node_query, edge_pipeline = self.subgraph_queries(uris)
+            raw_nodes, edges = await asyncio.gather(
+                self._afind("nodes", *node_query),
+                self._aaggregate("edges", edge_pipeline)
+            )
+            return self._assemble_subgraph(raw_nodes, edges)
             
-            header = f"# Provenance information generated {datetime.now(timezone.utc).isoformat()}Z\n"
-            header += f"# Nodes: {len(node_uris)}, Include transcript: {include_transcript}\n"
-            if include_transcript:
-                header += f"# Transcript text included (truncated at 1000 chars)\n"
-            header += "\n"
+        except Exception as e:
+            record_backend_failure(e)
+            logger.error(f"Subgraph retrieval failed: {e}")
+            return {"nodes": [], "edges": []}
+
+    async def asearch_turtle(self, search: str, query: str, hops: int, no_results: str, **search_args) -> str:
+        """Async counterpart of search_turtle."""
+        seeds = await getattr(self, "a" + search)(query, **search_args)
+        if not seeds:
+            return no_results
+        
+        seed_uris = {node["uri"] for node in seeds if "uri" in node}
+        all_uris = await self.aget_connected_nodes(seed_uris, hops)
+        subgraph = await self.aget_subgraph(all_uris)
+        # Serialization is CPU-bound; keep the loop responsive for large subgraphs
+        return await asyncio.to_thread(self.to_turtle, subgraph)
+
+    async def aprovenance_to_turtle(self, node_uris: List[str], include_transcript: bool = True) -> str:
+        """Async counterpart of provenance_to_turtle."""
+        try:
+            logger.info(f"📚 Getting provenance for {len(node_uris)} nodes as Turtle")
+            uris = node_uris[:10]  # Limit to prevent explosion
+            docs = await self._aaggregate("statements", self._provenance_pipeline(uris, include_transcript)) if uris else []
+            
+            writer = TurtleWriter(PROVENANCE_PREFIXES)
+            statements_by_uri = self._group_provenance(uris, docs)
+            for uri in uris:
+                self._add_provenance(writer, uri, statements_by_uri[uri], include_transcript)
             
-            return header + g.serialize(format="turtle")
+            return "".join(self._provenance_chunks(writer, node_uris, include_transcript))
             
         except Exception as e:
             logger.error(f"❌ Provenance turtle generation failed: {e}")
             return f"# Error: {str(e)}\n"
 
+    async def adatabase_stats(self) -> Dict[str, Any]:
+        """Async counterpart of database_stats; collection counts run concurrently."""
+        db = self.adb
+        start_time = time.time()
+        await self.async_client.admin.command("ping", maxTimeMS=3000)
+        response_time = (time.time() - start_time) * 1000
+        node_count, edge_count = await asyncio.gather(
+            db.nodes.estimated_document_count(),
+            db.edges.estimated_document_count()
+        )
+        return {
+            "response_time_ms": round(response_time, 2),
+            "node_count": node_count,
+            "edge_count": edge_count,
+        }
+
+    async def aclose(self):
+        """Close the async client; must run on the event loop the client is bound to."""
+        client, self.async_client, self._adb = self.async_client, None, None
+        if client is None:
+            return
+        if ASYNC_DRIVER == "motor":
+            client.close()
+        else:
+            # pymongo's async close() is a coroutine
+            await client.close()
+        logger.info("🔌 Async MongoDB client closed")
+
     def close(self):
-        """Close database connection."""
-        if hasattr(self, 'client') and self.client:
-            self.client.close()
+        """Close database connections (call aclose() first on the server's event loop)."""
+        if self.async_client is not None:
+            # Off the event loop only Motor can still be closed; pymongo's client is dropped
+            if ASYNC_DRIVER == "motor":
+                self.async_client.close()
+            self.async_client = None
+            self._adb = None
+        super().close()
 
 # --------------------------------------------------------------------------- #
 #                              ENHANCED MCP SERVER                            #
@@ -746,12 +1466,71 @@ class EnhancedGraphQuerier:
 
 # Global instance
 _querier: Optional[EnhancedGraphQuerier] = None
+# Set by start_background_initialization(); resolves to the querier once it is built
+_querier_future: Optional[Future] = None
+_querier_lock = threading.Lock()
 
-def get_querier() -> EnhancedGraphQuerier:
+def _create_querier() -> EnhancedGraphQuerier:
+    """Build the global querier (once)."""
     global _querier
-    if _querier is None:
-        _querier = EnhancedGraphQuerier()
-    return _querier
+    with _querier_lock:
+        if _querier is None:
+            with cold_start_phase("querier_init"):
+                if MONGODB_ASYNC and AsyncMongoClient is not None:
+                    _querier = AsyncGraphQuerier()
+                else:
+                    if MONGODB_ASYNC:
+                        logger.warning("⚠️  No async MongoDB driver installed (pymongo>=4.10 or motor), tools run in threads")
+                    _querier = EnhancedGraphQuerier()
+        return _querier
+
+def get_querier() -> EnhancedGraphQuerier:
+    if _querier is not None:
+        return _querier
+    if _querier_future is not None:
+        # Background initialization in progress: wait for it instead of racing it
+        return _querier_future.result(timeout=MODEL_READY_TIMEOUT)
+    return _create_querier()
+
+async def aget_querier() -> EnhancedGraphQuerier:
+    """get_querier() that never blocks the event loop while initialization is running."""
+    if _querier is not None:
+        return _querier
+    if _querier_future is not None:
+        return await asyncio.wait_for(asyncio.wrap_future(_querier_future), timeout=MODEL_READY_TIMEOUT)
+    return await asyncio.to_thread(_create_querier)
+
+def cold_start_report() -> Dict[str, Any]:
+    """Startup mode, readiness flags and per-phase timings for the health endpoints."""
+    q = _querier
+    return {
+        "mode": "lazy" if LAZY_STARTUP else "eager",
+        "querier_ready": q is not None,
+        "model_ready": q is not None and q.is_model_ready(),
+        "embedding_model": EMBEDDING_MODEL,
+        "embedding_backend": EMBEDDING_BACKEND,
+        "phases_ms": dict(COLD_START_TIMINGS),
+    }
+
+async def run_search_turtle(search: str, query: str, hops: int, no_results: str, **search_args) -> str:
+    """Run a seeded Turtle search on the async path, or in a worker thread with the sync driver."""
+    q = await aget_querier()
+    if isinstance(q, AsyncGraphQuerier):
+        return await q.asearch_turtle(search, query, hops, no_results, **search_args)
+    # Keep the event loop free while the synchronous driver works
+    return await asyncio.to_thread(q.search_turtle, search, query, hops, no_results, **search_args)
+
+async def run_provenance_turtle(uris: List[str], include_transcript: bool) -> str:
+    q = await aget_querier()
+    if isinstance(q, AsyncGraphQuerier):
+        return await q.aprovenance_to_turtle(uris, include_transcript)
+    return await asyncio.to_thread(q.provenance_to_turtle, uris, include_transcript)
+
+async def run_database_stats() -> Dict[str, Any]:
+    q = await aget_querier()
+    if isinstance(q, AsyncGraphQuerier):
+        return await q.adatabase_stats()
+    return await asyncio.to_thread(q.database_stats)
 
 # Create MCP server
 mcp = FastMCP(
@@ -764,38 +1543,87 @@ mcp = FastMCP(
     }
 )
 
+async def cached_tool_result(tool: str, arguments: Dict[str, Any], compute) -> str:
+    """
+    Serve a tool call from the result cache, computing and storing it on a miss.
+
+    Args:
+        tool: Tool name (part of the cache key)
+        arguments: Clamped, normalized tool arguments
+        compute: Zero-argument coroutine function producing the Turtle result
+
+    Returns:
+        Turtle text; error results and results computed around a backend failure are returned but never cached
+    """
+    cache = (await aget_querier()).result_cache
+    # Version probes and the SQLite tier are blocking, so they run off the event loop
+    cached = await asyncio.to_thread(cache.get, tool, arguments)
+    if cached is not None:
+        logger.info(f"⚡ {tool} served from result cache")
+        return cached
+
+    # Read the version before computing so a concurrent graph update can't be masked
+    version = await asyncio.to_thread(cache.current_version)
+    # Query paths fall back to partial or empty results on backend errors; those must not be cached
+    failures: List[str] = []
+    token = _BACKEND_FAILURES.set(failures)
+    try:
+        result = await compute()
+    finally:
+        _BACKEND_FAILURES.reset(token)
+    if failures:
+        logger.warning(f"⚠️  {tool} result not cached after {len(failures)} backend failure(s)")
+    elif not result.startswith("# Error"):
+        await asyncio.to_thread(cache.put, tool, arguments, result, version)
+    return result
+
 # Add HTTP health check endpoint using FastMCP's custom_route
 @mcp.custom_route("/health", methods=["GET"])
 async def health_endpoint(request: Request) -> JSONResponse:
     """HTTP health check endpoint for Google Cloud Run and load balancers."""
+    if _querier is None and _querier_future is not None and not _querier_future.done():
+        # Lazy startup: report liveness right away while initialization runs in the background
+        return JSONResponse(
+            status_code=200,
+            content={
+                "status": "starting",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "cold_start": cold_start_report()
+            }
+        )
+    
     try:
         # Get database connection
-        q = get_querier()
-        
-        # Test database connectivity with timeout
-        start_time = time.time()
-        q.client.admin.command("ping", maxTimeMS=3000)
-        response_time = (time.time() - start_time) * 1000  # Convert to ms
+        q = await aget_querier()
         
-        # Quick database stats to verify collections are accessible
-        node_count = q.nodes.estimated_document_count()
-        edge_count = q.edges.estimated_document_count()
+        # Ping and quick collection stats without blocking the event loop
+        db_stats = await run_database_stats()
+        response_time = db_stats["response_time_ms"]
+        node_count = db_stats["node_count"]
+        edge_count = db_stats["edge_count"]
         
         health_data = {
-            "status": "healthy",
+            "status": "healthy" if q.is_model_ready() else "starting",
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "database": {
                 "connected": True,
-                "response_time_ms": round(response_time, 2),
+                "async_driver": ASYNC_DRIVER if isinstance(q, AsyncGraphQuerier) else None,
+                "max_pool_size": MONGODB_MAX_POOL_SIZE,
+                "response_time_ms": response_time,
                 "collections_accessible": True,
                 "node_count": node_count,
                 "edge_count": edge_count
             },
             "services": {
-                "vector_search": True,  # Always true since it's mandatory
+                "vector_search": q.is_model_ready(),  # Mandatory; false only while the model loads
                 "pagerank": node_count > 0,  # Assume PageRank available if nodes exist
-                "hybrid_search": node_count > 0  # Always available when nodes exist
+                "hybrid_search": node_count > 0,  # Always available when nodes exist
+                "local_vector_index": len(q.vector_index) if q.vector_index is not None else None
             },
+            "query_embedding_cache": q.query_embeddings.stats() if q.query_embeddings else None,
+            "query_encoder": q.query_encoder.stats() if q.query_encoder else None,
+            "result_cache": q.result_cache.stats(),
+            "cold_start": cold_start_report(),
             "version": "clean_output_v1.0"
         }
         
@@ -815,7 +1643,8 @@ async def health_endpoint(request: Request) -> JSONResponse:
                 "connected": False,
                 "error": "Database connectivity issue"
             },
-            "message": "Service temporarily unavailable"
+            "message": "Service temporarily unavailable",
+            "cold_start": cold_start_report()
         }
         
         return JSONResponse(
@@ -824,7 +1653,7 @@ async def health_endpoint(request: Request) -> JSONResponse:
         )
 
 @mcp.tool()
-def hybrid_search_turtle(query: str, hops: int = 1, limit: int = 5, 
+async def hybrid_search_turtle(query: str, hops: int = 1, limit: int = 5, 
                         pagerank_weight: float = 0.3) -> str:
     """
     Hybrid search combining PageRank importance with semantic similarity.
@@ -850,16 +1679,18 @@ def hybrid_search_turtle(query: str, hops: int = 1, limit: int = 5,
         
         logger.info(f"🎯 Hybrid search: '{query}' (PageRank: {pagerank_weight:.1%}, hops: {hops})")
         
-        q = get_querier()
-        seeds = q.hybrid_search(query, limit, pagerank_weight)
-        
-        if not seeds:
-            return f"# No results found for hybrid search: {query}\n"
+        async def compute() -> str:
+            return await run_search_turtle(
+                "hybrid_search", query, hops, f"# No results found for hybrid search: {query}\n",
+                limit=limit, pagerank_weight=pagerank_weight
+            )
         
-        seed_uris = {node["uri"] for node in seeds if "uri" in node}
-        all_uris = q.get_connected_nodes(seed_uris, hops)
-        subgraph = q.get_subgraph(all_uris)
-        result = q.to_turtle(subgraph)
+        result = await cached_tool_result("hybrid_search_turtle", {
+            "query": normalize_query_text(query),
+            "hops": hops,
+            "limit": limit,
+            "pagerank_weight": round(pagerank_weight, 4),
+        }, compute)
         
         elapsed = (datetime.now() - start_time).total_seconds()
         logger.info(f"✅ Hybrid search completed in {elapsed:.2f}s")
@@ -871,7 +1702,7 @@ def hybrid_search_turtle(query: str, hops: int = 1, limit: int = 5,
         return f"# Error: Hybrid search failed - {str(e)}\n"
 
 @mcp.tool()
-def authority_search_turtle(query: str, hops: int = 1, limit: int = 5, 
+async def authority_search_turtle(query: str, hops: int = 1, limit: int = 5, 
                            max_rank: int = 1000) -> str:
     """
     Search for authoritative nodes (high PageRank) related to the query.
@@ -897,16 +1728,18 @@ def authority_search_turtle(query: str, hops: int = 1, limit: int = 5,
         
         logger.info(f"👑 Authority search: '{query}' (max rank: {max_rank}, hops: {hops})")
         
-        q = get_querier()
-        seeds = q.authority_search(query, limit, max_rank)
-        
-        if not seeds:
-            return f"# No authoritative results found for: {query}\n"
+        async def compute() -> str:
+            return await run_search_turtle(
+                "authority_search", query, hops, f"# No authoritative results found for: {query}\n",
+                limit=limit, min_pagerank_rank=max_rank
+            )
         
-        seed_uris = {node["uri"] for node in seeds if "uri" in node}
-        all_uris = q.get_connected_nodes(seed_uris, hops)
-        subgraph = q.get_subgraph(all_uris)
-        result = q.to_turtle(subgraph)
+        result = await cached_tool_result("authority_search_turtle", {
+            "query": normalize_query_text(query),
+            "hops": hops,
+            "limit": limit,
+            "max_rank": max_rank,
+        }, compute)
         
         elapsed = (datetime.now() - start_time).total_seconds()
         logger.info(f"✅ Authority search completed in {elapsed:.2f}s")
@@ -918,7 +1751,7 @@ def authority_search_turtle(query: str, hops: int = 1, limit: int = 5,
         return f"# Error: Authority search failed - {str(e)}\n"
 
 @mcp.tool()
-def topic_search_turtle(query: str, hops: int = 1, limit: int = 5) -> str:
+async def topic_search_turtle(query: str, hops: int = 1, limit: int = 5) -> str:
     """
     Search for nodes important within the specific topic domain of the query.
     Returns clean Turtle format without ranking information.
@@ -941,16 +1774,17 @@ def topic_search_turtle(query: str, hops: int = 1, limit: int = 5) -> str:
         
         logger.info(f"🎯 Topic search: '{query}' (hops: {hops})")
         
-        q = get_querier()
-        seeds = q.topic_specific_search(query, limit)
-        
-        if not seeds:
-            return f"# No topic-specific results found for: {query}\n"
+        async def compute() -> str:
+            return await run_search_turtle(
+                "topic_specific_search", query, hops, f"# No topic-specific results found for: {query}\n",
+                limit=limit
+            )
         
-        seed_uris = {node["uri"] for node in seeds if "uri" in node}
-        all_uris = q.get_connected_nodes(seed_uris, hops)
-        subgraph = q.get_subgraph(all_uris)
-        result = q.to_turtle(subgraph)
+        result = await cached_tool_result("topic_search_turtle", {
+            "query": normalize_query_text(query),
+            "hops": hops,
+            "limit": limit,
+        }, compute)
         
         elapsed = (datetime.now() - start_time).total_seconds()
         logger.info(f"✅ Topic search completed in {elapsed:.2f}s")
@@ -962,7 +1796,7 @@ def topic_search_turtle(query: str, hops: int = 1, limit: int = 5) -> str:
         return f"# Error: Topic search failed - {str(e)}\n"
 
 @mcp.tool()
-def search_graph_turtle(query: str, hops: int = 1, limit: int = 3) -> str:
+async def search_graph_turtle(query: str, hops: int = 1, limit: int = 3) -> str:
     """
     Standard search (backward compatibility) - now uses hybrid search by default.
     Returns clean Turtle format without ranking information.
@@ -976,10 +1810,10 @@ def search_graph_turtle(query: str, hops: int = 1, limit: int = 3) -> str:
         Clean Turtle-formatted RDF data
     """
     # Use hybrid search as the new default with balanced weights
-    return hybrid_search_turtle(query, hops, limit, pagerank_weight=0.4)
+    return await hybrid_search_turtle(query, hops, limit, pagerank_weight=0.4)
 
 @mcp.tool()
-def get_provenance_turtle(node_uris: str, include_transcript: bool = True) -> str:
+async def get_provenance_turtle(node_uris: str, include_transcript: bool = True) -> str:
     """
     Get provenance information for specific nodes in clean Turtle format.
     
@@ -1005,8 +1839,11 @@ def get_provenance_turtle(node_uris: str, include_transcript: bool = True) -> st
         
         logger.info(f"📚 Getting provenance for {len(uris)} nodes as Turtle (transcript: {include_transcript})")
         
-        q = get_querier()
-        result = q.provenance_to_turtle(uris, include_transcript)
+        include_transcript = bool(include_transcript)
+        result = await cached_tool_result("get_provenance_turtle", {
+            "uris": uris,
+            "include_transcript": include_transcript,
+        }, lambda: run_provenance_turtle(uris, include_transcript))
         
         logger.info(f"✅ Provenance turtle generated for {len(uris)} nodes")
         return result
@@ -1016,35 +1853,38 @@ def get_provenance_turtle(node_uris: str, include_transcript: bool = True) -> st
         return f"# Error: Provenance generation failed - {str(e)}\n"
 
 @mcp.tool()
-def health_check() -> str:
+async def health_check() -> str:
     """Check server and database health - can be called via MCP or used for monitoring."""
     try:
         logger.info("🏥 Running health check")
-        q = get_querier()
-        
-        # Test database connectivity with timeout
-        start_time = time.time()
-        q.client.admin.command("ping", maxTimeMS=3000)
-        response_time = (time.time() - start_time) * 1000
+        q = await aget_querier()
         
-        # Quick database stats
-        node_count = q.nodes.estimated_document_count()
-        edge_count = q.edges.estimated_document_count()
+        # Ping and quick database stats
+        db_stats = await run_database_stats()
+        node_count = db_stats["node_count"]
+        edge_count = db_stats["edge_count"]
         
         result = {
-            "status": "healthy",
+            "status": "healthy" if q.is_model_ready() else "starting",
             "time": datetime.now(timezone.utc).isoformat(),
             "database": {
                 "connected": True,
-                "response_time_ms": round(response_time, 2),
+                "async_driver": ASYNC_DRIVER if isinstance(q, AsyncGraphQuerier) else None,
+                "max_pool_size": MONGODB_MAX_POOL_SIZE,
+                "response_time_ms": db_stats["response_time_ms"],
                 "node_count": node_count,
                 "edge_count": edge_count
             },
             "services": {
-                "vector_search": True,  # Always true since it's mandatory
+                "vector_search": q.is_model_ready(),
                 "pagerank": node_count > 0,
-                "hybrid_search": node_count > 0
+                "hybrid_search": node_count > 0,
+                "local_vector_index": len(q.vector_index) if q.vector_index is not None else None
             },
+            "query_embedding_cache": q.query_embeddings.stats() if q.query_embeddings else None,
+            "query_encoder": q.query_encoder.stats() if q.query_encoder else None,
+            "result_cache": q.result_cache.stats(),
+            "cold_start": cold_start_report(),
             "version": "clean_output_v1.0"
         }
         
@@ -1071,6 +1911,22 @@ def cleanup():
         _querier.close()
         _querier = None
 
+async def acleanup():
+    """Clean up resources on the server's event loop, where the async client has to be closed."""
+    if isinstance(_querier, AsyncGraphQuerier):
+        try:
+            await _querier.aclose()
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to close async MongoDB client: {e}")
+    cleanup()
+
+async def serve(**transport_kwargs):
+    """Run the MCP server and release the async client on the same loop once it stops."""
+    try:
+        await mcp.run_async(**transport_kwargs)
+    finally:
+        await acleanup()
+
 import signal
 import atexit
 
@@ -1082,7 +1938,7 @@ async def initialize_with_retry(max_retries: int = 3, delay: float = 1.0):
     for attempt in range(max_retries):
         try:
             logger.info(f"🔄 Database initialization attempt {attempt + 1}/{max_retries}")
-            querier = get_querier()
+            querier = _create_querier()
             logger.info("✅ Enhanced database connection established")
             return querier
         except Exception as e:
@@ -1094,6 +1950,27 @@ async def initialize_with_retry(max_retries: int = 3, delay: float = 1.0):
             else:
                 raise
 
+def start_background_initialization() -> Future:
+    """Initialize the querier on a background thread; tools and /health wait on the returned future."""
+    global _querier_future
+    future: Future = Future()
+    
+    def _run():
+        try:
+            future.set_result(asyncio.run(initialize_with_retry()))
+            COLD_START_TIMINGS["querier_ready_since_start"] = round((time.perf_counter() - _PROCESS_START) * 1000, 1)
+        except Exception as e:
+            logger.error(f"❌ Background initialization failed: {e}")
+            # Forget the failed attempt so the next tool call or /health probe initializes again
+            global _querier_future
+            if _querier_future is future:
+                _querier_future = None
+            future.set_exception(e)
+    
+    _querier_future = future
+    threading.Thread(target=_run, name="querier-init", daemon=True).start()
+    return future
+
 if __name__ == "__main__":
     # Get port from environment (Cloud Run compatibility)
     port = int(os.getenv("PORT", "8080"))
@@ -1105,18 +1982,24 @@ if __name__ == "__main__":
     logger.info(f"🏥 Health check available at http://{host}:{port}/health")
     
     try:
-        # Initialize database connection with retries
-        asyncio.run(initialize_with_retry())
+        if LAZY_STARTUP:
+            # Bind the port first; the database, model and index load in the background
+            logger.info("💤 Lazy startup: initializing in the background")
+            start_background_initialization()
+        else:
+            # Initialize database connection with retries
+            asyncio.run(initialize_with_retry())
+            COLD_START_TIMINGS["querier_ready_since_start"] = round((time.perf_counter() - _PROCESS_START) * 1000, 1)
         
         logger.info("🌐 Starting enhanced MCP server...")
         
         # Use FastMCP's built-in server with custom health route
-        mcp.run(
+        asyncio.run(serve(
             transport="sse",
             host=host,
             port=port,
             log_level="info",
-        )
+        ))
             
     except KeyboardInterrupt:
         logger.info("👋 Shutting down gracefully")
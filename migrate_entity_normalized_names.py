@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Backfill ``normalized_name`` on Knowledge Graph Entities
+
+The KG extractor stores ``normalized_name`` (see
+``entity_index.normalize_entity_name``) on every entity it saves and matches
+entities exactly on ``(entity_type, normalized_name)``.  This one-time
+migration adds the field to entities saved before it existed and builds the
+compound index.  With ``--all`` every entity is recomputed, e.g. after the
+abbreviation list changes; only entities whose value changes are written.
+
+Requirements:
+- pymongo
+- python-dotenv (optional, for environment variables)
+
+Usage:
+    python migrate_entity_normalized_names.py --database parliamentary_graph2 [--all] [--batch-size N]
+"""
+
+import sys
+import os
+import time
+import argparse
+
+try:
+    from pymongo import MongoClient, UpdateOne
+    from pymongo.errors import ConnectionFailure
+    from dotenv import load_dotenv
+except ImportError as e:
+    print(f"Missing required package: {e}")
+    print("Please install required packages:")
+    print("pip install pymongo python-dotenv")
+    sys.exit(1)
+
+from entity_index import normalize_entity_name
+
+# Load environment variables
+load_dotenv()
+
+
+def backfill_normalized_names(entities, recompute_all: bool = False, batch_size: int = 1000) -> int:
+    """
+    Set ``normalized_name`` on entities and ensure the (entity_type, normalized_name) index.
+
+    Args:
+        entities: pymongo entities collection
+        recompute_all: Recompute for every entity, not only those missing the field
+        batch_size: Number of UpdateOne operations per bulk_write
+
+    Returns:
+        Number of entities updated
+    """
+    started = time.time()
+    query = {} if recompute_all else {"normalized_name": {"$exists": False}}
+    total = entities.count_documents(query)
+    print(f"🔤 {total:,} entities to normalize")
+
+    updated = 0
+    operations = []
+    for entity in entities.find(query, {"entity_name": 1, "normalized_name": 1}).batch_size(batch_size):
+        normalized_name = normalize_entity_name(entity.get("entity_name", ""))
+        if entity.get("normalized_name") == normalized_name:
+            continue
+        operations.append(UpdateOne({"_id": entity["_id"]}, {"$set": {"normalized_name": normalized_name}}))
+        if len(operations) >= batch_size:
+            updated += entities.bulk_write(operations, ordered=False).modified_count
+            operations = []
+            print(f"  📊 {updated:,}/{total:,} updated...")
+    if operations:
+        updated += entities.bulk_write(operations, ordered=False).modified_count
+
+    entities.create_index([("entity_type", 1), ("normalized_name", 1)])
+    print(f"✅ Normalized {updated:,} entities in {time.time() - started:.1f}s; "
+          f"(entity_type, normalized_name) index ready")
+    return updated
+
+
+def main():
+    """Main function to run the script."""
+    parser = argparse.ArgumentParser(description="Backfill normalized_name on knowledge graph entities")
+    parser.add_argument("--database", default="parliamentary_graph2", help="MongoDB database name")
+    parser.add_argument("--all", action="store_true",
+                        help="Recompute normalized_name for every entity (after normalizer changes)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Operations per bulk_write batch")
+
+    args = parser.parse_args()
+
+    connection_string = os.getenv('MONGODB_CONNECTION_STRING')
+    if not connection_string:
+        print("Configuration error: MONGODB_CONNECTION_STRING environment variable not set")
+        sys.exit(1)
+
+    try:
+        client = MongoClient(connection_string)
+        client.admin.command('ping')
+    except ConnectionFailure as e:
+        print(f"Error: Failed to connect to MongoDB: {e}")
+        sys.exit(1)
+
+    try:
+        backfill_normalized_names(client[args.database].entities, recompute_all=args.all, batch_size=args.batch_size)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
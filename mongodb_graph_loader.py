@@ -10,25 +10,32 @@ Requirements:
 - pymongo
 - rdflib
 - python-dotenv (optional, for environment variables)
-- sentence-transformers (for generating embeddings)
+- sentence-transformers, or onnxruntime + tokenizers (for generating embeddings, see embedding_backend.py)
 
 Usage:
-    python mongodb_graph_loader.py --database parliamentary_graph [--skip-embeddings] [--limit N] [--video-id VIDEO_ID]
+    python mongodb_graph_loader.py --database parliamentary_graph [--skip-embeddings] [--embedding-batch-size N] [--write-batch-size N] [--workers N] [--reprocess-mode diff|reload] [--limit N] [--video-id VIDEO_ID] [--update-pagerank]
+    python mongodb_graph_loader.py --watch [--watch-mode auto|change-stream|poll] [--debounce SECONDS] [--queue-size N] [--poll-interval SECONDS]
 """
 
 import sys
 import os
 import json
 import argparse
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Union
 from urllib.parse import urlparse
 import hashlib
 from datetime import datetime, timezone
 import re
+import time
+import queue
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
-    from pymongo import MongoClient, ASCENDING, TEXT
-    from pymongo.errors import ConnectionFailure, DuplicateKeyError
+    from pymongo import MongoClient, ASCENDING, TEXT, UpdateOne
+    from pymongo.errors import ConnectionFailure
     from rdflib import Graph, URIRef, Literal, BNode
     from rdflib.namespace import RDF, RDFS, OWL, FOAF, XSD
     from dotenv import load_dotenv
@@ -38,20 +45,23 @@ except ImportError as e:
     print("pip install pymongo rdflib python-dotenv")
     sys.exit(1)
 
-# Optional: Import sentence transformers for embeddings
-try:
-    from sentence_transformers import SentenceTransformer
-    EMBEDDINGS_AVAILABLE = True
-except ImportError:
-    EMBEDDINGS_AVAILABLE = False
-    print("⚠️  sentence-transformers not available. Install with: pip install sentence-transformers")
+# Optional: embeddings via the configured backend (torch, onnx or onnx-int8)
+from embedding_backend import EMBEDDING_BACKEND, INSTALL_HINTS, backend_available, load_embedding_backend
+EMBEDDINGS_AVAILABLE = backend_available()
+if not EMBEDDINGS_AVAILABLE:
+    print(f"⚠️  Embedding backend '{EMBEDDING_BACKEND}' not available. Install with: {INSTALL_HINTS.get(EMBEDDING_BACKEND, 'pip install sentence-transformers')}")
+
+from result_cache import bump_graph_version
+from bulk_writer import BulkUpsertWriter
+from jsonld_context import CompiledContext, compile_context
 
 # Load environment variables
 load_dotenv()
 
 class MongoDBGraphLoader:
     def __init__(self, connection_string: str = None, database_name: str = "parliamentary_graph", 
-                 use_embeddings: bool = True):
+                 use_embeddings: bool = True, embedding_batch_size: int = 64, write_batch_size: int = 1000,
+                 setup_indexes: bool = True, reprocess_mode: str = "diff"):
         """
         Initialize the MongoDB graph loader.
         
@@ -59,6 +69,11 @@ class MongoDBGraphLoader:
             connection_string: MongoDB Atlas connection string. If None, will try to get from environment.
             database_name: Name of the MongoDB database to use
             use_embeddings: Whether to generate vector embeddings for text content
+            embedding_batch_size: Number of texts per embedding model call
+            write_batch_size: Number of upserts per unordered bulk_write call
+            setup_indexes: Whether to create collection indexes (worker processes skip this)
+            reprocess_mode: How videos from an older loader version are reprocessed: "diff" writes only
+                changed documents, "reload" deletes the video's data and loads it again
         """
         if connection_string is None:
             connection_string = os.getenv('MONGODB_CONNECTION_STRING')
@@ -77,8 +92,15 @@ class MongoDBGraphLoader:
         except ConnectionFailure as e:
             raise ConnectionFailure(f"Failed to connect to MongoDB: {e}")
         
+        self.connection_string = connection_string
+        self.database_name = database_name
         self.db = self.client[database_name]
         self.use_embeddings = use_embeddings and EMBEDDINGS_AVAILABLE
+        self.embedding_batch_size = max(1, embedding_batch_size)
+        self.write_batch_size = max(1, write_batch_size)
+        if reprocess_mode not in ("diff", "reload"):
+            raise ValueError(f"Unknown reprocess mode: {reprocess_mode}")
+        self.reprocess_mode = reprocess_mode
         
         # Source collection (videos with JSON-LD data)
         self.videos_source = self.db.videos
@@ -86,20 +108,24 @@ class MongoDBGraphLoader:
         # Initialize embedding model if available
         if self.use_embeddings:
             try:
-                print("🔄 Loading embedding model...")
-                self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+                print(f"🔄 Loading embedding model ({EMBEDDING_BACKEND})...")
+                self.embedding_model = load_embedding_backend()
                 print("✅ Embedding model loaded successfully")
             except Exception as e:
                 print(f"⚠️  Failed to load embedding model: {e}")
                 self.use_embeddings = False
         
-        self.setup_collections()
+        self.setup_collections(create_indexes=setup_indexes)
     
-    def setup_collections(self):
+    def setup_collections(self, create_indexes: bool = True):
         """Set up MongoDB collections with appropriate indexes."""
+        self.nodes = self.db.nodes
+        self.edges = self.db.edges
+        self.statements = self.db.statements
+        if not create_indexes:
+            return
         
         # Nodes collection for entities
-        self.nodes = self.db.nodes
         try:
             self.nodes.create_index([("uri", ASCENDING)], unique=True)
         except:
@@ -118,7 +144,6 @@ class MongoDBGraphLoader:
             pass
         
         # Edges collection for relationships
-        self.edges = self.db.edges
         try:
             self.edges.create_index([("subject", ASCENDING)])
         except:
@@ -141,7 +166,6 @@ class MongoDBGraphLoader:
             pass
         
         # Statements collection for reified statements (provenance)
-        self.statements = self.db.statements
         
         # Drop and recreate the problematic index
         try:
@@ -197,6 +221,10 @@ class MongoDBGraphLoader:
          "path": "embedding",
          "numDimensions": 384,
          "similarity": "cosine"
+       },
+       {
+         "type": "filter",
+         "path": "pagerank_rank"
        }
      ]
    }""")
@@ -211,7 +239,7 @@ class MongoDBGraphLoader:
             video_id: Process only a specific video ID
             
         Returns:
-            List of video documents with JSON-LD data
+            List of video documents without their json_ld (see stream_videos_with_jsonld)
         """
         current_version = "mongodb_graph_loader_v2.2"
         
@@ -228,12 +256,11 @@ class MongoDBGraphLoader:
         if video_id:
             query["video_id"] = video_id
         
-        # Only fetch necessary fields
+        # Only ids and status fields: json_ld is streamed per video while processing
         projection = {
             "video_id": 1,
             "Video_title": 1,
             "VideoURL": 1,
-            "json_ld": 1,
             "rdf_triple_count": 1,
             "graph_processed": 1,
             "graph_processing_version": 1,
@@ -242,13 +269,26 @@ class MongoDBGraphLoader:
         
         videos = list(self.videos_source.find(query, projection).limit(limit or 0))
         
-        # Count videos by processing status for better logging
+        # Count videos by processing status for better logging (server-side)
         if videos:
-            never_processed = len([v for v in videos if not v.get("graph_processed")])
-            wrong_version = len([v for v in videos if v.get("graph_processed") and 
-                               v.get("graph_processing_version") != current_version])
-            no_version = len([v for v in videos if v.get("graph_processed") and 
-                            not v.get("graph_processing_version")])
+            processed = {"$eq": ["$graph_processed", True]}
+            pipeline = [{"$match": query}]
+            if limit:
+                pipeline.append({"$limit": limit})
+            pipeline.append({"$group": {
+                "_id": None,
+                "never_processed": {"$sum": {"$cond": [processed, 0, 1]}},
+                "wrong_version": {"$sum": {"$cond": [
+                    {"$and": [processed, {"$ne": [{"$ifNull": ["$graph_processing_version", None]}, current_version]}]}, 1, 0
+                ]}},
+                "no_version": {"$sum": {"$cond": [
+                    {"$and": [processed, {"$in": [{"$ifNull": ["$graph_processing_version", None]}, [None, ""]]}]}, 1, 0
+                ]}}
+            }})
+            counts = next(iter(self.videos_source.aggregate(pipeline)), {})
+            never_processed = counts.get("never_processed", 0)
+            wrong_version = counts.get("wrong_version", 0)
+            no_version = counts.get("no_version", 0)
             
             print(f"Found {len(videos)} videos to process:")
             if never_processed > 0:
@@ -265,82 +305,82 @@ class MongoDBGraphLoader:
         
         return videos
     
-    def expand_curie(self, curie: str, context: Dict[str, Any]) -> str:
+    def stream_videos_with_jsonld(self, videos: Iterable[Dict[str, Any]], prefetch: int = 2) -> Iterator[Dict[str, Any]]:
         """
-        Expand a CURIE (Compact URI) to a full IRI using the JSON-LD context.
+        Yield each video with its json_ld, fetched lazily by a background thread.
+        
+        At most ``prefetch`` fetched documents wait in the queue, so peak memory is a
+        couple of videos' JSON-LD rather than the whole selection.
         
         Args:
-            curie: The compact URI to expand (e.g., "lok:Program_DigitalMedia")
-            context: The JSON-LD @context dictionary
+            videos: Video documents from get_videos_with_jsonld
+            prefetch: Maximum number of fetched videos buffered ahead of the consumer
             
         Returns:
-            Expanded IRI or original string if not expandable
+            Iterator of video documents including "json_ld" (None if it could not be read)
         """
-        if not curie or not isinstance(curie, str):
-            return curie
-        
-        # Already a full IRI
-        if curie.startswith(("http://", "https://")):
-            return curie
+        buffer: "queue.Queue" = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+        done = object()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
         
-        # Blank node
-        if curie.startswith("_:"):
-            return curie
+        def fetch():
+            try:
+                for video in videos:
+                    try:
+                        doc = self.videos_source.find_one({"_id": video["_id"]}, {"json_ld": 1})
+                    except Exception as e:
+                        print(f"  ⚠️  Failed to read JSON-LD for {video.get('video_id')}: {e}")
+                        doc = None
+                    if not put(dict(video, json_ld=(doc or {}).get("json_ld"))):
+                        return
+            finally:
+                put(done)
+        
+        threading.Thread(target=fetch, name="jsonld-prefetch", daemon=True).start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    return
+                yield item
+        finally:
+            # Lets the fetcher exit if the consumer stops early
+            stop.set()
+    
+    def expand_curie(self, curie: str, context: Union[Dict[str, Any], CompiledContext]) -> str:
+        """
+        Expand a CURIE (Compact URI) to a full IRI using the JSON-LD context.
         
-        # Check if it contains a colon (potential CURIE)
-        if ":" in curie:
-            prefix, local_part = curie.split(":", 1)
+        Args:
+            curie: The compact URI to expand (e.g., "lok:Program_DigitalMedia")
+            context: The JSON-LD @context dictionary, or a CompiledContext (much faster for repeated calls)
             
-            # Look up prefix in context
-            if prefix in context:
-                base_iri = context[prefix]
-                
-                # Handle different context value types
-                if isinstance(base_iri, str):
-                    # Simple string mapping
-                    if base_iri.endswith(("#", "/")):
-                        return base_iri + local_part
-                    else:
-                        return base_iri + local_part
-                elif isinstance(base_iri, dict):
-                    # Complex context object
-                    if "@id" in base_iri:
-                        base = base_iri["@id"]
-                        if base.endswith(("#", "/")):
-                            return base + local_part
-                        else:
-                            return base + local_part
-        
-        # If we can't expand it, return as-is
-        return curie
+        Returns:
+            Expanded IRI or original string if not expandable
+        """
+        return compile_context(context).expand(curie)
     
-    def expand_value_recursively(self, value: Any, context: Dict[str, Any]) -> Any:
+    def expand_value_recursively(self, value: Any, context: Union[Dict[str, Any], CompiledContext]) -> Any:
         """
         Recursively expand CURIEs in a value structure.
         
         Args:
             value: Value to expand (can be string, dict, list, etc.)
-            context: JSON-LD context for expansion
+            context: JSON-LD context (dictionary or CompiledContext) for expansion
             
         Returns:
             Value with CURIEs expanded
         """
-        if isinstance(value, str):
-            return self.expand_curie(value, context)
-        elif isinstance(value, dict):
-            if "@id" in value:
-                # This is a reference object
-                expanded_id = self.expand_curie(value["@id"], context)
-                result = dict(value)
-                result["@id"] = expanded_id
-                return result
-            else:
-                # Regular object, expand all values
-                return {k: self.expand_value_recursively(v, context) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self.expand_value_recursively(item, context) for item in value]
-        else:
-            return value
+        return compile_context(context).expand_value(value)
     
     def extract_local_name_from_iri(self, iri: str) -> str:
         """Extract local name from a full IRI for display purposes."""
@@ -497,15 +537,27 @@ class MongoDBGraphLoader:
         
         return ' '.join(clean_parts)
     
+    def clean_embedding_text(self, text: str) -> Optional[str]:
+        """Normalize whitespace for embedding; None if the text is too short to embed."""
+        if not text:
+            return None
+        clean_text = re.sub(r'\s+', ' ', text).strip()
+        if len(clean_text) < 3:  # Skip very short text
+            return None
+        return clean_text
+    
+    def searchable_text_hash(self, text: str) -> str:
+        """Hash of the searchable text, stored with each node to detect unchanged embedding input."""
+        return hashlib.md5((text or "").encode()).hexdigest()
+    
     def generate_embedding(self, text: str) -> Optional[List[float]]:
         """Generate vector embedding for text content."""
         if not self.use_embeddings or not text:
             return None
         
         try:
-            # Clean text for embedding
-            clean_text = re.sub(r'\s+', ' ', text).strip()
-            if len(clean_text) < 3:  # Skip very short text
+            clean_text = self.clean_embedding_text(text)
+            if not clean_text:
                 return None
             
             embedding = self.embedding_model.encode(clean_text)
@@ -514,6 +566,67 @@ class MongoDBGraphLoader:
             print(f"⚠️  Failed to generate embedding: {e}")
             return None
     
+    def generate_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for many texts with batched model calls.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding per text (None for texts that are too short or failed)
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        if not self.use_embeddings:
+            return embeddings
+        
+        clean_texts = [self.clean_embedding_text(text) for text in texts]
+        pending = [i for i, text in enumerate(clean_texts) if text]
+        
+        for start in range(0, len(pending), self.embedding_batch_size):
+            batch = pending[start:start + self.embedding_batch_size]
+            try:
+                vectors = self.embedding_model.encode(
+                    [clean_texts[i] for i in batch], batch_size=self.embedding_batch_size
+                )
+                for i, vector in zip(batch, vectors):
+                    embeddings[i] = vector.tolist()
+            except Exception as e:
+                print(f"⚠️  Failed to generate embeddings for a batch of {len(batch)}: {e}")
+        
+        return embeddings
+    
+    def find_reusable_embeddings(self, text_hashes: Dict[str, str], exclude_video: Optional[str] = None) -> Set[str]:
+        """
+        URIs whose stored embedding was computed from the same searchable text.
+        
+        Args:
+            text_hashes: Node URI -> searchable_text hash of the incoming node
+            exclude_video: Ignore nodes from this video (they are about to be cleaned up)
+            
+        Returns:
+            URIs that can keep their stored embedding
+        """
+        reusable = set()
+        if not text_hashes:
+            return reusable
+        
+        uris = list(text_hashes)
+        for start in range(0, len(uris), 1000):
+            query = {"uri": {"$in": uris[start:start + 1000]}, "embedding": {"$exists": True}}
+            if exclude_video:
+                query["source_video"] = {"$ne": exclude_video}
+            cursor = self.nodes.find(
+                query,
+                {"_id": 0, "uri": 1, "searchable_text_hash": 1, "searchable_text": 1}
+            )
+            for doc in cursor:
+                # Nodes loaded before hashes were stored fall back to hashing the stored text
+                stored_hash = doc.get("searchable_text_hash") or self.searchable_text_hash(doc.get("searchable_text"))
+                if stored_hash == text_hashes.get(doc["uri"]):
+                    reusable.add(doc["uri"])
+        return reusable
+    
     def get_node_types(self, node: Dict[str, Any]) -> List[str]:
         """Extract types from JSON-LD node."""
         types = []
@@ -538,7 +651,7 @@ class MongoDBGraphLoader:
         
         return types
     
-    def extract_properties_from_jsonld_node(self, node: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def extract_properties_from_jsonld_node(self, node: Dict[str, Any], context: Union[Dict[str, Any], CompiledContext]) -> Dict[str, Any]:
         """Extract properties from JSON-LD node, excluding @id and @type, and expand CURIEs."""
         properties = {}
         
@@ -638,43 +751,36 @@ class MongoDBGraphLoader:
             print(f"    ⚠️  Failed to cleanup old data: {e}")
             return False
 
-    def process_jsonld_to_graph(self, json_ld: Dict[str, Any], video_id: str, video_title: str):
-        """Process JSON-LD data and save to graph collections."""
-        print(f"  📊 Processing JSON-LD graph data...")
+    def build_graph_documents(self, json_ld: Dict[str, Any], video_id: str, video_title: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Turn a video's JSON-LD into node, edge and statement documents (no database access).
         
+        Args:
+            json_ld: The video's JSON-LD document
+            video_id: Video ID recorded as the documents' source
+            video_title: Video title recorded on the documents
+            
+        Returns:
+            Dictionary with "nodes", "edges" and "statements" lists, or None if there is no @graph
+        """
         if "@graph" not in json_ld:
-            print("  ⚠️  No @graph found in JSON-LD")
-            return
-        
-        # Extract context for CURIE expansion
-        context = json_ld.get("@context", {})
-        if not isinstance(context, dict):
-            context = {}
-        
-        graph_items = json_ld["@graph"]
-        print(f"  📋 Found {len(graph_items)} graph items")
-        print(f"  🔗 Context prefixes: {list(context.keys())}")
+            return None
         
-        nodes_added = 0
-        nodes_updated = 0
-        edges_added = 0
-        statements_added = 0
-        embeddings_generated = 0
+        # Compile the context once; CURIE expansions are memoized for the whole video
+        context = CompiledContext(json_ld.get("@context", {}))
         
         # Separate different types of items
         entity_nodes = []
         reified_statements = []
         
-        for item in graph_items:
+        for item in json_ld["@graph"]:
             if item.get("@type") == "rdf:Statement":
                 reified_statements.append(item)
             else:
                 entity_nodes.append(item)
         
-        print(f"    - Entity nodes: {len(entity_nodes)}")
-        print(f"    - Reified statements: {len(reified_statements)}")
-        
-        # Process entity nodes
+        node_docs = []
+        edge_docs = []
         for node in entity_nodes:
             if "@id" not in node:
                 continue
@@ -692,52 +798,19 @@ class MongoDBGraphLoader:
             # Create searchable text
             searchable_text = self.create_searchable_text(node, node_types)
             
-            # Generate embedding
-            embedding = None
-            if self.use_embeddings and searchable_text:
-                embedding = self.generate_embedding(searchable_text)
-                if embedding:
-                    embeddings_generated += 1
-            
-            node_doc = {
+            node_docs.append({
                 "uri": uri_str,
                 "label": label,
                 "searchable_text": searchable_text,
+                "searchable_text_hash": self.searchable_text_hash(searchable_text),
+                "content_hash": self.content_hash([uri_str, label, searchable_text, node_types, properties]),
                 "type": node_types,
                 "properties": properties,
                 "source_video": [video_id],
                 "video_title": video_title,
                 "created_at": datetime.now(timezone.utc),
                 "updated_at": datetime.now(timezone.utc)
-            }
-            
-            # Add embedding if generated
-            if embedding:
-                node_doc["embedding"] = embedding
-            
-            try:
-                self.nodes.insert_one(node_doc)
-                nodes_added += 1
-            except DuplicateKeyError:
-                # Update existing node
-                update_doc = {
-                    "properties": properties,
-                    "label": label,
-                    "searchable_text": searchable_text,
-                    "updated_at": datetime.now(timezone.utc)
-                }
-                
-                if embedding:
-                    update_doc["embedding"] = embedding
-                
-                self.nodes.update_one(
-                    {"uri": uri_str},
-                    {
-                        "$set": update_doc,
-                        "$addToSet": {"source_video": video_id}
-                    }
-                )
-                nodes_updated += 1
+            })
             
             # FIXED: Create edges for ALL properties, not just URI references
             for prop_key, prop_value in properties.items():
@@ -762,7 +835,7 @@ class MongoDBGraphLoader:
                     # Determine object type and value
                     object_type = "uri" if isinstance(obj_value, str) and obj_value.startswith(("http://", "https://", "_:")) else "literal"
                     
-                    edge_doc = {
+                    edge_docs.append({
                         "subject": uri_str,
                         "predicate": prop_key,
                         "object": str(obj_value),
@@ -770,25 +843,9 @@ class MongoDBGraphLoader:
                         "source_video": [video_id],
                         "video_title": video_title,
                         "created_at": datetime.now(timezone.utc)
-                    }
-                    
-                    try:
-                        self.edges.insert_one(edge_doc)
-                        edges_added += 1
-                    except DuplicateKeyError:
-                        # Update existing edge to add this video as a source
-                        self.edges.update_one(
-                            {
-                                "subject": uri_str,
-                                "predicate": prop_key,
-                                "object": str(obj_value)
-                            },
-                            {
-                                "$addToSet": {"source_video": video_id}
-                            }
-                        )
-        
-        # Process reified statements (unchanged)
+                    })
+        
+        statement_docs = []
         for stmt in reified_statements:
             if "@id" not in stmt:
                 continue
@@ -853,18 +910,370 @@ class MongoDBGraphLoader:
                         "segment_type": provenance.get("@type")
                     })
             
-            try:
-                self.statements.insert_one(statement_doc)
-                statements_added += 1
-            except DuplicateKeyError:
-                pass  # Skip duplicates
+            statement_doc["content_hash"] = self.content_hash(
+                {k: v for k, v in statement_doc.items() if k != "created_at"}
+            )
+            statement_docs.append(statement_doc)
+        
+        return {"nodes": node_docs, "edges": edge_docs, "statements": statement_docs}
+    
+    def embed_graph_documents(self, node_docs: List[Dict[str, Any]], exclude_video: Optional[str] = None) -> Dict[str, int]:
+        """
+        Attach embeddings to node documents whose searchable text changed, in batches.
         
+        Args:
+            node_docs: Node documents from build_graph_documents (modified in place)
+            exclude_video: Don't reuse embeddings of nodes from this video (reprocessing before cleanup)
+            
+        Returns:
+            Dictionary with "generated" and "reused" counts
+        """
+        counts = {"generated": 0, "reused": 0}
+        if not self.use_embeddings:
+            return counts
+        
+        reusable = self.find_reusable_embeddings({
+            doc["uri"]: doc["searchable_text_hash"] for doc in node_docs if doc["searchable_text"]
+        }, exclude_video=exclude_video)
+        to_embed = []
+        for doc in node_docs:
+            if doc["uri"] in reusable:
+                doc["embedding_reused"] = True
+                counts["reused"] += 1
+            elif doc["searchable_text"]:
+                to_embed.append(doc)
+        
+        embeddings = self.generate_embeddings([doc["searchable_text"] for doc in to_embed])
+        for doc, embedding in zip(to_embed, embeddings):
+            if embedding:
+                doc["embedding"] = embedding
+                counts["generated"] += 1
+        return counts
+    
+    def write_graph_documents(self, documents: Dict[str, List[Dict[str, Any]]], video_id: str,
+                              video_title: str, pool: Optional[ThreadPoolExecutor] = None,
+                              diff: bool = False) -> Dict[str, int]:
+        """
+        Upsert a video's node, edge and statement documents in unordered bulk batches.
+        
+        Args:
+            documents: Output of build_graph_documents (after embed_graph_documents)
+            video_id: Video ID added to each document's sources
+            video_title: Video title recorded on inserted documents
+            pool: Optional thread pool to write the three collections concurrently
+            diff: Compare with what is stored for this video and write only the differences
+            
+        Returns:
+            Write counts for the summary
+        """
+        plan = self.diff_graph_documents(documents, video_id) if diff else dict(documents, changed_statements=[])
+        # Reuse decisions were made before earlier videos wrote; check them against what is stored now
+        refreshed = self.refresh_reused_embeddings(plan["nodes"])
+        
+        writes = (
+            (self._write_nodes, plan["nodes"]),
+            (self._write_edges, plan["edges"]),
+            (self._write_statements, plan["statements"]),
+        )
+        if pool is not None:
+            futures = [pool.submit(write, docs, video_id, video_title) for write, docs in writes]
+            node_stats, edge_stats, statement_stats = [future.result() for future in futures]
+        else:
+            node_stats, edge_stats, statement_stats = [write(docs, video_id, video_title) for write, docs in writes]
+        
+        writers = [node_stats, edge_stats, statement_stats]
+        counts = {
+            "nodes_added": node_stats["upserted"],
+            "nodes_updated": node_stats["matched"],
+            "edges_added": edge_stats["upserted"],
+            "statements_added": statement_stats["upserted"],
+        }
+        
+        if diff:
+            changed_stats = self._update_statements(plan["changed_statements"])
+            writers.append(changed_stats)
+            counts.update({
+                "statements_updated": changed_stats["matched"],
+                "unchanged": plan["unchanged"],
+                "nodes_removed": self._remove_video_nodes(plan["removed_nodes"], video_id),
+                "edges_removed": self._remove_video_edges(plan["removed_edges"], video_id),
+                "statements_removed": self._remove_statements(plan["removed_statements"]),
+            })
+        
+        counts.update({
+            "embeddings_repaired": refreshed + self.repair_missing_embeddings(plan["nodes"]),
+            "write_batches": sum(w["batches"] for w in writers),
+            "write_errors": sum(w["errors"] for w in writers)
+        })
+        return counts
+    
+    def content_hash(self, value: Any) -> str:
+        """Stable hash of a document's content, used to detect changes on reprocessing."""
+        return hashlib.md5(json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode()).hexdigest()
+    
+    def diff_graph_documents(self, documents: Dict[str, List[Dict[str, Any]]], video_id: str) -> Dict[str, Any]:
+        """
+        Compare a video's new documents with the ones stored for it.
+        
+        Args:
+            documents: Output of build_graph_documents
+            video_id: Video being reprocessed
+            
+        Returns:
+            Documents to write (new or changed), statements to update, keys of stored
+            documents the video no longer produces, and unchanged counts
+        """
+        stored_nodes = {
+            doc["uri"]: doc.get("content_hash")
+            for doc in self.nodes.find({"source_video": video_id}, {"_id": 0, "uri": 1, "content_hash": 1})
+        }
+        # An edge's identity is its whole content (subject, predicate, object)
+        stored_edges = {
+            (doc["subject"], doc["predicate"], doc["object"])
+            for doc in self.edges.find({"source_video": video_id}, {"_id": 0, "subject": 1, "predicate": 1, "object": 1})
+        }
+        stored_statements = {
+            doc["global_statement_id"]: doc.get("content_hash")
+            for doc in self.statements.find(
+                {"source_video": video_id}, {"_id": 0, "global_statement_id": 1, "content_hash": 1}
+            )
+        }
+        
+        nodes = [doc for doc in documents["nodes"] if stored_nodes.get(doc["uri"]) != doc["content_hash"]]
+        edge_keys = {(doc["subject"], doc["predicate"], doc["object"]) for doc in documents["edges"]}
+        edges = [doc for doc in documents["edges"]
+                 if (doc["subject"], doc["predicate"], doc["object"]) not in stored_edges]
+        statements, changed_statements = [], []
+        for doc in documents["statements"]:
+            stored_hash = stored_statements.get(doc["global_statement_id"], False)
+            if stored_hash is False:
+                statements.append(doc)
+            elif stored_hash != doc["content_hash"]:
+                changed_statements.append(doc)
+        
+        node_uris = {doc["uri"] for doc in documents["nodes"]}
+        statement_ids = {doc["global_statement_id"] for doc in documents["statements"]}
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "statements": statements,
+            "changed_statements": changed_statements,
+            "removed_nodes": [uri for uri in stored_nodes if uri not in node_uris],
+            "removed_edges": [key for key in stored_edges if key not in edge_keys],
+            "removed_statements": [sid for sid in stored_statements if sid not in statement_ids],
+            "unchanged": {
+                "nodes": len(documents["nodes"]) - len(nodes),
+                "edges": len(documents["edges"]) - len(edges),
+                "statements": len(documents["statements"]) - len(statements) - len(changed_statements),
+            },
+        }
+    
+    def _remove_video_nodes(self, uris: List[str], video_id: str) -> int:
+        """Detach the video from nodes it no longer produces; delete nodes left without a source."""
+        removed = 0
+        for start in range(0, len(uris), self.write_batch_size):
+            batch = uris[start:start + self.write_batch_size]
+            self.nodes.update_many({"uri": {"$in": batch}}, {"$pull": {"source_video": video_id}})
+            removed += self.nodes.delete_many({"uri": {"$in": batch}, "source_video": {"$size": 0}}).deleted_count
+        return removed
+    
+    def _remove_video_edges(self, keys: List[tuple], video_id: str) -> int:
+        """Detach the video from edges it no longer produces; delete edges left without a source."""
+        removed = 0
+        for start in range(0, len(keys), self.write_batch_size):
+            batch = keys[start:start + self.write_batch_size]
+            self.edges.bulk_write([
+                UpdateOne({"subject": s, "predicate": p, "object": o}, {"$pull": {"source_video": video_id}})
+                for s, p, o in batch
+            ], ordered=False)
+            removed += self.edges.delete_many({
+                "subject": {"$in": list({s for s, _, _ in batch})},
+                "source_video": {"$size": 0}
+            }).deleted_count
+        return removed
+    
+    def _remove_statements(self, statement_ids: List[str]) -> int:
+        removed = 0
+        for start in range(0, len(statement_ids), self.write_batch_size):
+            batch = statement_ids[start:start + self.write_batch_size]
+            removed += self.statements.delete_many({"global_statement_id": {"$in": batch}}).deleted_count
+        return removed
+    
+    def _write_nodes(self, node_docs: List[Dict[str, Any]], video_id: str, video_title: str) -> Dict[str, int]:
+        with BulkUpsertWriter(self.nodes, self.write_batch_size) as node_writer:
+            for node_doc in node_docs:
+                update_doc = {
+                    "properties": node_doc["properties"],
+                    "label": node_doc["label"],
+                    "searchable_text": node_doc["searchable_text"],
+                    "searchable_text_hash": node_doc["searchable_text_hash"],
+                    "content_hash": node_doc["content_hash"],
+                    "updated_at": node_doc["updated_at"]
+                }
+                # An unchanged text keeps its stored embedding
+                if "embedding" in node_doc:
+                    update_doc["embedding"] = node_doc["embedding"]
+                
+                node_writer.upsert(
+                    {"uri": node_doc["uri"]},
+                    {
+                        "$setOnInsert": {
+                            "type": node_doc["type"],
+                            "video_title": video_title,
+                            "created_at": node_doc["created_at"]
+                        },
+                        "$set": update_doc,
+                        "$addToSet": {"source_video": video_id}
+                    }
+                )
+        return node_writer.stats
+    
+    def _write_edges(self, edge_docs: List[Dict[str, Any]], video_id: str, video_title: str) -> Dict[str, int]:
+        with BulkUpsertWriter(self.edges, self.write_batch_size) as edge_writer:
+            for edge_doc in edge_docs:
+                edge_writer.upsert(
+                    {
+                        "subject": edge_doc["subject"],
+                        "predicate": edge_doc["predicate"],
+                        "object": edge_doc["object"]
+                    },
+                    {
+                        "$setOnInsert": {
+                            "object_type": edge_doc["object_type"],
+                            "video_title": video_title,
+                            "created_at": edge_doc["created_at"]
+                        },
+                        # Existing edges gain this video as a source
+                        "$addToSet": {"source_video": video_id}
+                    }
+                )
+        return edge_writer.stats
+    
+    def _write_statements(self, statement_docs: List[Dict[str, Any]], video_id: str, video_title: str) -> Dict[str, int]:
+        # Existing statements are left untouched
+        with BulkUpsertWriter(self.statements, self.write_batch_size) as statement_writer:
+            for statement_doc in statement_docs:
+                statement_writer.upsert(
+                    {"global_statement_id": statement_doc["global_statement_id"]},
+                    {"$setOnInsert": statement_doc}
+                )
+        return statement_writer.stats
+    
+    def _update_statements(self, statement_docs: List[Dict[str, Any]]) -> Dict[str, int]:
+        # Changed statements of a reprocessed video are rewritten in place
+        with BulkUpsertWriter(self.statements, self.write_batch_size) as statement_writer:
+            for statement_doc in statement_docs:
+                fields = {k: v for k, v in statement_doc.items() if k != "created_at"}
+                statement_writer.upsert(
+                    {"global_statement_id": statement_doc["global_statement_id"]},
+                    {"$set": fields, "$setOnInsert": {"created_at": statement_doc["created_at"]}}
+                )
+        return statement_writer.stats
+    
+    def refresh_reused_embeddings(self, node_docs: List[Dict[str, Any]]) -> int:
+        """
+        Re-embed nodes judged reusable whose stored text has changed since.
+        
+        embed_graph_documents can run (in a worker process) before earlier queued videos
+        write. If one of them rewrote a shared node's searchable text, the stored embedding
+        no longer matches our text; writing our text without a vector would pair the two
+        for good, since the hashes then agree. Called right before the node write, so the
+        vector is sent together with the text it was computed from.
+        
+        Returns:
+            Number of embeddings generated
+        """
+        reused = {doc["uri"]: doc for doc in node_docs if doc.get("embedding_reused")}
+        if not reused:
+            return 0
+        
+        current = set()
+        uris = list(reused)
+        for start in range(0, len(uris), 1000):
+            for doc in self.nodes.find(
+                {"uri": {"$in": uris[start:start + 1000]}, "embedding": {"$exists": True}},
+                {"_id": 0, "uri": 1, "searchable_text_hash": 1, "searchable_text": 1}
+            ):
+                stored_hash = doc.get("searchable_text_hash") or self.searchable_text_hash(doc.get("searchable_text"))
+                if stored_hash == reused[doc["uri"]]["searchable_text_hash"]:
+                    current.add(doc["uri"])
+        
+        stale = [doc for uri, doc in reused.items() if uri not in current]
+        if not stale:
+            return 0
+        
+        refreshed = 0
+        embeddings = self.generate_embeddings([doc["searchable_text"] for doc in stale])
+        for doc, embedding in zip(stale, embeddings):
+            if embedding:
+                doc["embedding"] = embedding
+                doc["embedding_reused"] = False
+                refreshed += 1
+        return refreshed
+    
+    def repair_missing_embeddings(self, node_docs: List[Dict[str, Any]]) -> int:
+        """
+        Embed nodes that were expected to keep a stored embedding but lost it.
+        
+        A node judged reusable can be deleted (by a concurrent reprocess of another video
+        sharing it) before our upsert recreates it without an embedding.
+        
+        Returns:
+            Number of embeddings written
+        """
+        reused = {doc["uri"]: doc for doc in node_docs if doc.get("embedding_reused")}
+        if not reused:
+            return 0
+        
+        missing = [
+            reused[doc["uri"]] for doc in self.nodes.find(
+                {"uri": {"$in": list(reused)}, "embedding": {"$exists": False}}, {"_id": 0, "uri": 1}
+            )
+        ]
+        if not missing:
+            return 0
+        
+        repaired = 0
+        embeddings = self.generate_embeddings([doc["searchable_text"] for doc in missing])
+        with BulkUpsertWriter(self.nodes, self.write_batch_size) as writer:
+            for doc, embedding in zip(missing, embeddings):
+                if embedding:
+                    writer.upsert({"uri": doc["uri"]}, {"$set": {"embedding": embedding}})
+                    repaired += 1
+        return repaired
+    
+    def process_jsonld_to_graph(self, json_ld: Dict[str, Any], video_id: str, video_title: str, diff: bool = False):
+        """Process JSON-LD data and save to graph collections (only the differences if ``diff``)."""
+        print(f"  📊 Processing JSON-LD graph data...")
+        
+        documents = self.build_graph_documents(json_ld, video_id, video_title)
+        if documents is None:
+            print("  ⚠️  No @graph found in JSON-LD")
+            return
+        
+        context = json_ld.get("@context", {})
+        print(f"  📋 Found {len(json_ld['@graph'])} graph items")
+        print(f"  🔗 Context prefixes: {list(context.keys()) if isinstance(context, dict) else []}")
+        print(f"    - Entity nodes: {len(documents['nodes'])}")
+        print(f"    - Reified statements: {len(documents['statements'])}")
+        
+        embedding_counts = self.embed_graph_documents(documents["nodes"])
+        write_counts = self.write_graph_documents(documents, video_id, video_title, diff=diff)
+        self.print_graph_summary(write_counts, embedding_counts)
+    
+    def print_graph_summary(self, write_counts: Dict[str, int], embedding_counts: Dict[str, int]):
         print(f"  ✅ Graph processing complete:")
-        print(f"    - Nodes: {nodes_added} added, {nodes_updated} updated")
-        print(f"    - Edges: {edges_added} added")
-        print(f"    - Statements: {statements_added} added")
+        print(f"    - Nodes: {write_counts['nodes_added']} added, {write_counts['nodes_updated']} updated")
+        print(f"    - Edges: {write_counts['edges_added']} added")
+        print(f"    - Statements: {write_counts['statements_added']} added")
+        if "unchanged" in write_counts:
+            unchanged = write_counts["unchanged"]
+            print(f"    - Diff: {unchanged['nodes']} nodes, {unchanged['edges']} edges, {unchanged['statements']} statements unchanged; "
+                  f"{write_counts['statements_updated']} statements updated; removed {write_counts['nodes_removed']} nodes, "
+                  f"{write_counts['edges_removed']} edges, {write_counts['statements_removed']} statements")
         if self.use_embeddings:
-            print(f"    - Embeddings: {embeddings_generated} generated")
+            print(f"    - Embeddings: {embedding_counts['generated']} generated, {embedding_counts['reused']} reused (unchanged text)")
+        print(f"    - Writes: {write_counts['write_batches']} bulk batches, {write_counts['write_errors']} errors")
         
     def save_graph_video_metadata(self, video_data: Dict[str, Any]):
         """Mark video as processed by adding graph_processed flag."""
@@ -880,21 +1289,38 @@ class MongoDBGraphLoader:
                 }
             )
             print(f"    ✅ Marked video as graph processed: {video_data['video_id']}")
-            return True
         except Exception as e:
             print(f"    ⚠️  Failed to mark video as processed: {e}")
             return False
+        
+        # New graph data landed: cached MCP tool results are now stale
+        try:
+            version = bump_graph_version(self.db)
+            print(f"    🔢 Graph version bumped to {version}")
+        except Exception as e:
+            print(f"    ⚠️  Failed to bump graph version: {e}")
+        return True
+    
+    def is_reprocessing(self, video_data: Dict[str, Any]) -> bool:
+        """True if the video was loaded by an older loader version and needs its old data cleaned up."""
+        return video_data.get("graph_processed", False) and \
+            video_data.get("graph_processing_version") != "mongodb_graph_loader_v2.2"
     
-    def process_video(self, video_data: Dict[str, Any]) -> bool:
-        """Process a single video's JSON-LD data into graph format."""
+    def process_video(self, video_data: Dict[str, Any], reprocess: Optional[bool] = None) -> bool:
+        """
+        Process a single video's JSON-LD data into graph format.
+        
+        Args:
+            video_data: Video document including json_ld
+            reprocess: Treat the video as already loaded (diff or reload per reprocess_mode);
+                       defaults to whether it was loaded by an older loader version
+        """
         video_id = video_data["video_id"]
         video_title = video_data.get("Video_title", "Unknown Title")
         json_ld = video_data.get("json_ld")
-        current_version = "mongodb_graph_loader_v2.2"
         
         # Check if this is a reprocessing scenario
-        is_reprocessing = video_data.get("graph_processed", False) and \
-                         video_data.get("graph_processing_version") != current_version
+        is_reprocessing = self.is_reprocessing(video_data) if reprocess is None else reprocess
         
         if not json_ld:
             print(f"  ⚠️  No JSON-LD data found for video {video_id}")
@@ -903,14 +1329,17 @@ class MongoDBGraphLoader:
         try:
             print(f"  📄 JSON-LD data: {len(str(json_ld))} characters")
             
-            # Clean up old data if reprocessing
+            # Reprocessing: diff against the stored data, or clean it up and reload
             if is_reprocessing:
-                print(f"  🔄 Reprocessing due to version change")
-                if not self.cleanup_old_graph_data(video_id):
+                reason = "version change" if reprocess is None else "JSON-LD change"
+                print(f"  🔄 Reprocessing due to {reason} ({self.reprocess_mode})")
+                if self.reprocess_mode == "reload" and not self.cleanup_old_graph_data(video_id):
                     print(f"  ⚠️  Cleanup failed, continuing anyway...")
             
             # Process JSON-LD into graph structure
-            self.process_jsonld_to_graph(json_ld, video_id, video_title)
+            self.process_jsonld_to_graph(
+                json_ld, video_id, video_title, diff=is_reprocessing and self.reprocess_mode == "diff"
+            )
             
             # Mark as processed
             if self.save_graph_video_metadata(video_data):
@@ -922,13 +1351,17 @@ class MongoDBGraphLoader:
             print(f"  ❌ Error processing video {video_id}: {e}")
             return False
     
-    def process_all_videos(self, limit: Optional[int] = None, video_id: Optional[str] = None):
+    def process_all_videos(self, limit: Optional[int] = None, video_id: Optional[str] = None, workers: int = 1):
         """
         Process all videos with JSON-LD data into graph format.
         
         Args:
             limit: Maximum number of videos to process
             video_id: Process only a specific video ID
+            workers: Worker processes for parsing/embedding (1 = process videos one at a time)
+            
+        Returns:
+            Dictionary with total/processed/error counts
         """
         print("Starting graph loading from JSON-LD data in MongoDB...")
         
@@ -937,7 +1370,10 @@ class MongoDBGraphLoader:
         
         if not videos_to_process:
             print("No videos to process")
-            return
+            return {"total": 0, "processed": 0, "errors": 0}
+        
+        if workers > 1 and len(videos_to_process) > 1:
+            return self.process_videos_parallel(videos_to_process, workers)
         
         stats = {
             "total": len(videos_to_process),
@@ -945,7 +1381,7 @@ class MongoDBGraphLoader:
             "errors": 0
         }
         
-        for i, video in enumerate(videos_to_process, 1):
+        for i, video in enumerate(self.stream_videos_with_jsonld(videos_to_process), 1):
             video_id = video["video_id"]
             video_title = video.get("Video_title", "Unknown Title")
             
@@ -963,6 +1399,107 @@ class MongoDBGraphLoader:
         print(f"  Total videos: {stats['total']}")
         print(f"  Successfully processed: {stats['processed']}")
         print(f"  Errors: {stats['errors']}")
+        
+        return stats
+    
+    def process_videos_parallel(self, videos: List[Dict[str, Any]], workers: int) -> Dict[str, Any]:
+        """
+        Process videos with a worker pool.
+        
+        Worker processes parse JSON-LD (streamed from MongoDB) and compute embeddings
+        (CPU-bound) for up to ``2 * workers`` videos ahead, while this process writes finished videos with a
+        thread pool (one thread per collection). Writes are applied in selection order,
+        so node upserts shared between videos ($set fields, $addToSet source_video
+        order) end up exactly as in a sequential run.
+        
+        Args:
+            videos: Videos from get_videos_with_jsonld
+            workers: Number of worker processes
+            
+        Returns:
+            Dictionary with total/processed/error counts and node throughput
+        """
+        stats = {"total": len(videos), "processed": 0, "errors": 0, "nodes": 0, "edges": 0, "statements": 0}
+        print(f"⚙️  Processing {len(videos)} videos with {workers} workers")
+        
+        started = time.perf_counter()
+        # spawn: worker processes must not inherit this process's MongoClient
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.connection_string, self.database_name, self.use_embeddings, self.embedding_batch_size)
+        ) as process_pool, ThreadPoolExecutor(max_workers=3, thread_name_prefix="graph-write") as write_pool:
+            pending = deque()
+            upcoming = self.stream_videos_with_jsonld(videos, prefetch=workers)
+            
+            def submit_next():
+                video = next(upcoming, None)
+                if video is not None:
+                    # Only the worker keeps the JSON-LD; the write side needs just the metadata
+                    metadata = {k: v for k, v in video.items() if k != "json_ld"}
+                    reload = self.is_reprocessing(video) and self.reprocess_mode == "reload"
+                    pending.append((metadata, process_pool.submit(_prepare_video, video, reload)))
+            
+            # Bounded prefetch keeps at most 2 * workers parsed videos in memory
+            for _ in range(workers * 2):
+                submit_next()
+            
+            index = 0
+            while pending:
+                video, future = pending.popleft()
+                submit_next()
+                index += 1
+                video_id = video["video_id"]
+                
+                try:
+                    prepared = future.result()
+                    if prepared is None:
+                        print(f"[{index}/{stats['total']}] ⚠️  {video_id}: no JSON-LD @graph")
+                        stats["errors"] += 1
+                        continue
+                    
+                    write_started = time.perf_counter()
+                    reprocessing = self.is_reprocessing(video)
+                    if reprocessing and self.reprocess_mode == "reload" and not self.cleanup_old_graph_data(video_id):
+                        print(f"  ⚠️  Cleanup failed for {video_id}, continuing anyway...")
+                    documents = prepared["documents"]
+                    write_counts = self.write_graph_documents(
+                        documents, video_id, video.get("Video_title", "Unknown Title"), pool=write_pool,
+                        diff=reprocessing and self.reprocess_mode == "diff"
+                    )
+                    if not self.save_graph_video_metadata(video):
+                        stats["errors"] += 1
+                        continue
+                    write_seconds = time.perf_counter() - write_started
+                except Exception as e:
+                    print(f"[{index}/{stats['total']}] ❌ Error processing video {video_id}: {e}")
+                    stats["errors"] += 1
+                    continue
+                
+                stats["processed"] += 1
+                stats["nodes"] += len(documents["nodes"])
+                stats["edges"] += len(documents["edges"])
+                stats["statements"] += len(documents["statements"])
+                elapsed = time.perf_counter() - started
+                print(f"[{index}/{stats['total']}] ✅ {video_id}: {len(documents['nodes'])} nodes "
+                      f"({write_counts['nodes_added']} added), {len(documents['edges'])} edges, "
+                      f"{len(documents['statements'])} statements, "
+                      f"{prepared['embedding_counts']['generated']} embeddings | "
+                      f"prepare {prepared['seconds']:.1f}s, write {write_seconds:.1f}s | "
+                      f"{stats['nodes'] / elapsed:.0f} nodes/sec overall")
+        
+        elapsed = time.perf_counter() - started
+        stats["seconds"] = round(elapsed, 1)
+        stats["nodes_per_sec"] = round(stats["nodes"] / elapsed, 1) if elapsed else 0.0
+        
+        print(f"\n📊 Graph Loading Complete!")
+        print(f"  Total videos: {stats['total']}")
+        print(f"  Successfully processed: {stats['processed']}")
+        print(f"  Errors: {stats['errors']}")
+        print(f"  Throughput: {stats['nodes']} nodes in {stats['seconds']}s ({stats['nodes_per_sec']} nodes/sec)")
+        
+        return stats
     
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about the loaded graph."""
@@ -992,6 +1529,40 @@ class MongoDBGraphLoader:
         
         return stats
 
+# Per-process loader used by the --workers pool
+_worker_loader: Optional[MongoDBGraphLoader] = None
+
+def _init_worker(connection_string: str, database_name: str, use_embeddings: bool, embedding_batch_size: int):
+    """Worker process initializer: one MongoDB connection and embedding model per process."""
+    global _worker_loader
+    _worker_loader = MongoDBGraphLoader(
+        connection_string=connection_string,
+        database_name=database_name,
+        use_embeddings=use_embeddings,
+        embedding_batch_size=embedding_batch_size,
+        setup_indexes=False
+    )
+
+def _prepare_video(video_data: Dict[str, Any], reload: bool) -> Optional[Dict[str, Any]]:
+    """Parse and embed one video in a worker process; None if it has no JSON-LD graph."""
+    started = time.perf_counter()
+    json_ld = video_data.get("json_ld")
+    if not json_ld:
+        return None
+    
+    video_id = video_data["video_id"]
+    documents = _worker_loader.build_graph_documents(
+        json_ld, video_id, video_data.get("Video_title", "Unknown Title")
+    )
+    if documents is None:
+        return None
+    
+    # A reloaded video's own nodes are deleted before the write, so they can't donate embeddings
+    embedding_counts = _worker_loader.embed_graph_documents(
+        documents["nodes"], exclude_video=video_id if reload else None
+    )
+    return {"documents": documents, "embedding_counts": embedding_counts, "seconds": time.perf_counter() - started}
+
 def main():
     """Main function to run the script."""
     parser = argparse.ArgumentParser(description="Load JSON-LD data from MongoDB into graph collections with vector search support")
@@ -1000,7 +1571,28 @@ def main():
     parser.add_argument("--video-id", help="Process only a specific video ID")
     parser.add_argument("--skip-embeddings", action="store_true", 
                         help="Skip generating vector embeddings (faster processing)")
+    parser.add_argument("--embedding-batch-size", type=int, default=64,
+                        help="Number of texts per embedding model call (default: 64)")
+    parser.add_argument("--write-batch-size", type=int, default=1000,
+                        help="Number of upserts per bulk_write call (default: 1000)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for parsing/embedding several videos at once (default: 1)")
+    parser.add_argument("--reprocess-mode", choices=["diff", "reload"], default="diff",
+                        help="Videos from an older loader version: write only changes (diff, default) "
+                             "or delete and reload their data (reload)")
     parser.add_argument("--stats", action="store_true", help="Show graph statistics only")
+    parser.add_argument("--update-pagerank", action="store_true",
+                        help="Update global PageRank (warm-started) after loading new videos")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and load videos as their JSON-LD is written (see loader_daemon.py)")
+    parser.add_argument("--watch-mode", choices=["auto", "change-stream", "poll"], default="auto",
+                        help="Change stream, polling, or change stream with polling fallback (default: auto)")
+    parser.add_argument("--debounce", type=float, default=5.0,
+                        help="Seconds a video must go without JSON-LD updates before loading (default: 5)")
+    parser.add_argument("--queue-size", type=int, default=100,
+                        help="Maximum buffered change events before the watcher waits (default: 100)")
+    parser.add_argument("--poll-interval", type=float, default=10.0,
+                        help="Seconds between polls when change streams are unavailable (default: 10)")
     
     args = parser.parse_args()
     
@@ -1008,7 +1600,10 @@ def main():
         # Initialize loader
         loader = MongoDBGraphLoader(
             database_name=args.database,
-            use_embeddings=not args.skip_embeddings
+            use_embeddings=not args.skip_embeddings,
+            embedding_batch_size=args.embedding_batch_size,
+            write_batch_size=args.write_batch_size,
+            reprocess_mode=args.reprocess_mode
         )
         
         if args.stats:
@@ -1019,12 +1614,28 @@ def main():
                 print(f"  {collection}: {count:,} documents")
             return
         
+        if args.watch:
+            from loader_daemon import GraphLoaderDaemon
+            GraphLoaderDaemon(
+                loader,
+                mode=args.watch_mode,
+                debounce=args.debounce,
+                queue_size=args.queue_size,
+                poll_interval=args.poll_interval
+            ).run()
+            return
+        
         # Process videos
-        loader.process_all_videos(
+        load_stats = loader.process_all_videos(
             limit=args.limit,
-            video_id=args.video_id
+            video_id=args.video_id,
+            workers=args.workers
         )
         
+        if args.update_pagerank and load_stats["processed"] > 0:
+            from pagerank_job import PageRankJob
+            PageRankJob(loader.db).run(incremental=True)
+        
         # Show final statistics
         stats = loader.get_stats()
         print(f"\n📊 Final Graph Statistics:")
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Global PageRank Job for the Graph Collections
+
+Computes PageRank over the whole ``edges`` graph (URI objects only) and writes
+``pagerank_score`` / ``pagerank_rank`` back onto ``nodes``, which is what the
+MCP server's hybrid and authority searches filter and rank on.
+
+Edges are streamed into a compact integer-indexed sparse graph, power iteration
+runs in NumPy/scipy (see pagerank_engine.py), and results are written with
+chunked unordered ``bulk_write`` batches.
+
+In incremental mode the iteration warm-starts from the scores already stored on
+the nodes, so after a few new videos are loaded only a handful of iterations
+are needed.
+
+Requirements:
+- pymongo
+- numpy, scipy
+- python-dotenv (optional, for environment variables)
+
+Usage:
+    python pagerank_job.py --database parliamentary_graph [--incremental] [--batch-size N]
+"""
+
+import sys
+import os
+import time
+import argparse
+from typing import Dict, Any, List
+
+try:
+    import numpy as np
+    from pymongo import MongoClient, UpdateOne
+    from pymongo.errors import ConnectionFailure
+    from dotenv import load_dotenv
+except ImportError as e:
+    print(f"Missing required package: {e}")
+    print("Please install required packages:")
+    print("pip install pymongo numpy scipy python-dotenv")
+    sys.exit(1)
+
+from pagerank_engine import compute_pagerank
+from result_cache import bump_graph_version
+
+# Load environment variables
+load_dotenv()
+
+
+class PageRankJob:
+    def __init__(self, db, damping: float = 0.85, tol: float = 1e-8, max_iterations: int = 100,
+                 batch_size: int = 1000):
+        """
+        Initialize the PageRank job.
+
+        Args:
+            db: pymongo database holding the nodes and edges collections
+            damping: PageRank damping factor
+            tol: L1 convergence threshold
+            max_iterations: Maximum number of power iterations
+            batch_size: Number of UpdateOne operations per bulk_write
+        """
+        self.db = db
+        self.nodes = db.nodes
+        self.edges = db.edges
+        self.damping = damping
+        self.tol = tol
+        self.max_iterations = max_iterations
+        self.batch_size = batch_size
+
+    def load_graph(self, incremental: bool = False):
+        """
+        Stream nodes and URI edges into integer-indexed arrays.
+
+        Returns:
+            Tuple of (uris, node_count, sources, targets, previous_scores or None)
+        """
+        uri_to_id: Dict[str, int] = {}
+        uris: List[str] = []
+        previous: List[float] = []
+
+        projection = {"_id": 0, "uri": 1}
+        if incremental:
+            projection["pagerank_score"] = 1
+
+        # Nodes first, so ids [0, node_count) are exactly the documents we write back to
+        for node in self.nodes.find({}, projection).batch_size(self.batch_size * 10):
+            uri = node.get("uri")
+            if uri and uri not in uri_to_id:
+                uri_to_id[uri] = len(uris)
+                uris.append(uri)
+                previous.append(node.get("pagerank_score") or 0.0)
+        node_count = len(uris)
+
+        sources, targets = [], []
+        cursor = self.edges.find(
+            {"object_type": "uri"}, {"_id": 0, "subject": 1, "object": 1}
+        ).batch_size(self.batch_size * 10)
+        for edge in cursor:
+            for uri in (edge["subject"], edge["object"]):
+                if uri not in uri_to_id:
+                    uri_to_id[uri] = len(uris)
+                    uris.append(uri)
+                    previous.append(0.0)
+            sources.append(uri_to_id[edge["subject"]])
+            targets.append(uri_to_id[edge["object"]])
+
+        previous_scores = None
+        if incremental:
+            previous_scores = np.asarray(previous, dtype=np.float64)
+            # Nodes new since the last run start at the uniform share
+            previous_scores[previous_scores == 0] = 1.0 / max(len(uris), 1)
+
+        return (uris, node_count, np.asarray(sources, dtype=np.int64),
+                np.asarray(targets, dtype=np.int64), previous_scores)
+
+    def write_scores(self, uris: List[str], node_count: int, scores: np.ndarray) -> int:
+        """
+        Write pagerank_score and pagerank_rank onto node documents in chunks.
+
+        Returns:
+            Number of node documents modified
+        """
+        node_scores = scores[:node_count]
+        # Rank 1 is the highest score; ties keep a stable order
+        order = np.argsort(-node_scores, kind="stable")
+        ranks = np.empty(node_count, dtype=np.int64)
+        ranks[order] = np.arange(1, node_count + 1)
+
+        modified = 0
+        operations = []
+        for i in range(node_count):
+            operations.append(UpdateOne(
+                {"uri": uris[i]},
+                {"$set": {"pagerank_score": float(node_scores[i]), "pagerank_rank": int(ranks[i])}}
+            ))
+            if len(operations) >= self.batch_size:
+                modified += self.nodes.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            modified += self.nodes.bulk_write(operations, ordered=False).modified_count
+        return modified
+
+    def run(self, incremental: bool = False) -> Dict[str, Any]:
+        """Compute global PageRank and store it on the nodes collection."""
+        print(f"🧮 Computing global PageRank ({'incremental' if incremental else 'full'})...")
+        start = time.time()
+
+        uris, node_count, sources, targets, previous_scores = self.load_graph(incremental)
+        load_time = time.time() - start
+        print(f"  📥 Loaded {len(uris):,} vertices ({node_count:,} nodes), {len(sources):,} edges "
+              f"in {load_time:.1f}s")
+
+        if not uris:
+            print("  ⚠️  No nodes found, nothing to rank")
+            return {"nodes": 0, "edges": 0, "iterations": 0, "converged": True, "modified": 0}
+
+        result = compute_pagerank(
+            sources, targets, len(uris),
+            damping=self.damping,
+            start=previous_scores,
+            max_iterations=self.max_iterations,
+            tol=self.tol
+        )
+        compute_time = time.time() - start - load_time
+        print(f"  🔁 {result.iterations} iterations, residual {result.residual:.2e}, "
+              f"converged: {result.converged} ({compute_time:.1f}s)")
+
+        modified = self.write_scores(uris, node_count, result.scores)
+        if modified:
+            # Authority and hybrid rankings changed, so cached tool results are stale
+            bump_graph_version(self.db)
+        print(f"  ✅ Wrote scores for {node_count:,} nodes ({modified:,} modified) "
+              f"in {time.time() - start:.1f}s total")
+
+        return {
+            "nodes": node_count,
+            "edges": int(len(sources)),
+            "iterations": result.iterations,
+            "residual": result.residual,
+            "converged": result.converged,
+            "modified": modified,
+        }
+
+
+def main():
+    """Main function to run the script."""
+    parser = argparse.ArgumentParser(description="Compute global PageRank for graph nodes")
+    parser.add_argument("--database", default="parliamentary_graph", help="MongoDB database name")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Warm-start from the scores currently stored on nodes")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Operations per bulk_write batch")
+    parser.add_argument("--max-iterations", type=int, default=100, help="Maximum power iterations")
+    parser.add_argument("--tol", type=float, default=1e-8, help="L1 convergence threshold")
+
+    args = parser.parse_args()
+
+    connection_string = os.getenv('MONGODB_CONNECTION_STRING')
+    if not connection_string:
+        print("Configuration error: MONGODB_CONNECTION_STRING environment variable not set")
+        sys.exit(1)
+
+    try:
+        client = MongoClient(connection_string)
+        client.admin.command('ping')
+    except ConnectionFailure as e:
+        print(f"Error: Failed to connect to MongoDB: {e}")
+        sys.exit(1)
+
+    try:
+        job = PageRankJob(
+            client[args.database],
+            tol=args.tol,
+            max_iterations=args.max_iterations,
+            batch_size=args.batch_size
+        )
+        job.run(incremental=args.incremental)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ returning relevant nodes with configurable traversal depth, outputting results a
 Requirements:
 - pymongo
 - python-dotenv (optional, for environment variables)
-- sentence-transformers (optional, for vector search)
+- sentence-transformers, or onnxruntime + tokenizers (optional, for vector search)
 
 Usage:
     python query_graph.py "query string" [--hops N] [--output file.ttl] [--vector-only] [--text-only]
@@ -34,12 +34,9 @@ except ImportError as e:
     print("pip install pymongo python-dotenv rdflib")
     sys.exit(1)
 
-# Optional: Import sentence transformers for vector search
-try:
-    from sentence_transformers import SentenceTransformer
-    VECTOR_SEARCH_AVAILABLE = True
-except ImportError:
-    VECTOR_SEARCH_AVAILABLE = False
+# Optional: vector search via the configured embedding backend
+from embedding_backend import EMBEDDING_BACKEND, backend_available, load_embedding_backend
+VECTOR_SEARCH_AVAILABLE = backend_available()
 
 # Load environment variables
 load_dotenv()
@@ -78,8 +75,8 @@ class GraphQuerier:
         self.embedding_model = None
         if VECTOR_SEARCH_AVAILABLE:
             try:
-                print("🔄 Loading embedding model for vector search...")
-                self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+                print(f"🔄 Loading embedding model for vector search ({EMBEDDING_BACKEND})...")
+                self.embedding_model = load_embedding_backend()
                 print("✅ Vector search enabled")
             except Exception as e:
                 print(f"⚠️  Vector search disabled: {e}")
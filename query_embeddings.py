@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Query Embedding Cache and Micro-Batching Encoder
+------------------------------------------------
+
+Shared by every ``EnhancedGraphQuerier`` search path so a query string is
+encoded at most once while it stays in the cache:
+
+- ``MicroBatchEncoder`` merges encode requests arriving within a few
+  milliseconds of each other into a single ``model.encode([...])`` call.
+- ``QueryEmbeddingCache`` is a bounded LRU with TTL keyed on normalized
+  query text, with hit/miss counters for the health endpoints.
+"""
+
+import time
+import queue
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query_text(text: str) -> str:
+    """Normalize query text for cache keys (MiniLM is uncased, so case is irrelevant)."""
+    return " ".join(text.lower().split())
+
+
+class MicroBatchEncoder:
+    """Collects concurrent encode requests and runs them as one batch."""
+
+    def __init__(self, model, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """
+        Initialize the micro-batching encoder.
+
+        Args:
+            model: Object exposing ``encode(List[str]) -> array`` (e.g. SentenceTransformer)
+            max_batch_size: Maximum number of texts per ``encode`` call
+            max_wait_ms: How long the first request in a batch waits for company
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches = 0
+        self.texts_encoded = 0
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue ``text`` for encoding and return a future for its embedding."""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str) -> List[float]:
+        """Encode a single text, blocking until its batch completes."""
+        return self.submit(text).result()
+
+    def _collect_batch(self) -> List[tuple]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+
+            # Identical texts in the same window are encoded once
+            unique_texts = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                vectors = self.model.encode(unique_texts)
+                by_text = {text: vectors[i].tolist() for i, text in enumerate(unique_texts)}
+                for text, future in batch:
+                    future.set_result(by_text[text])
+                self.batches += 1
+                self.texts_encoded += len(unique_texts)
+            except Exception as e:
+                logger.error(f"❌ Batch encoding failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "texts_encoded": self.texts_encoded,
+            "avg_batch_size": round(self.texts_encoded / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+class QueryEmbeddingCache:
+    """Bounded LRU/TTL cache of query embeddings."""
+
+    def __init__(self, encode: Callable[[str], List[float]], maxsize: int = 1024,
+                 ttl: Optional[float] = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            encode: Function turning a (normalized) query string into an embedding
+            maxsize: Maximum number of cached embeddings
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self.encode = encode
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> List[float]:
+        """Return the embedding for ``text``, encoding it on a miss."""
+        key = normalize_query_text(text)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or now - entry[1] < self.ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Encode outside the lock so concurrent misses can share a batch
+        embedding = self.encode(key)
+
+        with self._lock:
+            self._entries[key] = (embedding, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return embedding
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Request Rate Limiting
+---------------------
+
+A token bucket shared by every Gemini call of a process, so concurrent
+extraction batches (and videos) stay inside the API quota instead of
+tripping 429s and backing off.  Usable from threads (``acquire``) and from
+asyncio code (``acquire_async``) at the same time.
+
+Also provides the jittered exponential backoff used when a call is
+retried anyway.
+"""
+
+import time
+import random
+import asyncio
+import threading
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per ``per`` seconds, with bursts of up to ``capacity``."""
+
+    def __init__(self, rate: float, per: float = 60.0, capacity: float = None):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per ``per`` seconds (e.g. requests per minute)
+            per: Refill period in seconds
+            capacity: Maximum burst size (default: one second's worth, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.fill_rate = rate / per
+        self.capacity = capacity if capacity is not None else max(1.0, self.fill_rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take ``tokens`` (possibly going into debt) and return how long the caller must wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.fill_rate)
+
+    def acquire(self, tokens: float = 1.0):
+        """Block the calling thread until ``tokens`` are available."""
+        wait = self._reserve(tokens)
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """Wait (without blocking the event loop) until ``tokens`` are available."""
+        wait = self._reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
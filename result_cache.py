@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Result Cache
+---------------------
+
+Caches the Turtle text returned by the MCP search/provenance tools so that
+repeated agent calls skip embedding, vector search, traversal, subgraph
+fetch and serialization entirely.
+
+- Keys are the tool name plus its clamped arguments (query text normalized
+  like the embedding cache), hashed to a fixed-size digest.
+- Every entry is tagged with the graph version it was computed against.
+  The version is a counter in the ``graph_meta`` collection that the graph
+  loader bumps whenever new data lands; a changed version empties the
+  in-memory tier and makes on-disk entries from older versions misses.
+- A bounded in-memory LRU is always used.  An optional SQLite file (stdlib
+  ``sqlite3``) sits behind it so results survive restarts and can be shared
+  by several worker processes on the same host.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+GRAPH_META_COLLECTION = "graph_meta"
+GRAPH_VERSION_ID = "graph_version"
+
+
+def read_graph_version(db) -> int:
+    """Return the current graph version counter (0 if nothing was loaded yet)."""
+    doc = db[GRAPH_META_COLLECTION].find_one({"_id": GRAPH_VERSION_ID}, {"version": 1})
+    return int(doc.get("version", 0)) if doc else 0
+
+
+def bump_graph_version(db) -> int:
+    """Atomically increment the graph version counter and return the new value."""
+    db[GRAPH_META_COLLECTION].update_one(
+        {"_id": GRAPH_VERSION_ID},
+        {"$inc": {"version": 1}, "$set": {"updated_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    return read_graph_version(db)
+
+
+def make_cache_key(tool: str, arguments: Dict[str, Any]) -> str:
+    """Stable digest of a tool name and its (already clamped) arguments."""
+    payload = json.dumps([tool, arguments], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Two-tier (memory LRU + optional SQLite) cache of tool results, scoped to a graph version."""
+
+    def __init__(self, version_source, maxsize: int = 512, ttl: Optional[float] = None,
+                 disk_path: Optional[str] = None, version_check_interval: float = 5.0):
+        """
+        Initialize the result cache.
+
+        Args:
+            version_source: Zero-argument callable returning the current graph version
+            maxsize: Maximum number of results kept in memory
+            ttl: Seconds an entry stays valid, or None to rely on graph versions only
+            disk_path: Path of the SQLite file for the on-disk tier, or None to disable it
+            version_check_interval: Seconds between graph version reads from MongoDB
+        """
+        self.version_source = version_source
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self.version_check_interval = version_check_interval
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._last_version_check = 0.0
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_lock = threading.Lock()
+
+        if disk_path:
+            self._open_disk(disk_path)
+
+    def _open_disk(self, path: str):
+        try:
+            self._disk = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, version INTEGER NOT NULL, created REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            logger.info(f"💾 Result cache disk tier at {path}")
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️  Result cache disk tier unavailable ({path}): {e}")
+            self._disk = None
+
+    # ------------------------------------------------------------------ #
+    #                           GRAPH VERSION                            #
+    # ------------------------------------------------------------------ #
+    def current_version(self) -> Optional[int]:
+        """Graph version, re-read at most every ``version_check_interval`` seconds."""
+        now = time.monotonic()
+        if self._version is not None and now - self._last_version_check < self.version_check_interval:
+            return self._version
+
+        try:
+            version = int(self.version_source())
+        except Exception as e:
+            logger.warning(f"⚠️  Graph version check failed: {e}")
+            # Keep serving the last known version rather than disabling the cache
+            return self._version
+
+        with self._lock:
+            self._last_version_check = now
+            if self._version is not None and version != self._version:
+                logger.info(f"🔄 Graph version {self._version} -> {version}, invalidating result cache")
+                self._entries.clear()
+                self.invalidations += 1
+                self._purge_disk(version)
+            self._version = version
+        return version
+
+    def _purge_disk(self, version: int):
+        self._disk_execute("DELETE FROM results WHERE version != ?", (version,))
+
+    def _disk_execute(self, sql: str, params: tuple = (), fetch: bool = False):
+        """Run one statement on the disk tier; failures only cost a cache miss."""
+        if self._disk is None:
+            return None
+        try:
+            with self._disk_lock:
+                cursor = self._disk.execute(sql, params)
+                return cursor.fetchone() if fetch else None
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️  Result cache disk operation failed: {e}")
+            return None
+
+    # ------------------------------------------------------------------ #
+    #                              LOOKUPS                               #
+    # ------------------------------------------------------------------ #
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created >= self.ttl
+
+    def get(self, tool: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Return the cached result for this call, or None on a miss."""
+        version = self.current_version()
+        if version is None:
+            self.misses += 1
+            return None
+        key = make_cache_key(tool, arguments)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version and not self._expired(entry[1]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+
+        row = self._disk_get(key, version)
+        if row is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._store(key, version, row[0], row[1])
+            return row[1]
+
+        self.misses += 1
+        return None
+
+    def _disk_get(self, key: str, version: int) -> Optional[tuple]:
+        """(created, value) from the disk tier, or None."""
+        row = self._disk_execute(
+            "SELECT created, value FROM results WHERE key = ? AND version = ?", (key, version), fetch=True
+        )
+        if row is None or self._expired(row[0]):
+            return None
+        return row
+
+    def put(self, tool: str, arguments: Dict[str, Any], value: str, version: Optional[int] = None):
+        """
+        Store a result.
+
+        Args:
+            tool: Tool name
+            arguments: Clamped tool arguments
+            value: Result text
+            version: Graph version read before the result was computed (defaults to the current one),
+                so a result racing a graph update is never filed under the newer version
+        """
+        if version is None:
+            version = self.current_version()
+        if version is None or version != self._version:
+            return
+        key = make_cache_key(tool, arguments)
+        created = time.time()
+
+        with self._lock:
+            self._store(key, version, created, value)
+
+        self._disk_execute(
+            "INSERT OR REPLACE INTO results (key, version, created, value) VALUES (?, ?, ?, ?)",
+            (key, version, created, value)
+        )
+
+    def _store(self, key: str, version: int, created: float, value: str):
+        self._entries[key] = (version, created, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self._disk_execute("DELETE FROM results")
+
+    def close(self):
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.close()
+                self._disk = None
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.disk_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "graph_version": self._version,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.disk_hits) / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            "disk_tier": self.disk_path if self._disk is not None else None,
+        }
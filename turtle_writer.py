@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Streaming Turtle Writer
+-----------------------
+
+Lightweight replacement for building an rdflib ``Graph`` just to call
+``serialize(format="turtle")``.  Triples are collected per subject and
+emitted as text chunks, one subject block at a time.
+
+The output reproduces rdflib 7's Turtle serializer for the flat graphs the
+MCP server produces (URI subjects, URI or literal objects, no blank nodes):
+
+- only prefixes actually used are declared, sorted by prefix;
+- predicates in unbound namespaces get generated ``ns1``, ``ns2``... prefixes;
+- subjects are ordered by how often they are referenced, then by URI;
+- ``rdf:type`` comes first, then ``rdfs:label``, then other predicates sorted;
+- literals use rdflib's quoting, with bare integers.
+
+The prefix maps below are the effective bindings of the graphs previously
+built in main.py (rdflib's default namespaces plus the explicit ``bind``
+calls), so existing clients see identical prefixes.
+"""
+
+import unicodedata
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDFS_NS = "http://www.w3.org/2000/01/rdf-schema#"
+XSD_NS = "http://www.w3.org/2001/XMLSchema#"
+
+RDF_TYPE = RDF_NS + "type"
+RDF_NIL = RDF_NS + "nil"
+RDFS_LABEL = RDFS_NS + "label"
+RDFS_CLASS = RDFS_NS + "Class"
+XSD_INTEGER = XSD_NS + "integer"
+XSD_STRING = XSD_NS + "string"
+
+# Namespaces bound by default on every rdflib 7 Graph
+RDFLIB_DEFAULT_PREFIXES = {
+    "brick": "https://brickschema.org/schema/Brick#",
+    "csvw": "http://www.w3.org/ns/csvw#",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcam": "http://purl.org/dc/dcam/",
+    "dcat": "http://www.w3.org/ns/dcat#",
+    "dcmitype": "http://purl.org/dc/dcmitype/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "doap": "http://usefulinc.com/ns/doap#",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "geo": "http://www.opengis.net/ont/geosparql#",
+    "odrl": "http://www.w3.org/ns/odrl/2/",
+    "org": "http://www.w3.org/ns/org#",
+    "owl": "http://www.w3.org/2002/07/owl#",
+    "prof": "http://www.w3.org/ns/dx/prof/",
+    "prov": "http://www.w3.org/ns/prov#",
+    "qb": "http://purl.org/linked-data/cube#",
+    "rdf": RDF_NS,
+    "rdfs": RDFS_NS,
+    "schema": "https://schema.org/",
+    "sh": "http://www.w3.org/ns/shacl#",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    "sosa": "http://www.w3.org/ns/sosa/",
+    "ssn": "http://www.w3.org/ns/ssn/",
+    "time": "http://www.w3.org/2006/time#",
+    "vann": "http://purl.org/vocab/vann/",
+    "void": "http://rdfs.org/ns/void#",
+    "wgs": "https://www.w3.org/2003/01/geo/wgs84_pos#",
+    "xml": "http://www.w3.org/XML/1998/namespace",
+    "xsd": XSD_NS,
+}
+
+ONTOLOGY_NS = "http://example.com/Indian-parliament-ontology#"
+SESSION_NS = "http://example.com/Indian-parliament-session/"
+PROV_NS = "http://www.w3.org/ns/prov#"
+SCHEMA_NS = "http://schema.org/"
+
+# bbp and lok share a namespace; the later lok binding wins
+SUBGRAPH_PREFIXES = dict(RDFLIB_DEFAULT_PREFIXES, lok=ONTOLOGY_NS, sess=SESSION_NS)
+
+# "schema" is already taken by https://schema.org/, so http://schema.org/ becomes schema1
+PROVENANCE_PREFIXES = dict(RDFLIB_DEFAULT_PREFIXES, lok=ONTOLOGY_NS, prov=PROV_NS, schema1=SCHEMA_NS)
+
+_INVALID_URI_CHARS = '<>" {}|\\^`'
+_NAME_START_CATEGORIES = ["Ll", "Lu", "Lo", "Lt", "Nl"]
+_SPLIT_START_CATEGORIES = _NAME_START_CATEGORIES + ["Nd"]
+_NAME_CATEGORIES = _NAME_START_CATEGORIES + ["Mc", "Me", "Mn", "Lm", "Nd"]
+_ALLOWED_NAME_CHARS = ["\u00B7", "\u0387", "-", ".", "_", "%", "(", ")"]
+_XML_NS = "http://www.w3.org/XML/1998/namespace"
+_HEX = "0123456789abcdefABCDEF"
+
+
+class Literal(NamedTuple):
+    """A plain (datatype None) or typed literal object."""
+    lexical: str
+    datatype: Optional[str] = None
+
+
+def integer_literal(value: int) -> Literal:
+    return Literal(str(int(value)), XSD_INTEGER)
+
+
+Term = Union[str, Literal]
+
+
+def _is_valid_uri(uri: str) -> bool:
+    return not any(c in uri for c in _INVALID_URI_CHARS)
+
+
+def _split_uri(uri: str) -> Tuple[str, str]:
+    """Split an IRI into namespace and local name exactly like rdflib.namespace.split_uri."""
+    if uri.startswith(_XML_NS):
+        return _XML_NS, uri.split(_XML_NS)[1]
+    length = len(uri)
+    for i in range(0, length):
+        c = uri[-i - 1]
+        if unicodedata.category(c) not in _NAME_CATEGORIES:
+            if c in _ALLOWED_NAME_CHARS:
+                continue
+            for j in range(-1 - i, length):
+                if unicodedata.category(uri[j]) in _SPLIT_START_CATEGORIES or uri[j] == "_":
+                    ns = uri[:j]
+                    if not ns:
+                        break
+                    return ns, uri[j:]
+            break
+    raise ValueError(f"Can't split '{uri}'")
+
+
+def _escape_local(local: str) -> str:
+    local = local.replace("(", "\\(").replace(")", "\\)")
+    out = []
+    for i, c in enumerate(local):
+        if c == "%" and not (len(local) > i + 2 and local[i + 1] in _HEX and local[i + 2] in _HEX):
+            out.append("\\%")
+        else:
+            out.append(c)
+    return "".join(out)
+
+
+def _quote(text: str) -> str:
+    """Quote a string literal the way rdflib's Literal._quote_encode does."""
+    if "\n" in text:
+        encoded = text.replace("\\", "\\\\")
+        if '"""' in text:
+            encoded = encoded.replace('"""', '\\"\\"\\"')
+        if encoded[-1] == '"' and encoded[-2] != "\\":
+            encoded = encoded[:-1] + "\\" + '"'
+        return '"""%s"""' % encoded.replace("\r", "\\r")
+    return '"%s"' % text.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "\\r")
+
+
+def _object_sort_key(term: Term):
+    # rdflib orders URIRefs before Literals; literals by datatype, then value
+    if isinstance(term, Literal):
+        if term.datatype == XSD_INTEGER:
+            return (1, XSD_INTEGER, int(term.lexical))
+        return (1, term.datatype or XSD_STRING, term.lexical)
+    return (0, "", term)
+
+
+class TurtleWriter:
+    """Collects triples grouped by subject and writes them as Turtle chunks."""
+
+    def __init__(self, prefixes: Dict[str, str]):
+        """
+        Initialize the writer.
+
+        Args:
+            prefixes: Mapping of prefix -> namespace IRI available for compaction
+        """
+        self.namespace_prefixes = {ns: prefix for prefix, ns in prefixes.items()}
+        self.triples: Dict[str, Dict[str, Dict[Term, None]]] = {}
+        self._pnames: Dict[str, Optional[str]] = {}
+        self._parts: Dict[str, Optional[Tuple[str, str]]] = {}
+
+    def add(self, subject: str, predicate: str, obj: Term):
+        """Add a triple; duplicates are ignored like in an rdflib Graph."""
+        self.triples.setdefault(subject, {}).setdefault(predicate, {})[obj] = None
+
+    def __len__(self) -> int:
+        return sum(len(objs) for preds in self.triples.values() for objs in preds.values())
+
+    # ------------------------------------------------------------------ #
+    #                         PREFIXED NAME HANDLING                      #
+    # ------------------------------------------------------------------ #
+    def _qname_parts(self, uri: str) -> Optional[Tuple[str, str]]:
+        """(namespace, local) for a URI that can be compacted, else None."""
+        if uri not in self._parts:
+            parts = None
+            if _is_valid_uri(uri):
+                try:
+                    namespace, local = _split_uri(uri)
+                    parts = (namespace, local)
+                except ValueError:
+                    parts = None
+            self._parts[uri] = parts
+        return self._parts[uri]
+
+    def _generate_prefix(self, uri: str):
+        """Bind an ``nsN`` prefix for a predicate namespace that has none (rdflib behaviour)."""
+        parts = self._qname_parts(uri)
+        if parts is None or parts[0] in self.namespace_prefixes:
+            return
+        taken = set(self.namespace_prefixes.values())
+        num = 1
+        while f"ns{num}" in taken:
+            num += 1
+        self.namespace_prefixes[parts[0]] = f"ns{num}"
+
+    def _pname(self, uri: str) -> Optional[Tuple[str, str]]:
+        """(prefix, escaped local) for a URI, or None when it must be written as <IRI>."""
+        if uri in self._pnames:
+            return self._pnames[uri]
+
+        result = None
+        parts = self._qname_parts(uri)
+        if parts is not None and parts[0] in self.namespace_prefixes:
+            prefix, local = self.namespace_prefixes[parts[0]], parts[1]
+        elif uri in self.namespace_prefixes:
+            # The IRI is itself a bound namespace
+            prefix, local = self.namespace_prefixes[uri], ""
+        else:
+            prefix = None
+
+        if prefix is not None:
+            local = _escape_local(local)
+            if not local.endswith("."):
+                result = (prefix, local)
+
+        self._pnames[uri] = result
+        return result
+
+    def _uri_label(self, uri: str) -> str:
+        if uri == RDF_NIL:
+            return "()"
+        pname = self._pname(uri)
+        if pname is not None:
+            return f"{pname[0]}:{pname[1]}"
+        if not _is_valid_uri(uri):
+            raise ValueError(
+                f'"{uri}" does not look like a valid URI, I cannot serialize this as N3/Turtle. '
+                f'Perhaps you wanted to urlencode it?'
+            )
+        return f"<{uri}>"
+
+    def _object_label(self, term: Term) -> str:
+        if isinstance(term, Literal):
+            if term.datatype == XSD_INTEGER:
+                return term.lexical
+            if term.datatype is None:
+                return _quote(term.lexical)
+            pname = self._pname(term.datatype)
+            datatype = f"{pname[0]}:{pname[1]}" if pname else f"<{term.datatype}>"
+            return f"{_quote(term.lexical)}^^{datatype}"
+        return self._uri_label(term)
+
+    # ------------------------------------------------------------------ #
+    #                              WRITING                                #
+    # ------------------------------------------------------------------ #
+    def _prepare(self) -> Tuple[List[str], List[str]]:
+        """Resolve prefixes and subject order; returns (prefix lines, ordered subjects)."""
+        references: Dict[str, int] = {}
+
+        for predicates in self.triples.values():
+            for predicate, objects in predicates.items():
+                if predicate != RDF_TYPE:
+                    self._generate_prefix(predicate)
+                for obj in objects:
+                    if not isinstance(obj, Literal):
+                        references[obj] = references.get(obj, 0) + 1
+
+        used = set()
+
+        def mark(uri: str):
+            pname = self._pname(uri)
+            if pname is not None:
+                used.add(pname[0])
+
+        for subject, predicates in self.triples.items():
+            mark(subject)
+            for predicate, objects in predicates.items():
+                if predicate != RDF_TYPE:
+                    mark(predicate)
+                for obj in objects:
+                    if isinstance(obj, Literal):
+                        if obj.datatype:
+                            mark(obj.datatype)
+                    else:
+                        mark(obj)
+
+        prefix_to_namespace = {prefix: ns for ns, prefix in self.namespace_prefixes.items()}
+        prefix_lines = [f"@prefix {prefix}: <{prefix_to_namespace[prefix]}> .\n" for prefix in sorted(used)]
+
+        classes = sorted(s for s, preds in self.triples.items() if RDFS_CLASS in preds.get(RDF_TYPE, {}))
+        class_set = set(classes)
+        others = sorted(
+            (references.get(s, 0), s) for s in self.triples if s not in class_set
+        )
+        return prefix_lines, classes + [s for _, s in others]
+
+    def _ordered_predicates(self, subject: str) -> List[str]:
+        predicates = self.triples[subject]
+        ordered = [p for p in (RDF_TYPE, RDFS_LABEL) if p in predicates]
+        return ordered + sorted(p for p in predicates if p not in (RDF_TYPE, RDFS_LABEL))
+
+    def _validate(self, subjects: List[str]):
+        """Raise for the first unserializable IRI in document order, before anything is emitted."""
+        for subject in subjects:
+            self._uri_label(subject)
+            for predicate in self._ordered_predicates(subject):
+                if predicate != RDF_TYPE:
+                    self._uri_label(predicate)
+                for obj in self.triples[subject][predicate]:
+                    if not isinstance(obj, Literal):
+                        self._uri_label(obj)
+
+    def _subject_block(self, subject: str) -> str:
+        predicates = self.triples[subject]
+        ordered = self._ordered_predicates(subject)
+
+        parts = ["\n", self._uri_label(subject)]
+        for i, predicate in enumerate(ordered):
+            if i > 0:
+                parts.append(" ;\n    ")
+            else:
+                parts.append(" ")
+            parts.append("a" if predicate == RDF_TYPE else self._uri_label(predicate))
+
+            objects = sorted(predicates[predicate], key=_object_sort_key)
+            parts.append(" " + self._object_label(objects[0]))
+            for obj in objects[1:]:
+                parts.append(",\n        " + self._object_label(obj))
+        parts.append(" .\n")
+        return "".join(parts)
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the document as chunks: the prefix block, then one chunk per subject."""
+        prefix_lines, subjects = self._prepare()
+        self._validate(subjects)
+        if prefix_lines:
+            yield "".join(prefix_lines)
+        for subject in subjects:
+            yield self._subject_block(subject)
+        yield "\n"
+
+    def serialize(self) -> str:
+        return "".join(self.iter_chunks())
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Local Vector Index for Graph Nodes
+----------------------------------
+
+In-process approximate nearest neighbour engine over ``nodes.embedding``.
+
+All node embeddings (384-d MiniLM) are loaded once into a contiguous,
+L2-normalised float32 matrix.  When ``hnswlib`` is installed an HNSW index
+is built on top of it, otherwise queries fall back to an exact matrix
+product.  Both the matrix and the HNSW graph are persisted to disk so a
+restart only reloads files instead of re-streaming the collection.
+
+Scores are reported on the same scale as Atlas ``vectorSearchScore`` for
+cosine similarity, i.e. ``(1 + cosine) / 2``, so callers can mix both
+sources without re-tuning thresholds.
+
+Usage:
+    python vector_index.py [--database parliamentary_graph] [--index-dir .vector_index] [--no-hnsw]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from result_cache import read_graph_version
+
+# Optional: HNSW graph for sub-millisecond lookups on large collections
+try:
+    import hnswlib
+    HNSW_AVAILABLE = True
+except ImportError:
+    HNSW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = ".vector_index"
+EMBEDDING_DIM = 384
+
+
+class LocalVectorIndex:
+    """Vector index over the ``nodes`` collection held in process memory."""
+
+    def __init__(self, nodes_collection, index_dir: str = DEFAULT_INDEX_DIR,
+                 dim: int = EMBEDDING_DIM, use_hnsw: bool = True,
+                 staleness_check_interval: float = 60.0, max_age: Optional[float] = None):
+        """
+        Initialize the local vector index.
+
+        Args:
+            nodes_collection: pymongo collection holding graph nodes with ``embedding``
+            index_dir: Directory where the matrix and HNSW graph are persisted
+            dim: Embedding dimensionality
+            use_hnsw: Build an HNSW graph when hnswlib is installed
+            staleness_check_interval: Seconds between staleness probes against MongoDB
+            max_age: Optional maximum index age in seconds before it is considered stale
+        """
+        self.nodes = nodes_collection
+        self.index_dir = index_dir
+        self.dim = dim
+        self.use_hnsw = use_hnsw and HNSW_AVAILABLE
+        self.staleness_check_interval = staleness_check_interval
+        self.max_age = max_age
+
+        self.uris: List[str] = []
+        self.uri_to_row: Dict[str, int] = {}
+        self.matrix: Optional[np.ndarray] = None
+        self.pagerank_scores: Optional[np.ndarray] = None
+        self.pagerank_ranks: Optional[np.ndarray] = None
+        self.hnsw = None
+        self.meta: Dict = {}
+
+        self._lock = threading.RLock()
+        self._refreshing = False
+        self._last_check = 0.0
+        self._stale = True
+
+    # ------------------------------------------------------------------ #
+    #                           BUILD / PERSIST                           #
+    # ------------------------------------------------------------------ #
+    def _paths(self) -> Dict[str, str]:
+        return {
+            "matrix": os.path.join(self.index_dir, "embeddings.npy"),
+            "pagerank": os.path.join(self.index_dir, "pagerank.npz"),
+            "uris": os.path.join(self.index_dir, "uris.json"),
+            "meta": os.path.join(self.index_dir, "meta.json"),
+            "hnsw": os.path.join(self.index_dir, "hnsw.bin"),
+        }
+
+    def _collection_fingerprint(self) -> Dict:
+        """
+        Cheap description of the collection state used for staleness checks.
+
+        The node count alone misses in-place changes (re-embedded nodes, new
+        PageRank scores), so the ``graph_meta`` version counter bumped by the
+        graph loader and the PageRank job is part of it too.
+        """
+        return {
+            "node_count": self.nodes.estimated_document_count(),
+            "graph_version": read_graph_version(self.nodes.database),
+        }
+
+    def build(self, batch_size: int = 5000) -> int:
+        """
+        Stream every node embedding from MongoDB into a fresh index.
+
+        Args:
+            batch_size: Cursor batch size used while streaming
+
+        Returns:
+            Number of vectors indexed
+        """
+        start = time.time()
+        fingerprint = self._collection_fingerprint()
+
+        cursor = self.nodes.find(
+            {"embedding": {"$exists": True}},
+            {"_id": 0, "uri": 1, "embedding": 1, "pagerank_score": 1, "pagerank_rank": 1},
+        ).batch_size(batch_size)
+
+        uris, vectors, scores, ranks = [], [], [], []
+        for doc in cursor:
+            embedding = doc.get("embedding")
+            if not doc.get("uri") or not embedding or len(embedding) != self.dim:
+                continue
+            uris.append(doc["uri"])
+            vectors.append(embedding)
+            scores.append(doc.get("pagerank_score") or 0.0)
+            ranks.append(doc.get("pagerank_rank") or np.iinfo(np.int64).max)
+
+        matrix = np.ascontiguousarray(np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+
+        hnsw = None
+        if self.use_hnsw and len(uris) > 0:
+            hnsw = hnswlib.Index(space="ip", dim=self.dim)
+            hnsw.init_index(max_elements=len(uris), ef_construction=200, M=16)
+            hnsw.add_items(matrix, np.arange(len(uris)))
+            hnsw.set_ef(100)
+
+        meta = dict(fingerprint)
+        meta.update({
+            "vector_count": len(uris),
+            "dim": self.dim,
+            "built_at": time.time(),
+            "hnsw": hnsw is not None,
+        })
+
+        with self._lock:
+            self.uris = uris
+            self.uri_to_row = {uri: i for i, uri in enumerate(uris)}
+            self.matrix = matrix
+            self.pagerank_scores = np.asarray(scores, dtype=np.float64)
+            self.pagerank_ranks = np.asarray(ranks, dtype=np.int64)
+            self.hnsw = hnsw
+            self.meta = meta
+            self._stale = False
+            self._last_check = time.time()
+
+        logger.info(f"🧭 Local vector index built: {len(uris)} vectors in {time.time() - start:.2f}s "
+                    f"({'HNSW' if hnsw is not None else 'exact'})")
+        return len(uris)
+
+    def save(self):
+        """Persist the current index to ``index_dir``."""
+        with self._lock:
+            if self.matrix is None:
+                return
+            os.makedirs(self.index_dir, exist_ok=True)
+            paths = self._paths()
+            np.save(paths["matrix"], self.matrix)
+            np.savez(paths["pagerank"], scores=self.pagerank_scores, ranks=self.pagerank_ranks)
+            with open(paths["uris"], "w", encoding="utf-8") as f:
+                json.dump(self.uris, f)
+            if self.hnsw is not None:
+                self.hnsw.save_index(paths["hnsw"])
+            with open(paths["meta"], "w", encoding="utf-8") as f:
+                json.dump(self.meta, f)
+        logger.info(f"💾 Local vector index saved to {self.index_dir}")
+
+    def load(self) -> bool:
+        """
+        Load a previously persisted index.
+
+        Returns:
+            True if an index was loaded from disk
+        """
+        paths = self._paths()
+        if not all(os.path.exists(paths[key]) for key in ("matrix", "pagerank", "uris", "meta")):
+            return False
+
+        try:
+            with open(paths["meta"], "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("dim") != self.dim:
+                logger.warning("⚠️  Persisted vector index has a different dimensionality, ignoring it")
+                return False
+
+            matrix = np.load(paths["matrix"])
+            pagerank = np.load(paths["pagerank"])
+            with open(paths["uris"], "r", encoding="utf-8") as f:
+                uris = json.load(f)
+
+            hnsw = None
+            if self.use_hnsw and meta.get("hnsw") and os.path.exists(paths["hnsw"]):
+                hnsw = hnswlib.Index(space="ip", dim=self.dim)
+                hnsw.load_index(paths["hnsw"], max_elements=len(uris))
+                hnsw.set_ef(100)
+
+            with self._lock:
+                self.uris = uris
+                self.uri_to_row = {uri: i for i, uri in enumerate(uris)}
+                self.matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+                self.pagerank_scores = np.asarray(pagerank["scores"], dtype=np.float64)
+                self.pagerank_ranks = np.asarray(pagerank["ranks"], dtype=np.int64)
+                self.hnsw = hnsw
+                self.meta = meta
+                self._last_check = 0.0
+
+            logger.info(f"📂 Local vector index loaded: {len(uris)} vectors from {self.index_dir}")
+            return True
+
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to load persisted vector index: {e}")
+            return False
+
+    def load_or_build(self) -> int:
+        """Load the persisted index, rebuilding it if missing or stale."""
+        if not self.load() or self.is_stale(force=True):
+            self.build()
+            self.save()
+        return len(self.uris)
+
+    # ------------------------------------------------------------------ #
+    #                              STALENESS                              #
+    # ------------------------------------------------------------------ #
+    def is_stale(self, force: bool = False) -> bool:
+        """
+        Check whether the index no longer reflects the ``nodes`` collection.
+
+        The probe only runs every ``staleness_check_interval`` seconds unless forced.
+        """
+        if self.matrix is None:
+            return True
+
+        now = time.time()
+        if not force and now - self._last_check < self.staleness_check_interval:
+            return self._stale
+
+        stale = False
+        if self.max_age is not None and now - self.meta.get("built_at", 0) > self.max_age:
+            stale = True
+        else:
+            try:
+                fingerprint = self._collection_fingerprint()
+                stale = any(self.meta.get(key) != value for key, value in fingerprint.items())
+            except Exception as e:
+                logger.warning(f"⚠️  Vector index staleness check failed: {e}")
+
+        self._stale = stale
+        self._last_check = now
+        return stale
+
+    def refresh_in_background(self):
+        """Rebuild and persist the index on a daemon thread (no-op if already running)."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def _run():
+            try:
+                self.build()
+                self.save()
+            except Exception as e:
+                logger.error(f"❌ Background vector index refresh failed: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=_run, name="vector-index-refresh", daemon=True).start()
+
+    # ------------------------------------------------------------------ #
+    #                                QUERY                                #
+    # ------------------------------------------------------------------ #
+    def search(self, query_vector, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the nearest nodes to a query embedding.
+
+        Args:
+            query_vector: Query embedding (list or array of ``dim`` floats)
+            k: Number of neighbours to return
+
+        Returns:
+            List of (uri, score) tuples sorted by descending score, where score is
+            ``(1 + cosine) / 2`` to match Atlas ``vectorSearchScore``
+        """
+        with self._lock:
+            matrix, uris, hnsw = self.matrix, self.uris, self.hnsw
+
+        if matrix is None or not uris or k <= 0:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        query = query / norm
+        k = min(k, len(uris))
+
+        if hnsw is not None:
+            labels, distances = hnsw.knn_query(query, k=k)
+            rows = labels[0]
+            # hnswlib "ip" space returns 1 - dot product
+            cosines = 1.0 - distances[0]
+        else:
+            similarities = matrix @ query
+            if k < len(uris):
+                rows = np.argpartition(-similarities, k - 1)[:k]
+                rows = rows[np.argsort(-similarities[rows])]
+            else:
+                rows = np.argsort(-similarities)
+            cosines = similarities[rows]
+
+        return [(uris[int(row)], float((1.0 + cos) / 2.0)) for row, cos in zip(rows, cosines)]
+
+    def pagerank_score(self, uri: str) -> Optional[float]:
+        """PageRank score recorded for ``uri`` when the index was built."""
+        row = self.uri_to_row.get(uri)
+        return None if row is None else float(self.pagerank_scores[row])
+
+    def pagerank_rank(self, uri: str) -> Optional[int]:
+        """PageRank rank recorded for ``uri`` (None if the node is unranked or unknown)."""
+        row = self.uri_to_row.get(uri)
+        if row is None or self.pagerank_ranks[row] == np.iinfo(np.int64).max:
+            return None
+        return int(self.pagerank_ranks[row])
+
+    def __len__(self) -> int:
+        return len(self.uris)
+
+
+def main():
+    """Build and persist the local vector index from the command line."""
+    import argparse
+
+    try:
+        from pymongo import MongoClient
+        from dotenv import load_dotenv
+    except ImportError as e:
+        print(f"Missing required package: {e}")
+        print("pip install pymongo python-dotenv")
+        sys.exit(1)
+
+    parser = argparse.ArgumentParser(description="Build the local vector index for graph nodes")
+    parser.add_argument("--database", default="parliamentary_graph", help="MongoDB database name")
+    parser.add_argument("--index-dir", default=os.getenv("VECTOR_INDEX_DIR", DEFAULT_INDEX_DIR),
+                        help="Directory to persist the index in")
+    parser.add_argument("--no-hnsw", action="store_true", help="Skip the HNSW graph (exact search only)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+    if not connection_string:
+        print("MONGODB_CONNECTION_STRING environment variable not set")
+        sys.exit(1)
+
+    client = MongoClient(connection_string)
+    try:
+        index = LocalVectorIndex(client[args.database].nodes, index_dir=args.index_dir,
+                                 use_hnsw=not args.no_hnsw)
+        count = index.build()
+        index.save()
+        print(f"✅ Indexed {count} node embeddings into {args.index_dir}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()